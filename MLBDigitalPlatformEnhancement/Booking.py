@@ -4,7 +4,7 @@ import uuid
 import time
 from enum import Enum
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 
 from MLBDigitalPlatformEnhancement.BookingStatus import BookingStatus
 from MLBDigitalPlatformEnhancement.Ticket import Ticket
@@ -20,7 +20,7 @@ class Booking:
         self.match_id = match_id
         self.booking_time = booking_time
         self.status = BookingStatus.PENDING
-        self.ticket_ids: List[str] = []
+        self.ticket_ids: Dict[str, None] = {}  # an ordered set: keys in the order tickets were added
         self.total_amount = 0.0
         self.payment_reference = ""
 
@@ -29,7 +29,7 @@ class Booking:
         if not ticket.reserve_ticket(self.booking_id):
             return False
 
-        self.ticket_ids.append(ticket.ticket_id)
+        self.ticket_ids[ticket.ticket_id] = None
         self.total_amount += ticket.price
         return True
 
@@ -41,10 +41,24 @@ class Booking:
         if not ticket.cancel_reservation():
             return False
 
-        self.ticket_ids.remove(ticket.ticket_id)
+        del self.ticket_ids[ticket.ticket_id]
         self.total_amount -= ticket.price
         return True
 
+    def has_ticket(self, ticket_id: str) -> bool:
+        """Check whether a ticket belongs to this booking"""
+        return ticket_id in self.ticket_ids
+
+    def discard_tickets(self, ticket_ids: Iterable[str], amount: float) -> List[str]:
+        """Drop tickets the caller has already released, and their amount; returns the IDs dropped"""
+        removed = []
+        for ticket_id in ticket_ids:
+            if ticket_id in self.ticket_ids:
+                del self.ticket_ids[ticket_id]
+                removed.append(ticket_id)
+        self.total_amount -= amount
+        return removed
+
     def confirm_booking(self, payment_reference: str) -> bool:
         """Confirm this booking"""
         if self.status != BookingStatus.PENDING:
@@ -62,6 +76,14 @@ class Booking:
         self.status = BookingStatus.CANCELLED
         return True
 
+    def expire_booking(self) -> bool:
+        """Expire this booking because its hold ran out before confirmation"""
+        if self.status != BookingStatus.PENDING:
+            return False
+
+        self.status = BookingStatus.EXPIRED
+        return True
+
     def get_booking_details(self) -> Dict[str, Any]:
         """Return a dictionary of booking details"""
         return {
@@ -0,0 +1,101 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Dict, Any, Optional, Tuple
+
+from MLBDigitalPlatformEnhancement.Booking import Booking
+from MLBDigitalPlatformEnhancement.BookingStatus import BookingStatus
+
+
+class BookingIndex:
+    FIELDS = ("customer_email", "customer_phone", "match_id")
+    ACTIVE_STATUSES = (BookingStatus.PENDING, BookingStatus.CONFIRMED)
+
+    def __init__(self):
+        # field -> normalized value -> booking IDs in booking time order, so a page is one slice;
+        # "active" lists drop bookings once they are cancelled or expire
+        self.all_bookings: Dict[str, Dict[str, List[str]]] = {field: {} for field in self.FIELDS}
+        self.active_bookings: Dict[str, Dict[str, List[str]]] = {field: {} for field in self.FIELDS}
+        self.order_keys: Dict[str, Tuple[datetime.datetime, int, str]] = {}  # booking ID -> get_order_key
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize(field: str, value: str) -> str:
+        """Normalize a lookup value: emails ignore case, phone numbers keep only digits"""
+        if field == "customer_email":
+            return value.strip().lower()
+        if field == "customer_phone":
+            return "".join(character for character in value if character.isdigit())
+        return value
+
+    @staticmethod
+    def get_order_key(booking_time: datetime.datetime, booking_id: str) -> Tuple[datetime.datetime, int, str]:
+        """Sort key for a booking: its booking time, then its ID in issue order (B999999 before B1000000)"""
+        return booking_time, len(booking_id), booking_id
+
+    def add_booking(self, booking: Booking) -> None:
+        """Index a new booking under its email, phone and match"""
+        active = booking.status in self.ACTIVE_STATUSES
+        with self.lock:
+            self.order_keys[booking.booking_id] = self.get_order_key(booking.booking_time, booking.booking_id)
+            order_key = self.order_keys.__getitem__
+            for field in self.FIELDS:
+                key = self.normalize(field, getattr(booking, field))
+                insort(self.all_bookings[field].setdefault(key, []), booking.booking_id, key=order_key)
+                if active:
+                    insort(self.active_bookings[field].setdefault(key, []), booking.booking_id, key=order_key)
+
+    def deactivate_booking(self, booking: Booking) -> None:
+        """Drop a cancelled or expired booking from the active lists"""
+        with self.lock:
+            booking_key = self.order_keys.get(booking.booking_id)
+            if booking_key is None:
+                return
+            for field in self.FIELDS:
+                key = self.normalize(field, getattr(booking, field))
+                booking_ids = self.active_bookings[field].get(key)
+                if not booking_ids:
+                    continue
+                position = bisect_left(booking_ids, booking_key, key=self.order_keys.__getitem__)
+                if position < len(booking_ids) and booking_ids[position] == booking.booking_id:
+                    del booking_ids[position]
+                if not booking_ids:
+                    del self.active_bookings[field][key]
+
+    def find(self, field: str, value: str, active_only: bool = False, offset: int = 0, limit: int = 50,
+             after: Optional[str] = None, after_time: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+        """Get one page of booking IDs for a value, oldest booking first.
+
+        Pages are taken by offset, or by after (the last booking ID of the
+        previous page), which stays stable while bookings are added. A booking
+        indexed elsewhere, such as on another shard, needs its after_time too.
+        """
+        if field not in self.FIELDS:
+            raise ValueError(f"Bookings are not indexed by {field}")
+
+        index = self.active_bookings if active_only else self.all_bookings
+        with self.lock:
+            booking_ids = index[field].get(self.normalize(field, value), [])
+            if after is not None:
+                after_key = self.order_keys.get(after) if after_time is None else self.get_order_key(after_time, after)
+                if after_key is None:
+                    raise ValueError(f"Booking {after} is not indexed")
+                start = bisect_right(booking_ids, after_key, key=self.order_keys.__getitem__)
+            else:
+                start = offset
+            page = booking_ids[start:start + limit]
+            total = len(booking_ids)
+
+        end = start + len(page)
+        return {
+            "booking_ids": page,
+            "total": total,
+            "offset": start,
+            "limit": limit,
+            "next_offset": end if end < total else None,
+            "next_after": page[-1] if page and end < total else None
+        }
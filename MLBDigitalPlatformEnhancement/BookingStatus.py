@@ -10,3 +10,4 @@ class BookingStatus(Enum):
     PENDING = "Pending"
     CONFIRMED = "Confirmed"
     CANCELLED = "Cancelled"
+    EXPIRED = "Expired"
@@ -0,0 +1,169 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import os
+import pickle
+import struct
+import zlib
+from typing import List, Dict, Any, Optional, Callable
+
+from MLBDigitalPlatformEnhancement.SharedExclusiveLock import SharedExclusiveLock
+from MLBDigitalPlatformEnhancement.WriteAheadLog import WriteAheadLog
+
+
+class DurableStore:
+    SNAPSHOT_FILE = "snapshot.bin"
+    SNAPSHOT_HEADER = struct.Struct("<8sQI")  # magic, LSN the snapshot covers, CRC32 of the payload
+    SNAPSHOT_MAGIC = b"MLBSNAP1"
+
+    def __init__(self, directory: str, get_state: Callable[[], Dict[str, Any]],
+                 restore_state: Callable[[Dict[str, Any]], None],
+                 apply_record: Callable[[str, tuple], None], sync: bool = True):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.get_state = get_state  # everything a snapshot needs, as picklable objects
+        self.restore_state = restore_state
+        self.apply_record = apply_record  # replays one logged mutation
+
+        self.wal = WriteAheadLog(directory, sync)
+        self.snapshot_lsn = 0
+
+        # Logged mutations hold the gate shared; a snapshot holds it exclusively
+        # so it never sees a mutation applied but not yet logged
+        self.gate = SharedExclusiveLock()
+        self.snapshot_lock = threading.Lock()  # one snapshot at a time
+
+        # Metrics
+        self.recovery: Dict[str, Any] = {}
+        self.snapshots_taken = 0
+        self.last_snapshot: Dict[str, Any] = {}
+
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def recover(self) -> Dict[str, Any]:
+        """Load the latest snapshot, replay the log records after it, then open the log for writing"""
+        start = time.perf_counter()
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as file:
+                data = file.read()
+            magic, lsn, checksum = self.SNAPSHOT_HEADER.unpack_from(data)
+            payload = memoryview(data)[self.SNAPSHOT_HEADER.size:]
+            if magic != self.SNAPSHOT_MAGIC or zlib.crc32(payload) != checksum:
+                raise ValueError(f"Corrupt snapshot: {self.snapshot_path}")
+            self.restore_state(pickle.loads(payload))
+            self.snapshot_lsn = lsn
+        snapshot_seconds = time.perf_counter() - start
+
+        replayed = 0
+        for lsn, operation, arguments in self.wal.replay(self.snapshot_lsn):
+            self.apply_record(operation, arguments)
+            replayed += 1
+        self.wal.open()
+
+        elapsed = time.perf_counter() - start
+        self.recovery = {
+            "snapshot_lsn": self.snapshot_lsn,
+            "last_lsn": self.wal.last_lsn,
+            "records_replayed": replayed,
+            "snapshot_load_seconds": round(snapshot_seconds, 3),
+            "replay_seconds": round(elapsed - snapshot_seconds, 3),
+            "recovery_seconds": round(elapsed, 3)
+        }
+        return self.recovery
+
+    def mutation(self):
+        """Context manager held around a mutation and its log record"""
+        return self.gate.shared()
+
+    def log(self, operation: str, *arguments) -> int:
+        """Append a mutation record and return its LSN"""
+        return self.wal.append(operation, arguments)
+
+    def commit(self, lsn: int) -> None:
+        """Wait until the record at lsn is durable"""
+        self.wal.commit(lsn)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Write a snapshot of the current state and drop the log segments it covers"""
+        with self.snapshot_lock:
+            start = time.perf_counter()
+            with self.gate.exclusive():
+                lsn = self.wal.rotate()
+                payload = pickle.dumps(self.get_state(), protocol=pickle.HIGHEST_PROTOCOL)
+            pause = time.perf_counter() - start
+
+            # Write beside the old snapshot and swap it in, so a crash leaves one intact
+            temporary_path = self.snapshot_path + ".tmp"
+            with open(temporary_path, 'wb') as file:
+                file.write(self.SNAPSHOT_HEADER.pack(self.SNAPSHOT_MAGIC, lsn, zlib.crc32(payload)))
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, self.snapshot_path)
+            if hasattr(os, "O_DIRECTORY"):
+                directory = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(directory)
+                finally:
+                    os.close(directory)
+
+            self.snapshot_lsn = lsn
+            removed = self.wal.remove_segments_through(lsn)
+            self.snapshots_taken += 1
+            self.last_snapshot = {
+                "lsn": lsn,
+                "bytes": self.SNAPSHOT_HEADER.size + len(payload),
+                "writer_pause_seconds": round(pause, 3),
+                "seconds": round(time.perf_counter() - start, 3),
+                "segments_removed": removed
+            }
+            return self.last_snapshot
+
+    def run(self, interval_seconds: float, min_records: int) -> None:
+        """Snapshot every interval once at least min_records have been logged since the last one"""
+        while not self.stop_event.wait(interval_seconds):
+            if self.wal.last_lsn - self.snapshot_lsn >= min_records:
+                self.snapshot()
+
+    def start(self, interval_seconds: float = 300.0, min_records: int = 1) -> bool:
+        """Start taking periodic snapshots in the background"""
+        if self.thread and self.thread.is_alive():
+            return False
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval_seconds, min_records),
+                                       name="snapshots", daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self) -> bool:
+        """Stop the periodic snapshots"""
+        if not self.thread:
+            return False
+
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        return True
+
+    def close(self) -> None:
+        """Stop snapshots and flush and close the log"""
+        self.stop()
+        self.wal.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of persistence metrics"""
+        return {
+            "directory": self.directory,
+            "snapshot_lsn": self.snapshot_lsn,
+            "records_since_snapshot": self.wal.last_lsn - self.snapshot_lsn,
+            "snapshots_taken": self.snapshots_taken,
+            "last_snapshot": self.last_snapshot,
+            "recovery": self.recovery,
+            "log": self.wal.get_metrics()
+        }
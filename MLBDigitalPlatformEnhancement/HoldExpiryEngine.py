@@ -0,0 +1,85 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Deque, Tuple
+
+from MLBDigitalPlatformEnhancement.HoldTimerWheel import HoldTimerWheel
+
+
+class HoldExpiryEngine:
+    def __init__(self, wheel: HoldTimerWheel, expire_bookings: Callable[[List[str]], int],
+                 interval_seconds: float = 1.0, rate_window_seconds: float = 60.0):
+        self.wheel = wheel
+        self.expire_bookings = expire_bookings  # releases a batch of holds, returns how many expired
+        self.interval_seconds = interval_seconds
+        self.rate_window_seconds = rate_window_seconds
+
+        # Metrics
+        self.holds_expired_total = 0
+        self.last_batch_size = 0
+        self.last_run_seconds = 0.0
+        self.recent_batches: Deque[Tuple[float, int]] = deque()  # (monotonic time, holds expired)
+        self.metrics_lock = threading.Lock()
+
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def run_once(self, now: Optional[float] = None) -> int:
+        """Expire every hold that is due and record the batch in the metrics"""
+        now = time.monotonic() if now is None else now
+        start = time.perf_counter()
+        due = self.wheel.advance(now)
+        expired = self.expire_bookings(due) if due else 0
+        elapsed = time.perf_counter() - start
+
+        with self.metrics_lock:
+            self.holds_expired_total += expired
+            self.last_batch_size = expired
+            self.last_run_seconds = elapsed
+            if expired:
+                self.recent_batches.append((now, expired))
+            while self.recent_batches and self.recent_batches[0][0] <= now - self.rate_window_seconds:
+                self.recent_batches.popleft()
+        return expired
+
+    def run(self) -> None:
+        """Expire holds every interval until stopped"""
+        while not self.stop_event.wait(self.interval_seconds):
+            self.run_once()
+
+    def start(self) -> bool:
+        """Start the background expiry thread"""
+        if self.thread and self.thread.is_alive():
+            return False
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="hold-expiry", daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self) -> bool:
+        """Stop the background expiry thread"""
+        if not self.thread:
+            return False
+
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of hold expiry metrics"""
+        with self.metrics_lock:
+            recent_expired = sum(count for _, count in self.recent_batches)
+            return {
+                "pending_holds": len(self.wheel),
+                "holds_expired_total": self.holds_expired_total,
+                "holds_expired_per_second": round(recent_expired / self.rate_window_seconds, 3),
+                "last_batch_size": self.last_batch_size,
+                "last_run_ms": round(self.last_run_seconds * 1000, 3),
+                "running": bool(self.thread and self.thread.is_alive())
+            }
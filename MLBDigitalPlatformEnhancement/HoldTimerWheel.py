@@ -0,0 +1,70 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional
+
+
+class HoldTimerWheel:
+    def __init__(self, tick_seconds: float = 1.0, slot_count: int = 512, start_time: Optional[float] = None):
+        self.tick_seconds = tick_seconds
+        self.slot_count = slot_count
+        # Each slot maps booking_id -> deadline tick; holds longer than one
+        # revolution stay in their slot until the wheel comes round to them again
+        self.slots: List[Dict[str, int]] = [{} for _ in range(slot_count)]
+        self.slot_by_booking: Dict[str, int] = {}  # booking_id -> slot index
+        self.current_tick = self.get_tick(time.monotonic() if start_time is None else start_time)
+        self.lock = threading.Lock()
+
+    def get_tick(self, timestamp: float) -> int:
+        """Convert a monotonic timestamp to a wheel tick"""
+        return int(timestamp // self.tick_seconds)
+
+    def schedule(self, booking_id: str, deadline: float) -> None:
+        """Schedule a hold to expire at a monotonic deadline, replacing any earlier timer"""
+        # A deadline that falls inside the current tick expires on the next advance
+        deadline_tick = max(self.get_tick(deadline), self.current_tick + 1)
+        slot = deadline_tick % self.slot_count
+        with self.lock:
+            old_slot = self.slot_by_booking.get(booking_id)
+            if old_slot is not None:
+                self.slots[old_slot].pop(booking_id, None)
+            self.slots[slot][booking_id] = deadline_tick
+            self.slot_by_booking[booking_id] = slot
+
+    def cancel(self, booking_id: str) -> bool:
+        """Cancel the timer for a hold"""
+        with self.lock:
+            slot = self.slot_by_booking.pop(booking_id, None)
+            if slot is None:
+                return False
+            self.slots[slot].pop(booking_id, None)
+            return True
+
+    def advance(self, now: Optional[float] = None) -> List[str]:
+        """Advance the wheel to now and return the booking IDs whose holds have expired"""
+        now_tick = self.get_tick(time.monotonic() if now is None else now)
+        expired = []
+        with self.lock:
+            if now_tick <= self.current_tick:
+                return expired
+
+            # Visit each slot at most once, however far the clock has moved
+            ticks = min(now_tick - self.current_tick, self.slot_count)
+            for tick in range(now_tick - ticks + 1, now_tick + 1):
+                slot = self.slots[tick % self.slot_count]
+                if not slot:
+                    continue
+                due = [booking_id for booking_id, deadline_tick in slot.items() if deadline_tick <= now_tick]
+                for booking_id in due:
+                    del slot[booking_id]
+                    del self.slot_by_booking[booking_id]
+                expired.extend(due)
+
+            self.current_tick = now_tick
+        return expired
+
+    def __len__(self) -> int:
+        return len(self.slot_by_booking)
@@ -0,0 +1,62 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional
+
+
+class IdAllocator:
+    def __init__(self, prefix: str, width: int, block_size: int = 64, start: int = 1):
+        self.prefix = prefix
+        self.width = width
+        self.block_size = block_size
+        self.next_number = start
+        self.floor = start - 1  # highest number advance_past has ruled out
+        self.lock = threading.Lock()
+
+        # Each thread draws IDs from its own block and only takes the lock to refill it
+        self.local = threading.local()
+
+    def format_id(self, number: int) -> str:
+        """Format a numeric ID with this allocator's prefix and width"""
+        return f"{self.prefix}{number:0{self.width}d}"
+
+    def parse_id(self, value: str) -> int:
+        """Get the number of an ID formatted by this allocator"""
+        return int(value[len(self.prefix):])
+
+    def advance_past(self, number: int) -> None:
+        """Make sure numbers up to and including number are never handed out.
+
+        Blocks other threads already hold may still contain such numbers;
+        next_id drops a block once it reaches a number at or below the floor.
+        """
+        with self.lock:
+            if number >= self.next_number:
+                self.next_number = number + 1
+            if number > self.floor:
+                self.floor = number
+
+    def reserve_numbers(self, count: int) -> range:
+        """Reserve a contiguous range of ID numbers"""
+        with self.lock:
+            first = self.next_number
+            self.next_number += count
+        return range(first, first + count)
+
+    def next_id(self) -> str:
+        """Get the next ID from the calling thread's block"""
+        block = getattr(self.local, "block", None)
+        number = next(block, None) if block is not None else None
+        if number is None or number <= self.floor:
+            block = iter(self.reserve_numbers(self.block_size))
+            self.local.block = block
+            number = next(block)
+        return self.format_id(number)
+
+    def next_ids(self, count: int) -> List[str]:
+        """Get a contiguous run of count IDs in one lock acquisition"""
+        template = f"{self.prefix}{{:0{self.width}d}}".format
+        return [template(number) for number in self.reserve_numbers(count)]
@@ -0,0 +1,93 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from bisect import bisect_left, insort
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+
+class Leaderboard:
+    def __init__(self, stats_table, stat: str, ascending: bool = False,
+                 qualifier: Optional[str] = None, minimum: float = 0):
+        self.stats_table = stats_table
+        self.stat = stat
+        self.ascending = ascending  # True for stats where lower is better, like ERA
+        self.qualifier = qualifier  # stat a player needs at least minimum of to be ranked
+        self.minimum = minimum
+
+        # Qualified players kept sorted best-first as (sort value, player_id);
+        # player_id breaks ties so the order is stable
+        self.entries: List[Tuple[float, str]] = []
+        self.keys: Dict[str, Tuple[float, str]] = {}  # player_id -> its entry
+        self.lock = threading.Lock()
+
+        stats_table.listeners.append(self.update)
+        self.update(list(stats_table.rows.keys()))
+
+    def get_key(self, row: int, player_id: str) -> Optional[Tuple[float, str]]:
+        """Get a player's sort entry, or None if the player does not qualify"""
+        columns = self.stats_table.columns
+        if self.qualifier:
+            qualifying = columns[self.qualifier][row]
+            if qualifying <= 0 or qualifying < self.minimum:
+                return None
+        value = float(columns[self.stat][row])
+        return (value if self.ascending else -value, player_id)
+
+    def update(self, player_ids: Iterable[str]) -> None:
+        """Re-rank players whose stats changed; O(log n) search per player"""
+        rows = self.stats_table.rows
+        with self.lock:
+            for player_id in player_ids:
+                key = self.get_key(rows[player_id], player_id)
+                old_key = self.keys.get(player_id)
+                if key == old_key:
+                    continue
+
+                if old_key is not None:
+                    del self.entries[bisect_left(self.entries, old_key)]
+                    del self.keys[player_id]
+                if key is not None:
+                    insort(self.entries, key)
+                    self.keys[player_id] = key
+
+    def get_top(self, count: int = 10) -> List[Dict[str, Any]]:
+        """Get the top count qualified players, best first"""
+        with self.lock:
+            entries = self.entries[:count]
+
+        table = self.stats_table
+        leaders = []
+        for rank, (value, player_id) in enumerate(entries, 1):
+            player = table.players[table.rows[player_id]]
+            leaders.append({
+                "rank": rank,
+                "player_id": player_id,
+                "name": player.name,
+                "team_id": player.team_id,
+                self.stat: getattr(player, self.stat)
+            })
+        return leaders
+
+    def get_rank(self, player_id: str) -> Optional[int]:
+        """Get a player's 1-based rank, or None if the player does not qualify"""
+        with self.lock:
+            key = self.keys.get(player_id)
+            if key is None:
+                return None
+            return bisect_left(self.entries, key) + 1
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_leaderboard_details(self) -> Dict[str, Any]:
+        """Return a dictionary of leaderboard details"""
+        return {
+            "stat": self.stat,
+            "ascending": self.ascending,
+            "qualifier": self.qualifier,
+            "minimum": self.minimum,
+            "qualified_players": len(self.entries)
+        }
@@ -0,0 +1,131 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import asyncio
+from typing import List, Dict, Any, Optional, Iterable, Set
+
+from MLBDigitalPlatformEnhancement.LiveScoreSubscription import LiveScoreSubscription
+from MLBDigitalPlatformEnhancement.Match import Match
+
+
+class LiveScoreHub:
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id: Optional[int] = None
+
+        self.subscribers: Dict[str, Set[LiveScoreSubscription]] = {}  # match_id -> subscriptions
+        self.states: Dict[str, Dict[str, Any]] = {}  # match_id -> last published score, inning and status
+        self.sequences: Dict[str, int] = {}  # match_id -> sequence number of the last frame
+
+        # Updates published since the last flush, latest state per match; every
+        # update in one pass of the event loop goes out as a single frame
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.flush_scheduled = False
+
+        # Metrics
+        self.updates_published = 0
+        self.frames_sent = 0
+        self.frames_fanned_out = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Deliver frames on this event loop"""
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+
+    @staticmethod
+    def get_state(match: Match) -> Dict[str, Any]:
+        """Get the fields of a match that subscribers follow"""
+        return {
+            "home_score": match.home_team_score,
+            "away_score": match.away_team_score,
+            "inning": match.current_inning,
+            "is_top": match.is_inning_top,
+            "status": match.status.value
+        }
+
+    def publish(self, match: Match) -> None:
+        """Publish a match's current state; safe to call from any thread"""
+        state = self.get_state(match)
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            self.states[match.match_id] = state
+            return
+
+        if threading.get_ident() == self.loop_thread_id:
+            self.queue_update(match.match_id, state)
+        else:
+            loop.call_soon_threadsafe(self.queue_update, match.match_id, state)
+
+    def queue_update(self, match_id: str, state: Dict[str, Any]) -> None:
+        """Record an update and schedule a flush for the end of this loop pass"""
+        self.updates_published += 1
+        self.pending[match_id] = state
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.loop.call_soon(self.flush)
+
+    def flush(self) -> int:
+        """Send one delta frame per updated match to its subscribers; returns the frames sent"""
+        self.flush_scheduled = False
+        pending, self.pending = self.pending, {}
+
+        sent = 0
+        for match_id, state in pending.items():
+            previous = self.states.get(match_id, {})
+            delta = {key: value for key, value in state.items() if previous.get(key) != value}
+            self.states[match_id] = state
+            if not delta:
+                continue
+
+            sequence = self.sequences.get(match_id, 0) + 1
+            self.sequences[match_id] = sequence
+            delta["match_id"] = match_id
+            delta["sequence"] = sequence
+
+            subscribers = self.subscribers.get(match_id, ())
+            for subscription in subscribers:
+                subscription.deliver(delta)
+            self.frames_fanned_out += len(subscribers)
+            sent += 1
+
+        self.frames_sent += sent
+        return sent
+
+    def subscribe(self, match_ids: Iterable[str]) -> LiveScoreSubscription:
+        """Subscribe to matches from inside the event loop; the first frame per match is its full state"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self.bind(loop)
+
+        subscription = LiveScoreSubscription(self, set(match_ids))
+        for match_id in subscription.match_ids:
+            self.subscribers.setdefault(match_id, set()).add(subscription)
+            state = self.states.get(match_id)
+            if state is not None:
+                subscription.deliver(dict(state, match_id=match_id, sequence=self.sequences.get(match_id, 0)))
+        return subscription
+
+    def unsubscribe(self, subscription: LiveScoreSubscription) -> None:
+        """Stop delivering frames to a subscription"""
+        for match_id in subscription.match_ids:
+            subscribers = self.subscribers.get(match_id)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscribers[match_id]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of fan-out metrics"""
+        subscriptions = {subscription for subscribers in self.subscribers.values() for subscription in subscribers}
+        return {
+            "subscriptions": len(subscriptions),
+            "matches_followed": len(self.subscribers),
+            "updates_published": self.updates_published,
+            "frames_sent": self.frames_sent,
+            "frames_fanned_out": self.frames_fanned_out,
+            "frames_coalesced": sum(subscription.frames_coalesced for subscription in subscriptions),
+            "frames_pending": sum(subscription.pending_count() for subscription in subscriptions)
+        }
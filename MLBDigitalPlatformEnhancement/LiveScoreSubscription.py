@@ -0,0 +1,81 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import asyncio
+from typing import List, Dict, Any, Optional, Set
+
+
+class LiveScoreSubscription:
+    def __init__(self, hub, match_ids: Set[str]):
+        self.hub = hub
+        self.match_ids = match_ids
+
+        # The queue holds match IDs with an undelivered frame and frames holds that
+        # frame; a newer update merges into it rather than queueing behind it, so a
+        # slow subscriber holds at most one frame per match it follows
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.frames: Dict[str, Dict[str, Any]] = {}
+        self.closed = False
+
+        # Metrics
+        self.frames_received = 0
+        self.frames_coalesced = 0  # stale frames merged into a newer one before delivery
+
+    def deliver(self, frame: Dict[str, Any]) -> None:
+        """Queue a frame, merging it into any undelivered frame for the same match"""
+        self.frames_received += 1
+        match_id = frame["match_id"]
+        pending = self.frames.get(match_id)
+        if pending is None:
+            # Frames are shared by every subscriber of the match and never mutated
+            self.frames[match_id] = frame
+            self.queue.put_nowait(match_id)
+        else:
+            self.frames[match_id] = {**pending, **frame}
+            self.frames_coalesced += 1
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next frame; returns None once the subscription is closed"""
+        while True:
+            match_id = await self.queue.get()
+            if match_id is None:
+                return None
+            frame = self.frames.pop(match_id, None)
+            if frame is not None:
+                return frame
+
+    def get_nowait(self) -> Optional[Dict[str, Any]]:
+        """Get the next frame if one is waiting, else None"""
+        while not self.queue.empty():
+            match_id = self.queue.get_nowait()
+            if match_id is None:
+                return None
+            frame = self.frames.pop(match_id, None)
+            if frame is not None:
+                return frame
+        return None
+
+    def pending_count(self) -> int:
+        """Get the number of undelivered frames"""
+        return len(self.frames)
+
+    def close(self) -> None:
+        """Stop receiving updates; a waiting get() returns None"""
+        if self.closed:
+            return
+        self.closed = True
+        self.hub.unsubscribe(self)
+        self.frames.clear()
+        self.queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        frame = await self.get()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
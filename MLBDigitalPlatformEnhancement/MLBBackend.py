@@ -4,82 +4,147 @@ import uuid
 import time
 from enum import Enum
 import json
-from typing import List, Dict, Any, Optional
+import itertools
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, Iterable, Union
 
 from MLBDigitalPlatformEnhancement.Booking import Booking
+from MLBDigitalPlatformEnhancement.BookingIndex import BookingIndex
+from MLBDigitalPlatformEnhancement.BookingStatus import BookingStatus
+from MLBDigitalPlatformEnhancement.DurableStore import DurableStore
+from MLBDigitalPlatformEnhancement.HoldExpiryEngine import HoldExpiryEngine
+from MLBDigitalPlatformEnhancement.HoldTimerWheel import HoldTimerWheel
+from MLBDigitalPlatformEnhancement.IdAllocator import IdAllocator
+from MLBDigitalPlatformEnhancement.Leaderboard import Leaderboard
+from MLBDigitalPlatformEnhancement.LiveScoreHub import LiveScoreHub
+from MLBDigitalPlatformEnhancement.LiveScoreSubscription import LiveScoreSubscription
 from MLBDigitalPlatformEnhancement.Match import Match
+from MLBDigitalPlatformEnhancement.MatchStatus import MatchStatus
+from MLBDigitalPlatformEnhancement.PlayByPlayPipeline import PlayByPlayPipeline
 from MLBDigitalPlatformEnhancement.Player import Player
+from MLBDigitalPlatformEnhancement.PlayerStatsTable import PlayerStatsTable
+from MLBDigitalPlatformEnhancement.PricingEngine import PricingEngine
 from MLBDigitalPlatformEnhancement.Position import Position
+from MLBDigitalPlatformEnhancement.ReportCache import ReportCache
+from MLBDigitalPlatformEnhancement.ReportJob import ReportJob
+from MLBDigitalPlatformEnhancement.ReportJobManager import ReportJobManager
 from MLBDigitalPlatformEnhancement.Schedule import Schedule
+from MLBDigitalPlatformEnhancement.ScheduleBuilder import ScheduleBuilder
+from MLBDigitalPlatformEnhancement.SeatMap import SeatMap
+from MLBDigitalPlatformEnhancement.Standings import Standings
+from MLBDigitalPlatformEnhancement.StreamingReportWriter import StreamingReportWriter
+from MLBDigitalPlatformEnhancement.StripedLock import StripedLock
 from MLBDigitalPlatformEnhancement.Team import Team
 from MLBDigitalPlatformEnhancement.Ticket import Ticket
+from MLBDigitalPlatformEnhancement.TicketInventory import TicketInventory
 from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketStore import TicketStore
 from MLBDigitalPlatformEnhancement.TicketType import TicketType
+from MLBDigitalPlatformEnhancement.WaitingRoom import WaitingRoom
 
 
 class MLBBackend:
-    def __init__(self):
+    def __init__(self, hold_ttl_seconds: float = 600.0, report_workers: int = 4, id_namespace: str = ""):
         self.teams: Dict[str, Team] = {}  # team_id -> Team
         self.players: Dict[str, Player] = {}  # player_id -> Player
+        self.player_stats = PlayerStatsTable()  # columnar copy of every player's stats
+        self.game_players: Dict[str, set] = {}  # match_id -> players in a live game's play-by-play so far
+        self.leaderboards: Dict[str, Leaderboard] = {}  # name -> Leaderboard, kept current on every stat update
         self.schedule = Schedule()
-        self.tickets: Dict[str, Ticket] = {}  # ticket_id -> Ticket
+        self.live_scores = LiveScoreHub()  # pushes score, inning and status deltas to subscribers
+        self.schedule.listeners.append(self.live_scores.publish)
+        self.schedule_builder = ScheduleBuilder()  # team, venue and rest-day checks for bulk scheduling
+        self.standings = Standings(self.teams)  # division standings from completed matches
+        self.schedule.listeners.append(self.standings.record_match)
         self.bookings: Dict[str, Booking] = {}  # booking_id -> Booking
-
-        # For generating unique IDs
-        self.team_counter = 1
-        self.player_counter = 1
-        self.match_counter = 1
-        self.ticket_counter = 1
-        self.booking_counter = 1
-
-        # Thread locks
-        self.team_lock = threading.Lock()
-        self.player_lock = threading.Lock()
-        self.match_lock = threading.Lock()
-        self.ticket_lock = threading.Lock()
-        self.booking_lock = threading.Lock()
+        self.booking_index = BookingIndex()  # booking IDs by customer email, phone and match
+        self.waiting_rooms: Dict[str, WaitingRoom] = {}  # match_id -> admission queue for an on-sale surge
+
+        # Ticket state changes lock the (match_id, section) stripes they touch
+        self.seat_locks = StripedLock()
+
+        # Unconfirmed bookings release their seats once their hold TTL runs out
+        self.hold_ttl_seconds = hold_ttl_seconds
+        self.hold_timers = HoldTimerWheel()
+        self.hold_expiry = HoldExpiryEngine(self.hold_timers, self.expire_bookings)
+
+        # Available tickets of upcoming matches are re-priced from demand; held tickets keep their price
+        self.pricing = PricingEngine(self.reprice_matches)
+
+        # Reports run as jobs on a bounded pool instead of one thread each
+        self.report_jobs = ReportJobManager(report_workers)
+
+        # generate_all_reports skips reports whose inputs are unchanged since they were last written
+        self.report_cache = ReportCache()
+
+        # Standard stats-page leaderboards; rate stats need a minimum of playing time
+        self.add_leaderboard("home_runs", "home_runs", qualifier="home_runs", minimum=1)
+        self.add_leaderboard("runs_batted_in", "runs_batted_in", qualifier="runs_batted_in", minimum=1)
+        self.add_leaderboard("hits", "hits", qualifier="hits", minimum=1)
+        self.add_leaderboard("stolen_bases", "stolen_bases", qualifier="stolen_bases", minimum=1)
+        self.add_leaderboard("batting_average", "batting_average", qualifier="at_bats", minimum=100)
+        self.add_leaderboard("wins", "wins", qualifier="wins", minimum=1)
+        self.add_leaderboard("strikeouts", "strikeouts", qualifier="strikeouts", minimum=1)
+        self.add_leaderboard("earned_run_average", "earned_run_average", ascending=True,
+                             qualifier="innings_pitched", minimum=50)
+        self.add_leaderboard("whip", "whip", ascending=True, qualifier="innings_pitched", minimum=50)
+
+        # For generating unique IDs; each allocator hands out blocks per thread
+        self.team_id_allocator = IdAllocator("T", 4)
+        self.player_id_allocator = IdAllocator("P", 4)
+        self.match_id_allocator = IdAllocator("M", 4)
+        # Shards put their namespace in ticket and booking IDs so the router can find them
+        self.ticket_id_allocator = IdAllocator(f"TK{id_namespace}", 6, block_size=1024)
+        self.booking_id_allocator = IdAllocator(f"B{id_namespace}", 6)
+
+        # Tickets live in a columnar store (ticket_id -> Ticket view) indexed per match
+        self.tickets = TicketStore(self.ticket_id_allocator.prefix, self.ticket_id_allocator.width)
+        self.inventory = TicketInventory(self.tickets)  # match_id -> per-row status/type bitsets
+
+        # Write-ahead log and snapshots, once open_storage is called
+        self.storage: Optional[DurableStore] = None
+        self.schedule.listeners.append(self.log_match_state)
+        self.player_stats.listeners.append(self.log_player_stats)
+        self.tickets.listeners.append(self.log_ticket_price)
 
     def generate_team_id(self) -> str:
         """Generate a unique team ID"""
-        with self.team_lock:
-            team_id = f"T{self.team_counter:04d}"
-            self.team_counter += 1
-            return team_id
+        return self.team_id_allocator.next_id()
 
     def generate_player_id(self) -> str:
         """Generate a unique player ID"""
-        with self.player_lock:
-            player_id = f"P{self.player_counter:04d}"
-            self.player_counter += 1
-            return player_id
+        return self.player_id_allocator.next_id()
 
     def generate_match_id(self) -> str:
         """Generate a unique match ID"""
-        with self.match_lock:
-            match_id = f"M{self.match_counter:04d}"
-            self.match_counter += 1
-            return match_id
+        return self.match_id_allocator.next_id()
 
     def generate_ticket_id(self) -> str:
         """Generate a unique ticket ID"""
-        with self.ticket_lock:
-            ticket_id = f"TK{self.ticket_counter:06d}"
-            self.ticket_counter += 1
-            return ticket_id
+        return self.ticket_id_allocator.next_id()
+
+    def generate_ticket_ids(self, count: int) -> List[str]:
+        """Generate count unique ticket IDs at once"""
+        return self.ticket_id_allocator.next_ids(count)
 
     def generate_booking_id(self) -> str:
         """Generate a unique booking ID"""
-        with self.booking_lock:
-            booking_id = f"B{self.booking_counter:06d}"
-            self.booking_counter += 1
-            return booking_id
+        return self.booking_id_allocator.next_id()
 
     # Team Management
-    def add_team(self, name: str, city: str, stadium: str, division: str) -> Team:
-        """Add a new team"""
-        team_id = self.generate_team_id()
-        team = Team(team_id, name, city, stadium, division)
-        self.teams[team_id] = team
+    def add_team(self, name: str, city: str, stadium: str, division: str, team_id: Optional[str] = None) -> Team:
+        """Add a new team; team_id is given when a shard router assigns it"""
+        with self.storage_mutation():
+            if team_id:
+                self.team_id_allocator.advance_past(self.team_id_allocator.parse_id(team_id))
+            else:
+                team_id = self.generate_team_id()
+            team = Team(team_id, name, city, stadium, division)
+            self.teams[team_id] = team
+            lsn = self.log_mutation("add_team", team_id, name, city, stadium, division)
+
+        self.standings.invalidate_division(division)
+        self.commit_mutation(lsn)
         return team
 
     def get_team(self, team_id: str) -> Optional[Team]:
@@ -90,6 +155,15 @@ class MLBBackend:
         """Get all teams in a specific division"""
         return [team for team in self.teams.values() if team.division == division]
 
+    # Standings
+    def get_division_standings(self, division: str) -> List[Dict[str, Any]]:
+        """Get a division's standings from completed matches"""
+        return self.standings.get_division_standings(division)
+
+    def get_standings(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the standings of every division"""
+        return self.standings.get_standings()
+
     # Player Management
     def add_player(self, name: str, team_id: str, position: Position, jersey_number: int) -> Optional[Player]:
         """Add a new player"""
@@ -97,12 +171,16 @@ class MLBBackend:
         if not team:
             return None
 
-        player_id = self.generate_player_id()
-        player = Player(player_id, name, team_id, position, jersey_number)
+        with self.storage_mutation():
+            player_id = self.generate_player_id()
+            player = Player(player_id, name, team_id, position, jersey_number)
 
-        self.players[player_id] = player
-        team.add_player(player)
+            self.players[player_id] = player
+            self.player_stats.add_player(player)
+            team.add_player(player)
+            lsn = self.log_mutation("add_player", player_id, name, team_id, position, jersey_number)
 
+        self.commit_mutation(lsn)
         return player
 
     def get_player(self, player_id: str) -> Optional[Player]:
@@ -113,26 +191,124 @@ class MLBBackend:
         """Get all players on a specific team"""
         return [player for player in self.players.values() if player.team_id == team_id]
 
+    # Player Statistics
+    def apply_box_scores(self, batting_lines: List[tuple] = (), pitching_lines: List[tuple] = ()) -> int:
+        """Apply a day's batting and pitching lines to all players at once"""
+        return self.player_stats.apply_box_scores(batting_lines, pitching_lines)
+
+    def get_team_stat_aggregates(self) -> Dict[str, Dict[str, float]]:
+        """Get batting and pitching totals and rates per team"""
+        return self.player_stats.get_team_aggregates()
+
+    def get_division_stat_aggregates(self) -> Dict[str, Dict[str, float]]:
+        """Get batting and pitching totals and rates per division"""
+        team_divisions = {team_id: team.division for team_id, team in list(self.teams.items())}
+        return self.player_stats.get_division_aggregates(team_divisions)
+
+    def get_league_stat_aggregates(self) -> Dict[str, float]:
+        """Get batting and pitching totals and rates for the whole league"""
+        return self.player_stats.get_league_aggregates()
+
+    # Leaderboards
+    def add_leaderboard(self, name: str, stat: str, ascending: bool = False,
+                        qualifier: Optional[str] = None, minimum: float = 0) -> Leaderboard:
+        """Add a leaderboard ranking players by stat, optionally only those with at least minimum of qualifier"""
+        leaderboard = Leaderboard(self.player_stats, stat, ascending, qualifier, minimum)
+        self.leaderboards[name] = leaderboard
+        return leaderboard
+
+    def get_leaderboard(self, name: str, count: int = 10) -> List[Dict[str, Any]]:
+        """Get the top count players of a leaderboard"""
+        leaderboard = self.leaderboards.get(name)
+        if not leaderboard:
+            return []
+        return leaderboard.get_top(count)
+
+    # Play-by-Play Ingestion
+    def ingest_play_by_play(self, events: Union[str, Iterable[Dict[str, Any]]], batch_size: int = 1000,
+                            queue_size: int = 10000) -> Dict[str, Any]:
+        """Apply a play-by-play feed (an NDJSON file path or an iterable of events) to matches and player stats"""
+        pipeline = PlayByPlayPipeline(self.get_match, self.schedule.update_match, self.player_stats,
+                                      batch_size, queue_size, self.game_players)
+        if isinstance(events, str):
+            return pipeline.ingest_file(events)
+        return pipeline.ingest(events)
+
     # Match Schedule Management
     def add_match(self, home_team_id: str, away_team_id: str, venue: str,
-                 scheduled_time: datetime.datetime) -> Optional[Match]:
-        """Add a new match"""
+                 scheduled_time: datetime.datetime, match_id: Optional[str] = None) -> Optional[Match]:
+        """Add a new match; match_id is given when a shard router assigns it"""
         home_team = self.get_team(home_team_id)
         away_team = self.get_team(away_team_id)
 
         if not home_team or not away_team:
             return None
 
-        match_id = self.generate_match_id()
-        match = Match(match_id, home_team_id, away_team_id, venue, scheduled_time)
+        with self.storage_mutation():
+            if match_id:
+                self.match_id_allocator.advance_past(self.match_id_allocator.parse_id(match_id))
+            else:
+                match_id = self.generate_match_id()
+            match = Match(match_id, home_team_id, away_team_id, venue, scheduled_time)
 
-        self.schedule.add_match(match)
+            self.schedule.add_match(match)
+            lsn = self.log_mutation("add_match", match_id, home_team_id, away_team_id, venue, scheduled_time)
+
+        self.commit_mutation(lsn)
         return match
 
     def get_match(self, match_id: str) -> Optional[Match]:
         """Get a match by ID"""
         return self.schedule.get_match(match_id)
 
+    def find_schedule_conflicts(self, games: List[tuple]) -> List[Dict[str, Any]]:
+        """Check (home_team_id, away_team_id, venue, scheduled_time) games against each other and the schedule"""
+        existing = [match for match in self.schedule.matches.values()
+                    if match.status not in (MatchStatus.POSTPONED, MatchStatus.CANCELLED)]
+        all_games = [(match.home_team_id, match.away_team_id, match.venue, match.scheduled_time)
+                     for match in existing] + list(games)
+
+        conflicts = self.schedule_builder.validate(all_games, first_new=len(existing))
+        for conflict in conflicts:
+            # Refer to scheduled matches by ID and to new games by their index in games
+            conflict["games"] = [{"match_id": existing[index].match_id} if index < len(existing)
+                                 else {"index": index - len(existing)} for index in conflict["games"]]
+        return conflicts
+
+    def add_matches(self, games: List[tuple], validate: bool = True) -> Dict[str, Any]:
+        """Add many (home_team_id, away_team_id, venue, scheduled_time) games; none are added if any conflict"""
+        unknown = [{"type": "unknown_team", "games": [{"index": index}], "team_id": team_id}
+                   for index, game in enumerate(games) for team_id in game[:2] if team_id not in self.teams]
+        if unknown:
+            return {"matches": [], "conflicts": unknown}
+
+        if validate:
+            conflicts = self.find_schedule_conflicts(games)
+            if conflicts:
+                return {"matches": [], "conflicts": conflicts}
+
+        return {"matches": [self.add_match(*game) for game in games], "conflicts": []}
+
+    def build_season(self, start_date: datetime.date, series_count: int = 54, series_length: int = 3,
+                     off_day_every: int = 6) -> Dict[str, Any]:
+        """Generate a season between all teams (2,430 games for 30 teams), validate it and add it"""
+        games = self.schedule_builder.generate_season(list(self.teams.values()), start_date, series_count,
+                                                      series_length, off_day_every)
+        return self.add_matches(games)
+
+    # Live Scores
+    def subscribe_live_scores(self, match_ids: List[str]) -> LiveScoreSubscription:
+        """Subscribe to live updates for matches; call from inside the event loop that will read them"""
+        for match_id in match_ids:
+            match = self.get_match(match_id)
+            if match and match_id not in self.live_scores.states:
+                self.live_scores.states[match_id] = self.live_scores.get_state(match)
+        return self.live_scores.subscribe(match_ids)
+
+    def get_live_score_metrics(self) -> Dict[str, Any]:
+        """Get live score fan-out metrics"""
+        return self.live_scores.get_metrics()
+
     # Ticket Management
     def add_tickets_for_match(self, match_id: str, section: str, row: str,
                              seats: List[str], ticket_type: TicketType, price: float) -> List[Ticket]:
@@ -141,14 +317,56 @@ class MLBBackend:
         if not match:
             return []
 
-        tickets = []
-        for seat in seats:
-            ticket_id = self.generate_ticket_id()
-            ticket = Ticket(ticket_id, match_id, section, row, seat, ticket_type, price)
-            self.tickets[ticket_id] = ticket
-            tickets.append(ticket)
+        if not seats:
+            return []
 
-        return tickets
+        # The seat stripe is held from the duplicate check until the seats are indexed
+        with self.storage_mutation(), self.seat_locks.hold([(match_id, section)]):
+            if self.inventory.has_duplicate_seats(match_id, [(section, row, seats)]):
+                return []
+            ticket_numbers = self.ticket_id_allocator.reserve_numbers(len(seats))
+            store_rows = self.tickets.add_tickets(ticket_numbers, match_id, section, row, seats, ticket_type, price)
+            self.inventory.add_tickets(store_rows)
+            lsn = self.log_mutation("add_tickets", match_id, ticket_numbers.start, section, row, list(seats),
+                                    ticket_type, price)
+
+        self.commit_mutation(lsn)
+        return self.tickets.get_tickets(store_rows)
+
+    def load_seat_map(self, match_id: str, seat_map: SeatMap) -> int:
+        """Create tickets for every seat of a venue seat map in one pass"""
+        match = self.get_match(match_id)
+        if not match:
+            return 0
+
+        seat_count = seat_map.get_seat_count()
+        if not seat_count:
+            return 0
+
+        seat_keys = {(match_id, section) for section, _, _, _, _ in seat_map.iter_rows()}
+        with self.storage_mutation(), self.seat_locks.hold(seat_keys):
+            seat_rows = ((section, row, seats) for section, row, seats, _, _ in seat_map.iter_rows())
+            if self.inventory.has_duplicate_seats(match_id, seat_rows):
+                return 0
+            ticket_numbers = self.ticket_id_allocator.reserve_numbers(seat_count)
+            self.add_seat_map_tickets(match_id, seat_map, ticket_numbers)
+            lsn = self.log_mutation("load_seat_map", match_id, ticket_numbers.start, seat_map.venue, seat_map.blocks)
+
+        self.commit_mutation(lsn)
+        return seat_count
+
+    def add_seat_map_tickets(self, match_id: str, seat_map: SeatMap, ticket_numbers: range) -> None:
+        """Store and index one ticket per seat of a seat map, numbered from ticket_numbers"""
+        # Columns are appended a whole row at a time, then the batch is indexed once. Another
+        # map loading at the same time can append rows in between, so each row's range is kept
+        row_ranges = []
+        offset = 0
+        for section, row, seats, ticket_type, price in seat_map.iter_rows():
+            row_ranges.append(self.tickets.add_tickets(ticket_numbers[offset:offset + len(seats)], match_id,
+                                                       section, row, seats, ticket_type, price))
+            offset += len(seats)
+
+        self.inventory.add_tickets(itertools.chain.from_iterable(row_ranges))
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """Get a ticket by ID"""
@@ -156,57 +374,254 @@ class MLBBackend:
 
     def get_available_tickets(self, match_id: str, ticket_type: Optional[TicketType] = None) -> List[Ticket]:
         """Get all available tickets for a match"""
-        tickets = [
-            ticket for ticket in self.tickets.values()
-            if ticket.match_id == match_id and ticket.status == TicketStatus.AVAILABLE
-        ]
+        return self.inventory.get_tickets(match_id, TicketStatus.AVAILABLE, ticket_type)
+
+    def find_best_seats(self, match_id: str, count: int, ticket_type: Optional[TicketType] = None,
+                        max_price: Optional[float] = None) -> List[Ticket]:
+        """Find the best count adjacent available seats in one row of a match"""
+        return self.inventory.find_best_seats(match_id, count, ticket_type, max_price)
 
-        if ticket_type:
-            tickets = [ticket for ticket in tickets if ticket.ticket_type == ticket_type]
+    # Dynamic Pricing
+    def reprice_match(self, match_id: str, as_of: Optional[datetime.datetime] = None) -> Optional[Dict[str, Any]]:
+        """Re-price a match's available tickets from its sell-through, days to game, tiers and section demand"""
+        match = self.get_match(match_id)
+        seat_map = self.inventory.seat_maps.get(match_id)
+        if not match or not seat_map:
+            return None
 
+        as_of = as_of or datetime.datetime.now()
+        days_to_game = (match.scheduled_time - as_of).total_seconds() / 86400
+        sections = {(match_id, seat_row.section) for seat_row in seat_map.rows.values()}
+        with self.storage_mutation(), self.seat_locks.hold(sections):
+            summary = self.pricing.reprice_match(self.inventory, match_id, days_to_game)
+            # The new prices are logged, not as_of: recomputing them on replay could come out differently
+            lsn = 0
+            if self.storage:
+                lsn = self.log_mutation("match_prices", match_id,
+                                        *self.pricing.get_prices(self.inventory, match_id))
+
+        self.commit_mutation(lsn)
+        return summary
+
+    def reprice_matches(self, as_of: Optional[datetime.datetime] = None) -> List[Dict[str, Any]]:
+        """Re-price every scheduled match that has tickets and has not started"""
+        as_of = as_of or datetime.datetime.now()
+        return [self.reprice_match(match.match_id, as_of) for match in list(self.schedule.matches.values())
+                if match.status == MatchStatus.SCHEDULED and match.scheduled_time > as_of
+                and match.match_id in self.inventory.seat_maps]
+
+    def start_dynamic_pricing(self, interval_seconds: float = 900.0) -> bool:
+        """Start re-pricing upcoming matches in the background"""
+        self.pricing.interval_seconds = interval_seconds
+        return self.pricing.start()
+
+    def stop_dynamic_pricing(self) -> bool:
+        """Stop the background re-pricing"""
+        return self.pricing.stop()
+
+    def get_pricing_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of dynamic pricing metrics"""
+        return self.pricing.get_metrics()
+
+    # Waiting Rooms
+    def open_waiting_room(self, match_id: str, admission_rate: float, burst: Optional[int] = None,
+                          max_queue_depth: int = 100000, max_active: Optional[int] = None,
+                          admission_window_seconds: float = 300.0) -> Optional[WaitingRoom]:
+        """Put a match's on-sale behind a queue that admits admission_rate buyers per second"""
+        if not self.get_match(match_id):
+            return None
+
+        room = WaitingRoom(admission_rate, burst, max_queue_depth, max_active, admission_window_seconds)
+        self.waiting_rooms[match_id] = room
+        return room
+
+    def close_waiting_room(self, match_id: str) -> int:
+        """Stop queueing for a match, e.g. once it sells out; returns how many queued buyers were turned away"""
+        room = self.waiting_rooms.get(match_id)
+        return room.close() if room else 0
+
+    def join_waiting_room(self, match_id: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Join a match's queue; returns a position token, or a rejection if the queue is full"""
+        room = self.waiting_rooms.get(match_id)
+        return room.join(now) if room else None
+
+    def get_waiting_room_status(self, match_id: str, token: str,
+                                now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Get a token's place in a match's queue, or whether it has been admitted"""
+        room = self.waiting_rooms.get(match_id)
+        return room.get_status(token, now) if room else None
+
+    def is_admitted(self, match_id: str, token: Optional[str], now: Optional[float] = None) -> bool:
+        """Check that a buyer may shop for a match; matches without a waiting room admit everyone"""
+        room = self.waiting_rooms.get(match_id)
+        return room is None or (token is not None and room.is_admitted(token, now))
+
+    def get_admitted_tickets(self, match_id: str, token: Optional[str], ticket_type: Optional[TicketType] = None,
+                             now: Optional[float] = None) -> Optional[List[Ticket]]:
+        """Get a match's available tickets for an admitted buyer; None if the token is not admitted"""
+        if not self.is_admitted(match_id, token, now):
+            return None
+
+        start = time.perf_counter()
+        tickets = self.get_available_tickets(match_id, ticket_type)
+        self.record_admitted_request(match_id, time.perf_counter() - start)
         return tickets
 
+    def find_admitted_seats(self, match_id: str, token: Optional[str], count: int,
+                            ticket_type: Optional[TicketType] = None, max_price: Optional[float] = None,
+                            now: Optional[float] = None) -> Optional[List[Ticket]]:
+        """Find the best adjacent seats for an admitted buyer; None if the token is not admitted"""
+        if not self.is_admitted(match_id, token, now):
+            return None
+
+        start = time.perf_counter()
+        tickets = self.find_best_seats(match_id, count, ticket_type, max_price)
+        self.record_admitted_request(match_id, time.perf_counter() - start)
+        return tickets
+
+    def create_admitted_booking(self, token: Optional[str], customer_name: str, customer_email: str,
+                                customer_phone: str, match_id: str, ticket_ids: List[str],
+                                hold_ttl_seconds: Optional[float] = None,
+                                now: Optional[float] = None) -> Optional[Booking]:
+        """Create a booking for an admitted buyer; a successful booking ends their session"""
+        if not self.is_admitted(match_id, token, now):
+            return None
+
+        start = time.perf_counter()
+        booking = self.create_booking(customer_name, customer_email, customer_phone, match_id, ticket_ids,
+                                      hold_ttl_seconds)
+        elapsed = time.perf_counter() - start
+        room = self.waiting_rooms.get(match_id)
+        if room and booking:
+            room.complete(token, elapsed)
+        else:
+            self.record_admitted_request(match_id, elapsed)
+        return booking
+
+    def leave_waiting_room(self, match_id: str, token: str) -> bool:
+        """Give up a place in a match's queue, or end an admitted session"""
+        room = self.waiting_rooms.get(match_id)
+        return room.leave(token) if room else False
+
+    def record_admitted_request(self, match_id: str, seconds: float) -> None:
+        """Record the service time of a request made through a waiting room"""
+        room = self.waiting_rooms.get(match_id)
+        if room:
+            room.record_service_time(seconds)
+
+    def get_waiting_room_metrics(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """Return queue depth, admission counts and latency percentiles for a match's waiting room"""
+        room = self.waiting_rooms.get(match_id)
+        return room.get_metrics() if room else None
+
+    def get_sales_totals(self, match_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get ticket counts and revenue for one match, or for all matches"""
+        return self.inventory.get_sales_totals(match_id)
+
     # Booking Management
+    def get_booking_tickets(self, ticket_ids: List[str]) -> List[Ticket]:
+        """Get the tickets for a list of ticket IDs, skipping unknown IDs"""
+        tickets = [self.get_ticket(ticket_id) for ticket_id in ticket_ids]
+        return [ticket for ticket in tickets if ticket]
+
+    def get_ticket_rows(self, ticket_ids: Iterable[str]) -> List[int]:
+        """Get the store rows for ticket IDs, skipping unknown IDs"""
+        rows = [self.tickets.get_row(ticket_id) for ticket_id in ticket_ids]
+        return [row for row in rows if row is not None]
+
+    def get_held_rows(self, booking_id: str, rows: List[int]) -> List[int]:
+        """Keep the rows whose tickets are still held by a booking; caller holds their seat locks"""
+        booking_ids = self.tickets.booking_ids
+        return [row for row in rows if booking_ids.get(row) == booking_id]
+
+    def hold_seat_locks(self, tickets: List[Ticket]):
+        """Hold the lock stripes for the match sections of the given tickets"""
+        return self.seat_locks.hold((ticket.match_id, ticket.section) for ticket in tickets)
+
     def create_booking(self, customer_name: str, customer_email: str, customer_phone: str,
-                      match_id: str, ticket_ids: List[str]) -> Optional[Booking]:
-        """Create a new booking"""
+                      match_id: str, ticket_ids: List[str],
+                      hold_ttl_seconds: Optional[float] = None) -> Optional[Booking]:
+        """Create a new booking; either every requested ticket is reserved or none is"""
         match = self.get_match(match_id)
         if not match:
             return None
 
+        # Ignore repeated ticket IDs but keep the requested order
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        tickets = self.get_booking_tickets(ticket_ids)
+        if not tickets or len(tickets) != len(ticket_ids):
+            return None
+        if any(ticket.match_id != match_id for ticket in tickets):
+            return None
+
         booking_id = self.generate_booking_id()
         booking_time = datetime.datetime.now()
         booking = Booking(booking_id, customer_name, customer_email, customer_phone, match_id, booking_time)
+        ttl = self.hold_ttl_seconds if hold_ttl_seconds is None else hold_ttl_seconds
 
-        # Add tickets to booking
-        for ticket_id in ticket_ids:
-            ticket = self.get_ticket(ticket_id)
-            if ticket and ticket.status == TicketStatus.AVAILABLE:
+        # Check and reserve the whole set while holding its section locks
+        with self.storage_mutation(), self.hold_seat_locks(tickets):
+            if any(ticket.status != TicketStatus.AVAILABLE for ticket in tickets):
+                return None
+
+            for ticket in tickets:
                 booking.add_ticket(ticket)
 
-        if not booking.ticket_ids:  # No tickets were added
-            return None
+            self.bookings[booking_id] = booking
+            self.booking_index.add_booking(booking)
+            lsn = self.log_mutation("create_booking", booking_id, customer_name, customer_email, customer_phone,
+                                    match_id, ticket_ids, booking_time, ttl)
 
-        self.bookings[booking_id] = booking
+        # Release the seats if the booking is not confirmed in time
+        self.hold_timers.schedule(booking_id, time.monotonic() + ttl)
+        self.commit_mutation(lsn)
         return booking
 
     def get_booking(self, booking_id: str) -> Optional[Booking]:
         """Get a booking by ID"""
         return self.bookings.get(booking_id)
 
+    def find_bookings(self, field: str, value: str, active_only: bool = False, offset: int = 0,
+                      limit: int = 50, after: Optional[str] = None,
+                      after_time: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+        """Get a page of bookings by customer_email, customer_phone or match_id, oldest booking first"""
+        page = self.booking_index.find(field, value, active_only, offset, limit, after, after_time)
+        page["bookings"] = [self.bookings[booking_id] for booking_id in page.pop("booking_ids")]
+        return page
+
+    def get_bookings_by_email(self, customer_email: str, active_only: bool = False, offset: int = 0,
+                              limit: int = 50, after: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of a customer's bookings by email address"""
+        return self.find_bookings("customer_email", customer_email, active_only, offset, limit, after)
+
+    def get_bookings_by_phone(self, customer_phone: str, active_only: bool = False, offset: int = 0,
+                              limit: int = 50, after: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of a customer's bookings by phone number"""
+        return self.find_bookings("customer_phone", customer_phone, active_only, offset, limit, after)
+
+    def get_bookings_by_match(self, match_id: str, active_only: bool = False, offset: int = 0,
+                              limit: int = 50, after: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of the bookings for a match"""
+        return self.find_bookings("match_id", match_id, active_only, offset, limit, after)
+
     def confirm_booking(self, booking_id: str, payment_reference: str) -> bool:
         """Confirm a booking"""
         booking = self.get_booking(booking_id)
         if not booking:
             return False
 
-        # Mark all tickets as sold
-        for ticket_id in booking.ticket_ids:
-            ticket = self.get_ticket(ticket_id)
-            if ticket:
-                ticket.confirm_sale()
+        rows = self.get_ticket_rows(booking.ticket_ids)
+        with self.storage_mutation(), self.hold_seat_locks(self.tickets.get_tickets(rows)):
+            if not booking.confirm_booking(payment_reference):
+                return False
+            self.hold_timers.cancel(booking_id)
 
-        return booking.confirm_booking(payment_reference)
+            # Mark all tickets still held by this booking as sold in one pass
+            self.tickets.confirm_sales(self.get_held_rows(booking_id, rows))
+            lsn = self.log_mutation("confirm_booking", booking_id, payment_reference)
+
+        self.commit_mutation(lsn)
+        return True
 
     def cancel_booking(self, booking_id: str) -> bool:
         """Cancel a booking"""
@@ -214,75 +629,346 @@ class MLBBackend:
         if not booking:
             return False
 
-        # Release all tickets
-        for ticket_id in booking.ticket_ids:
-            ticket = self.get_ticket(ticket_id)
-            if ticket:
-                ticket.cancel_reservation()
+        rows = self.get_ticket_rows(booking.ticket_ids)
+        with self.storage_mutation(), self.hold_seat_locks(self.tickets.get_tickets(rows)):
+            if not booking.cancel_booking():
+                return False
+            self.hold_timers.cancel(booking_id)
+            self.booking_index.deactivate_booking(booking)
 
-        return booking.cancel_booking()
+            # Release all tickets still held by this booking in one pass
+            self.tickets.cancel_reservations(self.get_held_rows(booking_id, rows))
+            lsn = self.log_mutation("cancel_booking", booking_id)
 
-    # Report Generation
-    def generate_player_stats_report(self, output_file: str, team_id: Optional[str] = None) -> bool:
-        """Generate a player statistics report"""
-        players_to_include = []
+        self.commit_mutation(lsn)
+        return True
 
-        if team_id:
-            players_to_include = self.get_players_by_team(team_id)
+    def refund_tickets(self, booking_id: str, ticket_ids: List[str]) -> int:
+        """Release some of a pending or confirmed booking's tickets; returns how many were refunded"""
+        booking = self.get_booking(booking_id)
+        if not booking:
+            return 0
+
+        ticket_ids = [ticket_id for ticket_id in dict.fromkeys(ticket_ids) if booking.has_ticket(ticket_id)]
+        rows = self.get_ticket_rows(ticket_ids)
+        with self.storage_mutation(), self.hold_seat_locks(self.tickets.get_tickets(rows)):
+            if booking.status not in (BookingStatus.PENDING, BookingStatus.CONFIRMED):
+                return 0
+
+            rows = self.get_held_rows(booking_id, rows)
+            amount = sum(self.tickets.get_price(row) for row in rows)
+            self.tickets.cancel_reservations(rows)
+            refunded = booking.discard_tickets(ticket_ids, amount)
+            if not refunded:
+                return 0
+            lsn = self.log_mutation("refund_tickets", booking_id, refunded)
+
+        self.commit_mutation(lsn)
+        return len(refunded)
+
+    # Reservation Hold Expiry
+    def expire_bookings(self, booking_ids: List[str]) -> int:
+        """Expire a batch of pending bookings and release their tickets"""
+        expired = 0
+        lsn = 0
+        for booking_id in booking_ids:
+            booking = self.get_booking(booking_id)
+            if not booking:
+                continue
+
+            rows = self.get_ticket_rows(booking.ticket_ids)
+            with self.storage_mutation(), self.hold_seat_locks(self.tickets.get_tickets(rows)):
+                if not booking.expire_booking():
+                    continue
+                self.booking_index.deactivate_booking(booking)
+                self.tickets.cancel_reservations(self.get_held_rows(booking_id, rows))
+                lsn = self.log_mutation("expire_booking", booking_id)
+            expired += 1
+
+        # One commit covers the whole batch
+        self.commit_mutation(lsn)
+        return expired
+
+    def expire_holds(self, now: Optional[float] = None) -> int:
+        """Expire all holds due at a monotonic time (defaults to now)"""
+        return self.hold_expiry.run_once(now)
+
+    def start_hold_expiry(self, interval_seconds: float = 1.0) -> bool:
+        """Start expiring holds in the background"""
+        self.hold_expiry.interval_seconds = interval_seconds
+        return self.hold_expiry.start()
+
+    def stop_hold_expiry(self) -> bool:
+        """Stop the background hold expiry"""
+        return self.hold_expiry.stop()
+
+    def get_hold_expiry_metrics(self) -> Dict[str, Any]:
+        """Get hold expiry metrics, including holds expired per second"""
+        return self.hold_expiry.get_metrics()
+
+    # Persistence: write-ahead log of mutations plus periodic snapshots
+    def open_storage(self, directory: str, sync: bool = True,
+                     snapshot_interval_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Recover any saved state from a data directory, then log every mutation to it.
+
+        Call on a freshly created backend. Returns recovery metrics.
+        """
+        if self.storage:
+            raise ValueError(f"Storage already open: {self.storage.directory}")
+
+        storage = DurableStore(directory, self.get_storage_state, self.restore_storage_state,
+                               self.apply_log_record, sync)
+        recovery = storage.recover()
+        self.storage = storage
+        if snapshot_interval_seconds:
+            storage.start(snapshot_interval_seconds)
+        return recovery
+
+    def snapshot_storage(self) -> Dict[str, Any]:
+        """Write a snapshot now, so recovery only replays records logged after it"""
+        if not self.storage:
+            return {}
+        return self.storage.snapshot()
+
+    def close_storage(self) -> bool:
+        """Flush the log and stop persisting mutations"""
+        if not self.storage:
+            return False
+
+        self.storage.close()
+        self.storage = None
+        return True
+
+    def get_storage_metrics(self) -> Dict[str, Any]:
+        """Get write-ahead log, snapshot and recovery metrics"""
+        if not self.storage:
+            return {}
+        return self.storage.get_metrics()
+
+    def storage_mutation(self):
+        """Context manager held around a logged mutation, so snapshots never split one"""
+        if not self.storage:
+            return nullcontext()
+        return self.storage.mutation()
+
+    def log_mutation(self, operation: str, *arguments) -> int:
+        """Append a mutation record to the log; returns its LSN, or 0 when nothing is logged"""
+        if not self.storage:
+            return 0
+        return self.storage.log(operation, *arguments)
+
+    def commit_mutation(self, lsn: int) -> None:
+        """Wait until a logged mutation is durable"""
+        if lsn and self.storage:
+            self.storage.commit(lsn)
+
+    def log_match_state(self, match: Match) -> None:
+        """Log a match's score, inning and status after Schedule.update_match changes it"""
+        lsn = self.log_mutation("match_state", match.match_id, match.status, match.home_team_score,
+                                match.away_team_score, match.current_inning, match.is_inning_top,
+                                match.attendance, match.weather)
+        self.commit_mutation(lsn)
+
+    def log_ticket_price(self, store_row: int, price: float) -> None:
+        """Log a list price set through Ticket.price"""
+        lsn = self.log_mutation("ticket_price", self.tickets.get_ticket_id(store_row), price)
+        self.commit_mutation(lsn)
+
+    def log_player_stats(self, player_ids: List[str]) -> None:
+        """Log the current stats of players whose stats changed"""
+        if not self.storage:
+            return
+
+        names = self.player_stats.BATTING_COLUMNS + self.player_stats.PITCHING_COLUMNS + self.player_stats.RATE_COLUMNS
+        stats = {}
+        for player_id in player_ids:
+            player = self.players.get(player_id)
+            if player:
+                stats[player_id] = tuple(getattr(player, name) for name in names)
+        self.commit_mutation(self.log_mutation("player_stats", stats))
+
+    def get_id_allocators(self) -> Dict[str, IdAllocator]:
+        """Get the ID allocators by name"""
+        return {
+            "team": self.team_id_allocator,
+            "player": self.player_id_allocator,
+            "match": self.match_id_allocator,
+            "ticket": self.ticket_id_allocator,
+            "booking": self.booking_id_allocator
+        }
+
+    def get_next_ids(self) -> Dict[str, int]:
+        """Get the next number each ID allocator will hand out"""
+        return {name: allocator.next_number for name, allocator in self.get_id_allocators().items()}
+
+    def get_storage_state(self) -> Dict[str, Any]:
+        """Get everything a snapshot holds; called with all logged mutations paused"""
+        return {
+            "id_allocators": self.get_next_ids(),
+            "teams": [{key: value for key, value in vars(team).items() if key != "roster"}
+                      for team in self.teams.values()],
+            "players": [{key: value for key, value in vars(player).items() if key != "stats_table"}
+                        for player in self.players.values()],
+            "matches": [vars(match) for match in self.schedule.matches.values()],
+            # The store pickles with its seat maps and counters, so recovery needs no reindexing
+            "tickets": self.tickets,
+            "bookings": list(self.bookings.values())
+        }
+
+    def restore_storage_state(self, state: Dict[str, Any]) -> None:
+        """Load the state of a snapshot into this (fresh) backend"""
+        allocators = self.get_id_allocators()
+        for name, next_number in state["id_allocators"].items():
+            allocators[name].advance_past(next_number - 1)
+
+        for fields in state["teams"]:
+            team = Team(fields["team_id"], fields["name"], fields["city"], fields["stadium"], fields["division"])
+            vars(team).update(fields)
+            self.teams[team.team_id] = team
+
+        for fields in state["players"]:
+            player = Player(fields["player_id"], fields["name"], fields["team_id"], fields["position"],
+                            fields["jersey_number"])
+            vars(player).update(fields)
+            self.players[player.player_id] = player
+            self.player_stats.add_player(player)
+            self.teams[player.team_id].add_player(player)
+
+        for fields in state["matches"]:
+            match = Match(fields["match_id"], fields["home_team_id"], fields["away_team_id"], fields["venue"],
+                          fields["scheduled_time"])
+            vars(match).update(fields)
+            self.schedule.add_match(match)
+        self.standings.rebuild(self.schedule.matches.values())
+
+        self.tickets = state["tickets"]
+        self.tickets.listeners.append(self.log_ticket_price)
+        self.inventory = self.tickets.inventory
+
+        # Holds restart with a full TTL; the monotonic deadlines did not survive the restart
+        for booking in state["bookings"]:
+            self.bookings[booking.booking_id] = booking
+            self.booking_index.add_booking(booking)
+            if booking.status == BookingStatus.PENDING:
+                self.hold_timers.schedule(booking.booking_id, time.monotonic() + self.hold_ttl_seconds)
+
+    def apply_log_record(self, operation: str, arguments: tuple) -> None:
+        """Replay one logged mutation during recovery"""
+        if operation == "add_team":
+            team_id, name, city, stadium, division = arguments
+            self.team_id_allocator.advance_past(self.team_id_allocator.parse_id(team_id))
+            self.teams[team_id] = Team(team_id, name, city, stadium, division)
+            self.standings.invalidate_division(division)
+        elif operation == "add_player":
+            player_id, name, team_id, position, jersey_number = arguments
+            self.player_id_allocator.advance_past(self.player_id_allocator.parse_id(player_id))
+            player = Player(player_id, name, team_id, position, jersey_number)
+            self.players[player_id] = player
+            self.player_stats.add_player(player)
+            self.teams[team_id].add_player(player)
+        elif operation == "add_match":
+            match_id, home_team_id, away_team_id, venue, scheduled_time = arguments
+            self.match_id_allocator.advance_past(self.match_id_allocator.parse_id(match_id))
+            self.schedule.add_match(Match(match_id, home_team_id, away_team_id, venue, scheduled_time))
+        elif operation == "add_tickets":
+            match_id, first_number, section, row, seats, ticket_type, price = arguments
+            ticket_numbers = range(first_number, first_number + len(seats))
+            self.ticket_id_allocator.advance_past(ticket_numbers[-1])
+            store_rows = self.tickets.add_tickets(ticket_numbers, match_id, section, row, seats, ticket_type, price)
+            self.inventory.add_tickets(store_rows)
+        elif operation == "load_seat_map":
+            match_id, first_number, venue, blocks = arguments
+            seat_map = SeatMap(venue)
+            seat_map.blocks = blocks
+            ticket_numbers = range(first_number, first_number + seat_map.get_seat_count())
+            self.ticket_id_allocator.advance_past(ticket_numbers[-1])
+            self.add_seat_map_tickets(match_id, seat_map, ticket_numbers)
+        elif operation == "create_booking":
+            booking_id, customer_name, customer_email, customer_phone, match_id, ticket_ids, booking_time, ttl = arguments
+            self.booking_id_allocator.advance_past(self.booking_id_allocator.parse_id(booking_id))
+            booking = Booking(booking_id, customer_name, customer_email, customer_phone, match_id, booking_time)
+            for ticket in self.get_booking_tickets(ticket_ids):
+                booking.add_ticket(ticket)
+            self.bookings[booking_id] = booking
+            self.booking_index.add_booking(booking)
+            self.hold_timers.schedule(booking_id, time.monotonic() + ttl)
+        elif operation == "confirm_booking":
+            self.confirm_booking(*arguments)
+        elif operation == "cancel_booking":
+            self.cancel_booking(*arguments)
+        elif operation == "refund_tickets":
+            self.refund_tickets(*arguments)
+        elif operation == "expire_booking":
+            self.expire_bookings(list(arguments))
+        elif operation == "match_prices":
+            match_id, ticket_numbers, prices = arguments
+            self.pricing.set_prices(self.inventory, match_id, ticket_numbers, prices)
+        elif operation == "ticket_price":
+            ticket_id, price = arguments
+            self.tickets.set_price(self.tickets.get_row(ticket_id), price)
+        elif operation == "match_state":
+            match_id, status, home_score, away_score, inning, is_top, attendance, weather = arguments
+            self.schedule.update_match(match_id, status=status, score=(home_score, away_score),
+                                       inning=(inning, is_top), attendance=attendance, weather=weather)
+        elif operation == "player_stats":
+            names = (self.player_stats.BATTING_COLUMNS + self.player_stats.PITCHING_COLUMNS
+                     + self.player_stats.RATE_COLUMNS)
+            for player_id, values in arguments[0].items():
+                player = self.players.get(player_id)
+                if player:
+                    for name, value in zip(names, values):
+                        setattr(player, name, value)
+                    self.player_stats.sync_from_player(player)
         else:
-            players_to_include = list(self.players.values())
+            raise ValueError(f"Unknown log record: {operation}")
 
-        if not players_to_include:
+    # Report Generation
+    def generate_player_stats_report(self, output_file: str, team_id: Optional[str] = None,
+                                     output_format: str = "json", compress: Optional[bool] = None) -> bool:
+        """Generate a player statistics report, streaming one player at a time.
+
+        Players are read from a snapshot of the stats table, so box scores
+        applied while the report is written neither wait for it nor tear it.
+        """
+        snapshot = self.player_stats.get_snapshot()
+        rows = snapshot.get_rows(team_id)
+
+        if not rows:
             return False
 
-        # Create a threaded report generator
-        def thread_task():
-            report = {
-                "report_type": "Player Statistics",
-                "generated_at": datetime.datetime.now().isoformat(),
-                "player_count": len(players_to_include),
-                "team_id": team_id if team_id else "All Teams",
-                "players": [player.get_stats() for player in players_to_include]
-            }
-
-            with open(output_file, 'w') as file:
-                json.dump(report, file, indent=2)
-
-        # Run the report generation in a separate thread
-        report_thread = threading.Thread(target=thread_task)
-        report_thread.start()
-
-        # Wait for completion
-        report_thread.join()
+        header = {
+            "report_type": "Player Statistics",
+            "generated_at": datetime.datetime.now().isoformat(),
+            "player_count": len(rows),
+            "team_id": team_id if team_id else "All Teams"
+        }
+
+        writer = StreamingReportWriter(output_file, output_format, compress,
+                                       self.report_cache.get_digest(output_file))
+        writer.write_report(header, "players", (snapshot.get_stats(row) for row in rows))
+        self.report_cache.record_digest(output_file, writer.digest, writer.replaced)
         return True
 
-    def generate_team_schedule_report(self, team_id: str, output_file: str) -> bool:
-        """Generate a team's schedule report"""
+    def generate_team_schedule_report(self, team_id: str, output_file: str,
+                                      output_format: str = "json", compress: Optional[bool] = None) -> bool:
+        """Generate a team's schedule report, streaming one match at a time from a snapshot of its matches"""
         team = self.get_team(team_id)
         if not team:
             return False
 
-        matches = self.schedule.get_matches_by_team(team_id)
-
-        # Create a threaded report generator
-        def thread_task():
-            report = {
-                "report_type": "Team Schedule",
-                "generated_at": datetime.datetime.now().isoformat(),
-                "team": team.get_team_details(),
-                "match_count": len(matches),
-                "matches": [match.get_match_details() for match in matches]
-            }
+        matches = self.schedule.get_team_match_details(team_id)
 
-            with open(output_file, 'w') as file:
-                json.dump(report, file, indent=2)
+        header = {
+            "report_type": "Team Schedule",
+            "generated_at": datetime.datetime.now().isoformat(),
+            "team": team.get_team_details(),
+            "match_count": len(matches)
+        }
 
-        # Run the report generation in a separate thread
-        report_thread = threading.Thread(target=thread_task)
-        report_thread.start()
-
-        # Wait for completion
-        report_thread.join()
+        writer = StreamingReportWriter(output_file, output_format, compress,
+                                       self.report_cache.get_digest(output_file))
+        writer.write_report(header, "matches", matches)
+        self.report_cache.record_digest(output_file, writer.digest, writer.replaced)
         return True
 
     def generate_ticket_sales_report(self, match_id: Optional[str] = None, output_file: str = None) -> bool:
@@ -292,81 +978,80 @@ class MLBBackend:
             if not match:
                 return False
 
-        # Create a threaded report generator
-        def thread_task():
-            # Filter tickets based on match_id if provided
-            match_tickets = [
-                ticket for ticket in self.tickets.values()
-                if not match_id or ticket.match_id == match_id
-            ]
-
-            # Count tickets by status
-            available_count = sum(1 for ticket in match_tickets if ticket.status == TicketStatus.AVAILABLE)
-            reserved_count = sum(1 for ticket in match_tickets if ticket.status == TicketStatus.RESERVED)
-            sold_count = sum(1 for ticket in match_tickets if ticket.status == TicketStatus.SOLD)
-
-            # Calculate revenue
-            revenue = sum(ticket.price for ticket in match_tickets if ticket.status == TicketStatus.SOLD)
-
-            report = {
-                "report_type": "Ticket Sales",
-                "generated_at": datetime.datetime.now().isoformat(),
-                "match_id": match_id if match_id else "All Matches",
-                "total_tickets": len(match_tickets),
-                "available_tickets": available_count,
-                "reserved_tickets": reserved_count,
-                "sold_tickets": sold_count,
-                "revenue": revenue
-            }
-
-            with open(output_file, 'w') as file:
-                json.dump(report, file, indent=2)
-
-        # Run the report generation in a separate thread
-        report_thread = threading.Thread(target=thread_task)
-        report_thread.start()
-
-        # Wait for completion
-        report_thread.join()
-        return True
+        report = {
+            "report_type": "Ticket Sales",
+            "generated_at": datetime.datetime.now().isoformat(),
+            "match_id": match_id if match_id else "All Matches"
+        }
+        report.update(self.get_sales_totals(match_id))
 
-    def generate_all_reports(self, output_dir: str) -> bool:
-        """Generate all reports in parallel"""
-        # Create threads for each report
-        threads = []
-
-        # Player stats report - all teams
-        player_stats_thread = threading.Thread(
-            target=self.generate_player_stats_report,
-            args=(f"{output_dir}/player_stats_all.json", None)
-        )
-        threads.append(player_stats_thread)
-
-        # Team schedule reports - one per team
-        for team_id, team in self.teams.items():
-            team_schedule_thread = threading.Thread(
-                target=self.generate_team_schedule_report,
-                args=(team_id, f"{output_dir}/schedule_{team_id}.json")
-            )
-            threads.append(team_schedule_thread)
-
-        # Ticket sales report - all matches
-        ticket_sales_thread = threading.Thread(
-            target=self.generate_ticket_sales_report,
-            args=(None, f"{output_dir}/ticket_sales_all.json")
-        )
-        threads.append(ticket_sales_thread)
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        with open(output_file, 'w') as file:
+            json.dump(report, file, indent=2)
+        return True
 
+    # Report Jobs: reports run asynchronously on a bounded worker pool
+    def submit_player_stats_report(self, output_file: str, team_id: Optional[str] = None,
+                                   output_format: str = "json", compress: Optional[bool] = None) -> ReportJob:
+        """Queue a player statistics report"""
+        return self.report_jobs.submit("Player Statistics", self.generate_player_stats_report,
+                                       output_file, team_id, output_format, compress)
+
+    def submit_team_schedule_report(self, team_id: str, output_file: str,
+                                    output_format: str = "json", compress: Optional[bool] = None) -> ReportJob:
+        """Queue a team's schedule report"""
+        return self.report_jobs.submit(f"Team Schedule {team_id}", self.generate_team_schedule_report,
+                                       team_id, output_file, output_format, compress)
+
+    def submit_ticket_sales_report(self, match_id: Optional[str] = None, output_file: str = None) -> ReportJob:
+        """Queue a ticket sales report"""
+        return self.report_jobs.submit("Ticket Sales", self.generate_ticket_sales_report, match_id, output_file)
+
+    def submit_all_reports(self, output_dir: str, force: bool = False) -> List[ReportJob]:
+        """Queue every report whose inputs changed since it was last written, or every report if forced"""
+        reports = [("Player Statistics", f"{output_dir}/player_stats_all.json",
+                    ("players", self.player_stats.version), self.generate_player_stats_report, {"team_id": None})]
+        for team_id, team in list(self.teams.items()):
+            reports.append((f"Team Schedule {team_id}", f"{output_dir}/schedule_{team_id}.json",
+                            (team.get_team_details(), self.schedule.get_team_version(team_id)),
+                            self.generate_team_schedule_report, {"team_id": team_id}))
+        reports.append(("Ticket Sales", f"{output_dir}/ticket_sales_all.json", self.get_sales_totals(),
+                        self.generate_ticket_sales_report, {"match_id": None}))
+
+        jobs = []
+        for report_name, output_file, inputs, generate, arguments in reports:
+            if force or not self.report_cache.is_current(output_file, inputs):
+                jobs.append(self.report_jobs.submit(report_name, self.generate_cached_report, output_file, inputs,
+                                                    generate, **arguments))
+        return jobs
+
+    def generate_cached_report(self, output_file: str, inputs: Any, generate, **arguments) -> bool:
+        """Generate a report and remember the inputs it was built from.
+
+        Inputs are taken before the report reads its data, so a change made
+        while it runs leaves the report due again on the next run.
+        """
+        if not generate(output_file=output_file, **arguments):
+            return False
+        self.report_cache.record_inputs(output_file, inputs)
         return True
 
+    def get_report_job(self, job_id: str) -> Optional[ReportJob]:
+        """Get a report job by ID"""
+        return self.report_jobs.get_job(job_id)
+
+    def cancel_report_job(self, job_id: str) -> bool:
+        """Cancel a report job that has not started yet"""
+        return self.report_jobs.cancel(job_id)
+
+    def get_report_cache_metrics(self) -> Dict[str, Any]:
+        """Return how many reports were skipped, generated, or generated without changing their file"""
+        return self.report_cache.get_metrics()
+
+    def generate_all_reports(self, output_dir: str, timeout: Optional[float] = None, force: bool = False) -> bool:
+        """Generate, in parallel on the report worker pool, every report whose inputs changed"""
+        jobs = self.submit_all_reports(output_dir, force)
+        return self.report_jobs.wait_for(jobs, timeout)
+
 
 # Demo function to test the MLB Backend system
 def run_mlb_system_demo():
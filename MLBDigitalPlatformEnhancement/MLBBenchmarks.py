@@ -0,0 +1,795 @@
+import threading
+import asyncio
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import random
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import List, Dict, Any, Optional, Iterator
+
+from MLBDigitalPlatformEnhancement.BookingStatus import BookingStatus
+from MLBDigitalPlatformEnhancement.LiveScoreSubscription import LiveScoreSubscription
+from MLBDigitalPlatformEnhancement.MLBBackend import MLBBackend
+from MLBDigitalPlatformEnhancement.Match import Match
+from MLBDigitalPlatformEnhancement.MatchStatus import MatchStatus
+from MLBDigitalPlatformEnhancement.Position import Position
+from MLBDigitalPlatformEnhancement.SeatMap import SeatMap
+from MLBDigitalPlatformEnhancement.ShardRouter import ShardRouter
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+def build_benchmark_seat_map(venue: str, seat_count: int) -> SeatMap:
+    """Build a venue of 500-seat sections (25 rows x 20 seats) with price tiers by section"""
+    seat_map = SeatMap(venue)
+    rows = [str(row) for row in range(1, 26)]
+    section_count = max(1, seat_count // 500)
+    for section_number in range(1, section_count + 1):
+        if section_number <= section_count // 10:
+            ticket_type, price = TicketType.PREMIUM, 150.0
+        elif section_number <= section_count // 2:
+            ticket_type, price = TicketType.RESERVED, 75.0
+        else:
+            ticket_type, price = TicketType.GENERAL, 30.0
+        seat_map.add_block(f"S{section_number:03d}", rows, 1, 20, ticket_type, price)
+    return seat_map
+
+
+# Benchmark for bulk seat-map ingestion across a home schedule
+def run_seat_map_benchmark(seat_count: int = 50000, home_games: int = 81,
+                           concurrent_loads: int = 8) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    seat_map = build_benchmark_seat_map(home_team.stadium, seat_count)
+
+    first_game = datetime.datetime(2026, 4, 1, 19, 5)
+    matches = [
+        mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                      first_game + datetime.timedelta(days=2 * game))
+        for game in range(home_games)
+    ]
+
+    start = time.perf_counter()
+    tickets_loaded = sum(mlb.load_seat_map(match.match_id, seat_map) for match in matches)
+    elapsed = time.perf_counter() - start
+
+    # Maps loaded from several threads at once interleave their store rows;
+    # each match must still index exactly its own seats
+    concurrent_matches = [
+        mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                      first_game + datetime.timedelta(days=2 * (home_games + game)))
+        for game in range(concurrent_loads)
+    ]
+    barrier = threading.Barrier(concurrent_loads)
+
+    def load_task(match_id: str):
+        barrier.wait()
+        mlb.load_seat_map(match_id, seat_map)
+
+    threads = [threading.Thread(target=load_task, args=(match.match_id,)) for match in concurrent_matches]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    match_counts = [mlb.get_sales_totals(match.match_id)["total_tickets"] for match in matches + concurrent_matches]
+    if set(match_counts) != {seat_map.get_seat_count()} or sum(match_counts) != len(mlb.tickets):
+        raise RuntimeError(f"Seat maps were indexed under the wrong matches: per-match counts "
+                           f"{min(match_counts)}-{max(match_counts)}, {len(mlb.tickets)} tickets stored")
+
+    result = {
+        "venue_seats": seat_map.get_seat_count(),
+        "home_games": home_games,
+        "tickets_loaded": tickets_loaded,
+        "seconds": round(elapsed, 3),
+        "tickets_per_second": int(tickets_loaded / elapsed) if elapsed > 0 else 0,
+        "concurrent_loads": concurrent_loads
+    }
+    print(f"Loaded {tickets_loaded} tickets for {home_games} games in {elapsed:.2f}s "
+          f"({result['tickets_per_second']} tickets/second)")
+    return result
+
+
+# Multi-threaded stress test: buyers racing for overlapping seats must never oversell
+def run_booking_stress_test(buyer_threads: int = 16, attempts_per_buyer: int = 500,
+                            seat_count: int = 2000, seats_per_booking: int = 4) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                          datetime.datetime(2026, 4, 1, 19, 5))
+    mlb.load_seat_map(match.match_id, build_benchmark_seat_map(home_team.stadium, seat_count))
+    ticket_ids = [ticket.ticket_id for ticket in mlb.get_available_tickets(match.match_id)]
+
+    def buyer_task(buyer_number: int):
+        rng = random.Random(buyer_number)
+        for _ in range(attempts_per_buyer):
+            # Neighbouring seat runs overlap between buyers and sometimes span two sections
+            first = rng.randrange(len(ticket_ids) - seats_per_booking)
+            booking = mlb.create_booking(f"Buyer {buyer_number}", f"buyer{buyer_number}@example.com",
+                                         "555-0100", match.match_id,
+                                         ticket_ids[first:first + seats_per_booking])
+            if not booking:
+                continue
+            action = rng.random()
+            if action < 0.3:
+                mlb.cancel_booking(booking.booking_id)
+            elif action < 0.6:
+                mlb.confirm_booking(booking.booking_id, f"PAY-{booking.booking_id}")
+
+    # Switch threads as often as possible to maximise interleaving
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    start = time.perf_counter()
+    try:
+        threads = [threading.Thread(target=buyer_task, args=(number,)) for number in range(buyer_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    elapsed = time.perf_counter() - start
+
+    # Every held ticket must belong to exactly one live booking, and vice versa
+    holders: Dict[str, int] = {}
+    for booking in mlb.bookings.values():
+        if booking.status == BookingStatus.CANCELLED:
+            continue
+        for ticket_id in booking.ticket_ids:
+            holders[ticket_id] = holders.get(ticket_id, 0) + 1
+
+    oversold = sum(1 for count in holders.values() if count > 1)
+    mismatched = sum(
+        1 for ticket_id in ticket_ids
+        if (mlb.get_ticket(ticket_id).status == TicketStatus.AVAILABLE) == (ticket_id in holders)
+    )
+    totals = mlb.inventory.get_sales_totals(match.match_id)
+
+    result = {
+        "attempts": buyer_threads * attempts_per_buyer,
+        "bookings": len(mlb.bookings),
+        "seconds": round(elapsed, 3),
+        "oversold_tickets": oversold,
+        "mismatched_tickets": mismatched,
+        "counters_consistent": totals["reserved_tickets"] + totals["sold_tickets"] == len(holders)
+    }
+    print(f"{result['attempts']} booking attempts, {result['bookings']} bookings in {elapsed:.2f}s: "
+          f"{oversold} oversold, {mismatched} mismatched")
+    if oversold or mismatched or not result["counters_consistent"]:
+        raise AssertionError(f"Booking stress test failed: {oversold} tickets oversold, {mismatched} tickets "
+                             f"mismatched, counters consistent: {result['counters_consistent']}")
+    return result
+
+
+# Benchmark for best-available seat searches on a mostly sold stadium
+def run_best_seats_benchmark(seat_count: int = 50000, sold_fraction: float = 0.9,
+                             queries: int = 1000) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                          datetime.datetime(2026, 4, 1, 19, 5))
+    mlb.load_seat_map(match.match_id, build_benchmark_seat_map(home_team.stadium, seat_count))
+
+    rng = random.Random(1)
+    for ticket in mlb.get_available_tickets(match.match_id):
+        if rng.random() < sold_fraction:
+            ticket.reserve_ticket("BENCHMARK")
+
+    searches = [(2, None, None), (4, None, None), (4, TicketType.GENERAL, None),
+                (2, TicketType.PREMIUM, None), (6, None, 50.0), (20, None, None)]
+    start = time.perf_counter()
+    for query in range(queries):
+        count, ticket_type, max_price = searches[query % len(searches)]
+        mlb.find_best_seats(match.match_id, count, ticket_type, max_price)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "venue_seats": seat_count,
+        "sold_fraction": sold_fraction,
+        "queries": queries,
+        "microseconds_per_query": round(elapsed / queries * 1_000_000, 1)
+    }
+    print(f"{queries} best-seat searches: {result['microseconds_per_query']} us/query")
+    return result
+
+
+# Memory benchmark: columnar ticket store against one Python object per ticket
+def run_ticket_memory_benchmark(seat_count: int = 45000, home_games: int = 10,
+                                season_games: int = 81) -> Dict[str, Any]:
+    class PerObjectTicket:
+        # The per-object layout tickets used before the columnar store
+        def __init__(self, ticket_id, match_id, section, row, seat, ticket_type, price):
+            self.ticket_id = ticket_id
+            self.match_id = match_id
+            self.section = section
+            self.row = row
+            self.seat = seat
+            self.ticket_type = ticket_type
+            self.price = price
+            self.status = TicketStatus.AVAILABLE
+            self.booking_id = None
+
+    seat_map = build_benchmark_seat_map("Home Park", seat_count)
+    match_ids = [f"M{game + 1:04d}" for game in range(home_games)]
+
+    tracemalloc.start()
+    per_object_tickets = {}
+    number = 1
+    for match_id in match_ids:
+        for section, row, seat, ticket_type, price in seat_map.iter_seats():
+            ticket_id = f"TK{number:06d}"
+            per_object_tickets[ticket_id] = PerObjectTicket(ticket_id, match_id, section, row, seat,
+                                                            ticket_type, price)
+            number += 1
+    per_object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    ticket_count = len(per_object_tickets)
+    del per_object_tickets
+
+    tracemalloc.start()
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    first_game = datetime.datetime(2026, 4, 1, 19, 5)
+    for game in range(home_games):
+        match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                              first_game + datetime.timedelta(days=2 * game))
+        mlb.load_seat_map(match.match_id, seat_map)
+    columnar_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_object_per_ticket = per_object_bytes / ticket_count
+    columnar_per_ticket = columnar_bytes / ticket_count
+    season_tickets = seat_count * season_games
+    result = {
+        "tickets": ticket_count,
+        "per_object_bytes_per_ticket": round(per_object_per_ticket, 1),
+        "columnar_bytes_per_ticket": round(columnar_per_ticket, 1),
+        "per_object_season_mb": round(per_object_per_ticket * season_tickets / 2 ** 20, 1),
+        "columnar_season_mb": round(columnar_per_ticket * season_tickets / 2 ** 20, 1),
+        "reduction": round(per_object_per_ticket / columnar_per_ticket, 1)
+    }
+    print(f"{ticket_count} tickets: {result['per_object_bytes_per_ticket']} bytes/ticket per object, "
+          f"{result['columnar_bytes_per_ticket']} bytes/ticket columnar ({result['reduction']}x); "
+          f"projected {season_games}-game season: {result['per_object_season_mb']} MB vs "
+          f"{result['columnar_season_mb']} MB")
+    return result
+
+
+# Play-by-play benchmark: synthetic games fed through the ingestion pipeline
+def generate_play_by_play_feed(matches: List[Match], lineups: Dict[str, List[str]],
+                               pitchers: Dict[str, str], plays_per_game: int = 300,
+                               seed: int = 1) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    outcomes = ["out"] * 10 + ["strikeout"] * 5 + ["single"] * 4 + ["walk"] * 2 + ["double", "home_run"]
+    for match in matches:
+        yield {"type": "game_start", "match_id": match.match_id}
+        score = {match.home_team_id: 0, match.away_team_id: 0}
+        for play in range(plays_per_game):
+            inning = play * 9 // plays_per_game + 1
+            is_top = play % 2 == 0
+            batting_team, fielding_team = ((match.away_team_id, match.home_team_id) if is_top
+                                           else (match.home_team_id, match.away_team_id))
+            outcome = rng.choice(outcomes)
+            runs = 1 if outcome == "home_run" else int(outcome == "double" and rng.random() < 0.3)
+            score[batting_team] += runs
+            yield {"type": outcome, "match_id": match.match_id,
+                   "batter_id": rng.choice(lineups[batting_team]), "pitcher_id": pitchers[fielding_team],
+                   "rbi": runs, "inning": inning, "is_top": is_top,
+                   "home_score": score[match.home_team_id], "away_score": score[match.away_team_id]}
+        home_won = score[match.home_team_id] >= score[match.away_team_id]
+        yield {"type": "game_end", "match_id": match.match_id,
+               "winning_pitcher_id": pitchers[match.home_team_id if home_won else match.away_team_id],
+               "losing_pitcher_id": pitchers[match.away_team_id if home_won else match.home_team_id]}
+
+
+def run_play_by_play_benchmark(games: int = 100, plays_per_game: int = 300, batch_size: int = 1000,
+                               queue_size: int = 10000) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    teams = [mlb.add_team(f"Team {number}", f"City {number}", f"Park {number}", "AL East")
+             for number in range(1, 31)]
+    lineups = {team.team_id: [mlb.add_player(f"Batter {team.team_id}-{slot}", team.team_id,
+                                             Position.DESIGNATED_HITTER, slot).player_id
+                              for slot in range(1, 10)]
+               for team in teams}
+    pitchers = {team.team_id: mlb.add_player(f"Pitcher {team.team_id}", team.team_id,
+                                             Position.PITCHER, 50).player_id
+                for team in teams}
+    first_game = datetime.datetime(2026, 4, 1, 19, 5)
+    matches = [mlb.add_match(teams[game % 30].team_id, teams[(game + 1) % 30].team_id, "Park",
+                             first_game + datetime.timedelta(hours=game))
+               for game in range(games)]
+
+    # Generator feed, then the same feed from an NDJSON file
+    result = {"generator": mlb.ingest_play_by_play(
+        generate_play_by_play_feed(matches, lineups, pitchers, plays_per_game), batch_size, queue_size)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "play_by_play.ndjson")
+        with open(path, 'w', encoding='utf-8') as file:
+            for event in generate_play_by_play_feed(matches, lineups, pitchers, plays_per_game):
+                file.write(json.dumps(event, separators=(',', ':')))
+                file.write("\n")
+        result["ndjson_file"] = mlb.ingest_play_by_play(path, batch_size, queue_size)
+
+    for source, metrics in result.items():
+        print(f"{source}: {metrics['events_received']} events in {metrics['elapsed_seconds']}s "
+              f"({metrics['events_per_second']} events/s, {metrics['batches']} batches, "
+              f"producer blocked {metrics['producer_blocked_seconds']}s)")
+    return result
+
+
+# Live score fan-out benchmark: one publisher, many local subscribers, half of them slow
+def run_live_score_benchmark(subscriber_count: int = 20000, match_count: int = 15,
+                             updates: int = 2000) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    teams = [mlb.add_team(f"Team {number}", f"City {number}", f"Park {number}", "AL East")
+             for number in range(1, 31)]
+    first_game = datetime.datetime(2026, 4, 1, 19, 5)
+    matches = [mlb.add_match(teams[2 * game].team_id, teams[2 * game + 1].team_id, teams[2 * game].stadium,
+                             first_game)
+               for game in range(match_count)]
+
+    async def subscriber(subscription: LiveScoreSubscription, received: List[int]):
+        async for frame in subscription:
+            received[0] += 1
+
+    async def benchmark() -> Dict[str, Any]:
+        rng = random.Random(1)
+        subscriptions = [mlb.subscribe_live_scores([matches[number % match_count].match_id])
+                         for number in range(subscriber_count)]
+        received = [0]
+        # Even subscribers keep up; odd ones never read until the end
+        tasks = [asyncio.create_task(subscriber(subscription, received))
+                 for subscription in subscriptions[::2]]
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        for update in range(updates):
+            match = matches[rng.randrange(match_count)]
+            mlb.schedule.update_match(match.match_id,
+                                      score=(match.home_team_score + rng.random() < 0.3, match.away_team_score),
+                                      inning=(update * 9 // updates + 1, update % 2 == 0))
+            if update % 100 == 99:
+                await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        while any(subscription.pending_count() for subscription in subscriptions[::2]):
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        metrics = mlb.get_live_score_metrics()
+        slow_pending = max(subscription.pending_count() for subscription in subscriptions[1::2])
+        for subscription in subscriptions:
+            subscription.close()
+        await asyncio.gather(*tasks)
+
+        return {
+            "subscribers": subscriber_count,
+            "updates": updates,
+            "frames_sent": metrics["frames_sent"],
+            "frames_fanned_out": metrics["frames_fanned_out"],
+            "frames_read_by_fast_subscribers": received[0],
+            "frames_coalesced": metrics["frames_coalesced"],
+            "max_pending_per_slow_subscriber": slow_pending,
+            "fan_out_per_second": round(metrics["frames_fanned_out"] / elapsed),
+            "peak_memory_mb": round(peak_bytes / 2 ** 20, 1),
+            "elapsed_seconds": round(elapsed, 3)
+        }
+
+    result = asyncio.run(benchmark())
+    print(f"{result['updates']} updates to {result['subscribers']} subscribers: "
+          f"{result['fan_out_per_second']} frames/s, {result['frames_coalesced']} stale frames coalesced, "
+          f"at most {result['max_pending_per_slow_subscriber']} pending per slow subscriber, "
+          f"peak {result['peak_memory_mb']} MB")
+    return result
+
+
+# Persistence benchmarks: logged write throughput, and recovery of a multi-million-ticket state
+def run_wal_write_benchmark(writer_threads: int = 16, bookings_per_writer: int = 500,
+                            seat_count: int = 50000, sync: bool = True) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        mlb = MLBBackend()
+        mlb.open_storage(directory, sync=sync)
+        home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+        away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+        match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                              datetime.datetime(2026, 4, 1, 19, 5))
+        mlb.load_seat_map(match.match_id, build_benchmark_seat_map(home_team.stadium, seat_count))
+        ticket_ids = [ticket.ticket_id for ticket in mlb.get_available_tickets(match.match_id)]
+        log_before = mlb.get_storage_metrics()["log"]
+
+        def writer_task(writer_number: int):
+            # Each writer books and pays for its own pairs of seats
+            for booking_number in range(bookings_per_writer):
+                first = (writer_number * bookings_per_writer + booking_number) * 2 % (len(ticket_ids) - 1)
+                booking = mlb.create_booking(f"Buyer {writer_number}", f"buyer{writer_number}@example.com",
+                                             "555-0100", match.match_id, ticket_ids[first:first + 2])
+                if booking:
+                    mlb.confirm_booking(booking.booking_id, f"PAY-{booking.booking_id}")
+
+        writers = [threading.Thread(target=writer_task, args=(number,)) for number in range(writer_threads)]
+        start = time.perf_counter()
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        elapsed = time.perf_counter() - start
+
+        log_after = mlb.get_storage_metrics()["log"]
+        mlb.close_storage()
+
+    records = log_after["records_written"] - log_before["records_written"]
+    flushes = log_after["flushes"] - log_before["flushes"]
+    result = {
+        "writer_threads": writer_threads,
+        "sync": sync,
+        "records": records,
+        "flushes": flushes,
+        "records_per_flush": round(records / flushes, 1) if flushes else 0,
+        "records_per_second": round(records / elapsed),
+        "seconds": round(elapsed, 3)
+    }
+    print(f"{records} logged writes from {writer_threads} threads in {result['seconds']}s: "
+          f"{result['records_per_second']} records/s, {result['records_per_flush']} records per "
+          f"{'fsync' if sync else 'flush'}")
+    return result
+
+
+def run_recovery_benchmark(seat_count: int = 50000, home_games: int = 41,
+                           tail_bookings: int = 5000) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        mlb = MLBBackend()
+        mlb.open_storage(directory, sync=False)
+        home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+        away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+        seat_map = build_benchmark_seat_map(home_team.stadium, seat_count)
+        first_game = datetime.datetime(2026, 4, 1, 19, 5)
+        matches = []
+        for game in range(home_games):
+            match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                                  first_game + datetime.timedelta(days=2 * game))
+            mlb.load_seat_map(match.match_id, seat_map)
+            matches.append(match)
+        ticket_count = len(mlb.tickets)
+        snapshot = mlb.snapshot_storage()
+
+        # The tail: bookings logged after the snapshot
+        rng = random.Random(1)
+        for _ in range(tail_bookings):
+            match = rng.choice(matches)
+            tickets = mlb.find_best_seats(match.match_id, 2)
+            booking = mlb.create_booking("Buyer", "buyer@example.com", "555-0100", match.match_id,
+                                         [ticket.ticket_id for ticket in tickets])
+            if booking and rng.random() < 0.8:
+                mlb.confirm_booking(booking.booking_id, "PAY")
+        expected = mlb.inventory.get_sales_totals()
+        mlb.close_storage()
+
+        recovered = MLBBackend()
+        recovery = recovered.open_storage(directory)
+        assert recovered.inventory.get_sales_totals() == expected
+        recovered.close_storage()
+
+    result = {
+        "tickets": ticket_count,
+        "snapshot_mb": round(snapshot["bytes"] / 2 ** 20, 1),
+        "snapshot_seconds": snapshot["seconds"],
+        "snapshot_writer_pause_seconds": snapshot["writer_pause_seconds"],
+        "tail_records_replayed": recovery["records_replayed"],
+        "snapshot_load_seconds": recovery["snapshot_load_seconds"],
+        "tail_replay_seconds": recovery["replay_seconds"],
+        "recovery_seconds": recovery["recovery_seconds"]
+    }
+    print(f"Recovered {ticket_count} tickets in {result['recovery_seconds']}s "
+          f"(snapshot {result['snapshot_mb']} MB loaded in {result['snapshot_load_seconds']}s, "
+          f"{result['tail_records_replayed']} tail records in {result['tail_replay_seconds']}s)")
+    return result
+
+
+# Schedule benchmark: generate and validate a full 30-team, 2,430-game season
+def run_schedule_benchmark(start_date: datetime.date = datetime.date(2026, 3, 26)) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    for number in range(1, 31):
+        mlb.add_team(f"Team {number}", f"City {number}", f"Park {number}",
+                     ["AL East", "AL Central", "AL West", "NL East", "NL Central", "NL West"][(number - 1) // 5])
+
+    start = time.perf_counter()
+    games = mlb.schedule_builder.generate_season(list(mlb.teams.values()), start_date)
+    generate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conflicts = mlb.schedule_builder.validate(games)
+    validate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    added = mlb.add_matches(games)
+    add_seconds = time.perf_counter() - start
+
+    home_games = {}
+    for home_team_id, _, _, _ in games:
+        home_games[home_team_id] = home_games.get(home_team_id, 0) + 1
+
+    # A bad batch on top of the full season: a double-booked team and a blacked-out venue
+    home_team_id, away_team_id, venue, scheduled_time = games[0]
+    mlb.schedule_builder.add_venue_blackout(games[-1][2], games[-1][3] + datetime.timedelta(days=7),
+                                            games[-1][3] + datetime.timedelta(days=8))
+    bad_games = [(away_team_id, home_team_id, mlb.teams[away_team_id].stadium, scheduled_time),
+                 (home_team_id, away_team_id, games[-1][2], games[-1][3] + datetime.timedelta(days=7))]
+    start = time.perf_counter()
+    bad_conflicts = mlb.find_schedule_conflicts(bad_games)
+    incremental_seconds = time.perf_counter() - start
+
+    result = {
+        "games": len(games),
+        "home_games_per_team": [min(home_games.values()), max(home_games.values())],
+        "season_days": (games[-1][3].date() - games[0][3].date()).days + 1,
+        "conflicts": len(conflicts),
+        "matches_added": len(added["matches"]),
+        "generate_ms": round(generate_seconds * 1000, 1),
+        "validate_ms": round(validate_seconds * 1000, 1),
+        "add_ms": round(add_seconds * 1000, 1),
+        "bad_batch_conflicts": sorted({conflict["type"] for conflict in bad_conflicts}),
+        "bad_batch_validate_ms": round(incremental_seconds * 1000, 1)
+    }
+    print(f"{result['games']}-game season over {result['season_days']} days: generated in "
+          f"{result['generate_ms']} ms, validated in {result['validate_ms']} ms with {result['conflicts']} "
+          f"conflicts; bad batch flagged {result['bad_batch_conflicts']}")
+    return result
+
+
+# On-sale surge simulation: synthetic buyers queue for a marquee game on a simulated clock
+def run_waiting_room_benchmark(buyer_count: int = 100000, surge_seconds: float = 10.0,
+                               admission_rate: float = 2000.0, max_queue_depth: int = 50000,
+                               seat_count: int = 50000, seats_per_buyer: int = 2,
+                               tick_seconds: float = 0.05) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                          datetime.datetime(2026, 4, 1, 19, 5))
+    mlb.load_seat_map(match.match_id, build_benchmark_seat_map(home_team.stadium, seat_count))
+    room = mlb.open_waiting_room(match.match_id, admission_rate, max_queue_depth=max_queue_depth)
+
+    # Most buyers arrive right at the on-sale time and tail off after it
+    rng = random.Random(1)
+    arrivals = sorted(rng.random() ** 3 * surge_seconds for _ in range(buyer_count))
+
+    bookings = 0
+    sold_out_at = None
+    arrival = 0
+    tick = 0
+    start = time.perf_counter()
+    while True:
+        now = tick * tick_seconds
+        while arrival < buyer_count and arrivals[arrival] <= now:
+            mlb.join_waiting_room(match.match_id, now)
+            arrival += 1
+
+        for token in room.admit(now):
+            seats = mlb.find_admitted_seats(match.match_id, token, seats_per_buyer, now=now)
+            if seats and mlb.create_admitted_booking(token, "Buyer", f"{token}@example.com", "555-0100",
+                                                     match.match_id, [seat.ticket_id for seat in seats], now=now):
+                bookings += 1
+                continue
+
+            # No run of seats_per_buyer seats is left: sold out, so stop queueing
+            mlb.leave_waiting_room(match.match_id, token)
+            if sold_out_at is None:
+                sold_out_at = round(now, 2)
+                mlb.close_waiting_room(match.match_id)
+        if arrival == buyer_count and not room.waiting:
+            break
+        tick += 1
+    elapsed = time.perf_counter() - start
+    metrics = mlb.get_waiting_room_metrics(match.match_id)
+
+    result = {
+        "buyers": buyer_count,
+        "admission_rate": admission_rate,
+        "joined": metrics["joined"],
+        "shed": metrics["shed"],
+        "admitted": metrics["admitted"],
+        "bookings": bookings,
+        "max_queue_depth": metrics["max_queue_depth_seen"],
+        "sold_out_at_seconds": sold_out_at,
+        "simulated_seconds": round(tick * tick_seconds, 2),
+        "wait_seconds": metrics["wait_seconds"],
+        "service_ms": metrics["service_ms"],
+        "wall_seconds": round(elapsed, 3)
+    }
+    print(f"{buyer_count} buyers: {result['admitted']} admitted at {admission_rate:.0f}/s, "
+          f"{result['shed']} shed, {bookings} bookings; wait p50/p99 {result['wait_seconds']['p50']}/"
+          f"{result['wait_seconds']['p99']}s, service p99 {result['service_ms']['p99']} ms "
+          f"({elapsed:.2f}s wall)")
+    return result
+
+
+# Dynamic pricing benchmark: re-price a part-sold 50k-seat match as game day approaches
+def run_dynamic_pricing_benchmark(seat_count: int = 50000, sold_fraction: float = 0.6,
+                                  runs: int = 20) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    home_team = mlb.add_team("Home", "Home City", "Home Park", "AL East")
+    away_team = mlb.add_team("Away", "Away City", "Away Park", "AL East")
+    game_time = datetime.datetime(2026, 4, 1, 19, 5)
+    match = mlb.add_match(home_team.team_id, away_team.team_id, home_team.stadium, game_time)
+    mlb.load_seat_map(match.match_id, build_benchmark_seat_map(home_team.stadium, seat_count))
+
+    # Better sections sell faster; every fourth sale is a booking whose price must stay locked
+    rng = random.Random(1)
+    tickets = mlb.get_available_tickets(match.match_id)
+    bookings = []
+    for ticket in tickets:
+        section_number = int(ticket.section[1:])
+        if rng.random() < sold_fraction * (1.5 - section_number / (seat_count // 500)):
+            if rng.random() < 0.25:
+                bookings.append(mlb.create_booking("Buyer", "buyer@example.com", "555-0100", match.match_id,
+                                                   [ticket.ticket_id]))
+            else:
+                ticket.reserve_ticket("BENCHMARK")
+    booked_totals = {booking.booking_id: booking.total_amount for booking in bookings}
+    revenue_before = mlb.inventory.get_sales_totals(match.match_id)["revenue"]
+
+    timings = []
+    summary = None
+    for run in range(runs):
+        as_of = game_time - datetime.timedelta(days=60 * (1 - run / runs))
+        start = time.perf_counter()
+        summary = mlb.reprice_match(match.match_id, as_of)
+        timings.append(time.perf_counter() - start)
+
+    # Locked-in prices are untouched: booking totals still match their tickets
+    locked_prices_kept = all(
+        abs(sum(mlb.get_ticket(ticket_id).price for ticket_id in booking.ticket_ids)
+            - booked_totals[booking.booking_id]) < 0.005
+        for booking in bookings
+    )
+    for booking in bookings:
+        mlb.confirm_booking(booking.booking_id, f"PAY-{booking.booking_id}")
+    revenue_after = mlb.inventory.get_sales_totals(match.match_id)["revenue"]
+
+    first_run = timings[0]
+    timings.sort()
+    result = {
+        "venue_seats": seat_count,
+        "sell_through": summary["sell_through"],
+        "available_repriced": summary["available"],
+        "multiplier_range": [summary["multiplier_min"], summary["multiplier_max"]],
+        "first_run_ms": round(first_run * 1000, 2),
+        "median_run_ms": round(timings[len(timings) // 2] * 1000, 2),
+        "locked_prices_kept": locked_prices_kept,
+        "booked_revenue_matches": abs(revenue_after - revenue_before - sum(booked_totals.values())) < 0.01
+    }
+    print(f"Re-priced {result['available_repriced']} available tickets of a {seat_count}-seat match in "
+          f"{result['median_run_ms']} ms (first run {result['first_run_ms']} ms); "
+          f"locked prices kept: {locked_prices_kept}")
+    return result
+
+
+# Sharding benchmark: the same booking load on one backend and on match-sharded worker processes
+def run_sharded_booking_benchmark(shard_count: int = 4, match_count: int = 8, seat_count: int = 10000,
+                                  client_threads: int = 16, bookings_per_thread: int = 200,
+                                  sync: bool = True) -> Dict[str, Any]:
+    def load_matches(backend) -> Dict[str, List[str]]:
+        home_team = backend.add_team("Home", "Home City", "Home Park", "AL East")
+        away_team = backend.add_team("Away", "Away City", "Away Park", "AL East")
+        seat_map = build_benchmark_seat_map(home_team.stadium, seat_count)
+        ticket_ids = {}
+        for game in range(match_count):
+            match = backend.add_match(home_team.team_id, away_team.team_id, home_team.stadium,
+                                      datetime.datetime(2026, 4, 1, 19, 5) + datetime.timedelta(days=game))
+            backend.load_seat_map(match.match_id, seat_map)
+            tickets = backend.get_available_tickets(match.match_id)
+            ticket_ids[match.match_id] = [ticket["ticket_id"] if isinstance(ticket, dict) else ticket.ticket_id
+                                          for ticket in tickets]
+        return ticket_ids
+
+    def run_buyers(backend, ticket_ids: Dict[str, List[str]]) -> float:
+        match_ids = list(ticket_ids)
+
+        def buyer_task(buyer_number: int):
+            # Buyers spread over every match; each books and pays for its own pair of seats
+            for attempt in range(bookings_per_thread):
+                number = buyer_number * bookings_per_thread + attempt
+                match_id = match_ids[number % match_count]
+                pair = number // match_count
+                booking = backend.create_booking(f"Buyer {buyer_number}", f"buyer{buyer_number}@example.com",
+                                                 "555-0100", match_id, ticket_ids[match_id][2 * pair:2 * pair + 2])
+                backend.confirm_booking(booking.booking_id, f"PAY-{booking.booking_id}")
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=buyer_task, args=(number,)) for number in range(client_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    bookings = client_threads * bookings_per_thread
+    with tempfile.TemporaryDirectory() as directory:
+        single = MLBBackend()
+        single.open_storage(os.path.join(directory, "single"), sync)
+        single_seconds = run_buyers(single, load_matches(single))
+        single_totals = single.get_sales_totals()
+        single.close_storage()
+
+        with ShardRouter(MLBBackend, shard_count, os.path.join(directory, "sharded"), sync) as router:
+            sharded_seconds = run_buyers(router, load_matches(router))
+            start = time.perf_counter()
+            sharded_totals = router.get_sales_totals()
+            gather_seconds = time.perf_counter() - start
+            shard_requests = [shard["requests_sent"] for shard in router.get_shard_metrics()]
+
+    result = {
+        "cpu_count": os.cpu_count(),
+        "shards": shard_count,
+        "bookings": bookings,
+        "single_bookings_per_second": int(bookings / single_seconds),
+        "sharded_bookings_per_second": int(bookings / sharded_seconds),
+        "speedup": round(single_seconds / sharded_seconds, 2),
+        "requests_per_shard": shard_requests,
+        "totals_match": sharded_totals == single_totals,
+        "scatter_gather_ms": round(gather_seconds * 1000, 2)
+    }
+    print(f"{bookings} bookings on {os.cpu_count()} CPUs: {result['single_bookings_per_second']}/s in one "
+          f"process, {result['sharded_bookings_per_second']}/s on {shard_count} shards "
+          f"({result['speedup']}x); totals match: {result['totals_match']}")
+    return result
+
+
+# Nightly report run over a full league: first run, a quiet rerun, then a rerun after one game
+def run_report_cache_benchmark(players_per_team: int = 26,
+                               start_date: datetime.date = datetime.date(2026, 3, 26)) -> Dict[str, Any]:
+    mlb = MLBBackend()
+    divisions = ["AL East", "AL Central", "AL West", "NL East", "NL Central", "NL West"]
+    for number in range(1, 31):
+        team = mlb.add_team(f"Team {number}", f"City {number}", f"Park {number}", divisions[(number - 1) // 5])
+        for jersey_number in range(1, players_per_team + 1):
+            position = Position.PITCHER if jersey_number <= players_per_team // 2 else Position.SHORTSTOP
+            mlb.add_player(f"Player {number}-{jersey_number}", team.team_id, position, jersey_number)
+    mlb.add_matches(mlb.schedule_builder.generate_season(list(mlb.teams.values()), start_date))
+
+    output_dir = tempfile.mkdtemp(prefix="mlb-reports-")
+    timings = {}
+    for name in ("first_run", "quiet_run", "after_one_game"):
+        if name == "after_one_game":
+            # One final score and its box score touch two teams' schedules and the player report
+            match = mlb.schedule.get_matches_by_team(next(iter(mlb.teams)))[0]
+            mlb.schedule.update_match(match.match_id, status=MatchStatus.COMPLETED, score=(5, 3))
+            lineup = mlb.get_players_by_team(match.home_team_id)[:9]
+            mlb.apply_box_scores([(player.player_id, 1, 4, 1, 0, 0, 0) for player in lineup])
+        before = mlb.get_report_cache_metrics()
+        start = time.perf_counter()
+        if not mlb.generate_all_reports(output_dir):
+            raise RuntimeError("Report generation failed")
+        after = mlb.get_report_cache_metrics()
+        timings[name] = {
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "generated": after["generated"] - before["generated"],
+            "skipped": after["skipped"] - before["skipped"]
+        }
+    mlb.report_jobs.shutdown()
+
+    result = {"reports": len(mlb.teams) + 2, **timings}
+    print(f"{result['reports']} reports: first run {timings['first_run']['ms']} ms, quiet rerun "
+          f"{timings['quiet_run']['ms']} ms ({timings['quiet_run']['skipped']} skipped), after one game "
+          f"{timings['after_one_game']['ms']} ms ({timings['after_one_game']['generated']} regenerated)")
+    return result
+
+
+if __name__ == "__main__":
+    # Oversold or mismatched seats raise, so this exits non-zero when booking is unsafe
+    run_booking_stress_test()
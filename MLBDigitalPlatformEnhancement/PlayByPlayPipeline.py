@@ -0,0 +1,257 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import gzip
+import queue
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Set
+
+from MLBDigitalPlatformEnhancement.Match import Match
+from MLBDigitalPlatformEnhancement.MatchStatus import MatchStatus
+from MLBDigitalPlatformEnhancement.PlayerStatsTable import PlayerStatsTable
+
+
+class PlayByPlayPipeline:
+    # Plate appearance outcome -> (at_bats, hits, home_runs, outs recorded)
+    PLAY_OUTCOMES = {
+        "single": (1, 1, 0, 0),
+        "double": (1, 1, 0, 0),
+        "triple": (1, 1, 0, 0),
+        "home_run": (1, 1, 1, 0),
+        "out": (1, 0, 0, 1),
+        "strikeout": (1, 0, 0, 1),
+        "sacrifice": (0, 0, 0, 1),
+        "walk": (0, 0, 0, 0),
+    }
+    ID_FIELDS = ("match_id", "batter_id", "pitcher_id", "winning_pitcher_id", "losing_pitcher_id")
+    NUMERIC_FIELDS = ("outs", "rbi", "earned_runs", "home_score", "away_score", "inning")
+    END_OF_FEED = object()
+    PUT_TIMEOUT_SECONDS = 0.1  # how often a blocked producer checks that the consumer is still alive
+
+    def __init__(self, get_match: Callable[[str], Optional[Match]], update_match: Callable[..., bool],
+                 stats_table: PlayerStatsTable, batch_size: int = 1000, queue_size: int = 10000,
+                 game_players: Optional[Dict[str, Set[str]]] = None):
+        self.get_match = get_match
+        self.update_match = update_match  # Schedule.update_match, so status changes keep its index current
+        self.stats_table = stats_table
+        self.batch_size = batch_size
+
+        # The feed blocks on a full queue, so a lagging consumer slows the producer
+        # down instead of letting events pile up in memory
+        self.queue = queue.Queue(maxsize=queue_size)
+        # match_id -> players seen so far, credited a game at game_end; pass the same
+        # dict to every pipeline when one game's feed is split across several runs
+        self.game_players: Dict[str, Set[str]] = {} if game_players is None else game_players
+
+        # Metrics
+        self.events_received = 0
+        self.events_applied = 0
+        self.events_rejected = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.producer_blocked_seconds = 0.0
+        self.consumer_error: Optional[BaseException] = None  # what stopped the consumer, if it failed
+
+    @staticmethod
+    def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+        """Yield one event per non-empty line of an NDJSON file (gzip if it ends in .gz)"""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def ingest(self, events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Feed events through the pipeline until the feed ends; returns the run's metrics"""
+        start = time.perf_counter()
+        consumer = threading.Thread(target=self.consume, name="play-by-play", daemon=True)
+        consumer.start()
+
+        try:
+            for event in events:
+                self.events_received += 1
+                if not self.put(event):
+                    break
+                depth = self.queue.qsize()
+                if depth > self.max_queue_depth:
+                    self.max_queue_depth = depth
+        finally:
+            self.put(self.END_OF_FEED)
+            consumer.join()
+
+        # A consumer that died would otherwise leave the feed half-applied without a word
+        if self.consumer_error is not None:
+            raise self.consumer_error
+        return self.get_metrics(time.perf_counter() - start)
+
+    def put(self, item: Any) -> bool:
+        """Queue an item, waiting while the queue is full; False if the consumer has stopped on an error"""
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        blocked = time.perf_counter()
+        try:
+            while self.consumer_error is None:
+                try:
+                    self.queue.put(item, timeout=self.PUT_TIMEOUT_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.producer_blocked_seconds += time.perf_counter() - blocked
+
+    def ingest_file(self, path: str) -> Dict[str, Any]:
+        """Feed an NDJSON play-by-play file through the pipeline"""
+        return self.ingest(self.read_ndjson(path))
+
+    def consume(self) -> None:
+        """Take whatever is queued, up to batch_size events, and apply it as one batch.
+
+        An unexpected error stops the consumer and is recorded for ingest to raise.
+        """
+        try:
+            self.consume_batches()
+        except BaseException as error:
+            self.consumer_error = error
+
+    def consume_batches(self) -> None:
+        """Apply queued batches until the end of the feed"""
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            done = batch[-1] is self.END_OF_FEED
+            if done:
+                batch.pop()
+            if batch:
+                self.apply_batch(batch)
+            if done:
+                return
+
+    def apply_batch(self, events: List[Dict[str, Any]]) -> int:
+        """Apply a batch of events: stat deltas in one bulk update, then each game's latest state"""
+        known_players = self.stats_table.rows
+        batting: Dict[str, List[float]] = {}  # player_id -> games, at bats, hits, home runs, RBI, stolen bases
+        pitching: Dict[str, List[float]] = {}  # player_id -> outs, wins, losses, earned runs, K, BB, hits
+        games: Dict[str, Dict[str, Any]] = {}  # match_id -> latest score, inning and status
+        applied = 0
+
+        for event in events:
+            if not self.is_valid(event):
+                self.events_rejected += 1
+                continue
+
+            match_id = event.get("match_id")
+            game = games.get(match_id)
+            if game is None:
+                if not self.get_match(match_id):
+                    self.events_rejected += 1
+                    continue
+                game = {}
+                games[match_id] = game
+
+            event_type = event.get("type")
+            batter_id = event.get("batter_id")
+            pitcher_id = event.get("pitcher_id")
+            if (batter_id and batter_id not in known_players) or (pitcher_id and pitcher_id not in known_players):
+                self.events_rejected += 1
+                continue
+
+            if event_type in self.PLAY_OUTCOMES:
+                at_bats, hits, home_runs, outs = self.PLAY_OUTCOMES[event_type]
+                outs = event.get("outs", outs)
+                players = self.game_players.setdefault(match_id, set())
+                if batter_id:
+                    line = batting.setdefault(batter_id, [0] * 6)
+                    line[1] += at_bats
+                    line[2] += hits
+                    line[3] += home_runs
+                    line[4] += event.get("rbi", 0)
+                    players.add(batter_id)
+                if pitcher_id:
+                    line = pitching.setdefault(pitcher_id, [0] * 7)
+                    line[0] += outs
+                    line[3] += event.get("earned_runs", event.get("rbi", 0))
+                    line[4] += event_type == "strikeout"
+                    line[5] += event_type == "walk"
+                    line[6] += hits
+                    players.add(pitcher_id)
+            elif event_type == "stolen_base":
+                if batter_id:
+                    batting.setdefault(batter_id, [0] * 6)[5] += 1
+            elif event_type == "game_start":
+                game["status"] = MatchStatus.LIVE
+            elif event_type == "game_end":
+                game["status"] = MatchStatus.COMPLETED
+                for player_id in self.game_players.pop(match_id, ()):
+                    batting.setdefault(player_id, [0] * 6)[0] += 1
+                for key, column in (("winning_pitcher_id", 1), ("losing_pitcher_id", 2)):
+                    player_id = event.get(key)
+                    if player_id in known_players:
+                        pitching.setdefault(player_id, [0] * 7)[column] += 1
+            else:
+                self.events_rejected += 1
+                continue
+
+            if "home_score" in event and "away_score" in event:
+                game["score"] = (event["home_score"], event["away_score"])
+            if "inning" in event:
+                game["inning"] = (event["inning"], event.get("is_top", True))
+            if event_type != "game_end" and "status" not in game:
+                game["status"] = MatchStatus.LIVE
+            applied += 1
+
+        # Innings pitched are kept as thirds of an inning
+        self.stats_table.apply_box_scores(
+            [(player_id, *line) for player_id, line in batting.items()],
+            [(player_id, line[0] / 3, *line[1:]) for player_id, line in pitching.items()])
+
+        for match_id, game in games.items():
+            status = game.pop("status", None)
+            match = self.get_match(match_id)
+            if status and match.status != status and match.status != MatchStatus.COMPLETED:
+                game["status"] = status
+            if game:
+                self.update_match(match_id, **game)
+
+        self.events_applied += applied
+        self.batches += 1
+        return applied
+
+    def is_valid(self, event: Any) -> bool:
+        """Check an event's shape before any of it is applied, so a bad event is skipped whole"""
+        if not isinstance(event, dict):
+            return False
+        for field in self.ID_FIELDS:
+            value = event.get(field)
+            if value is not None and not isinstance(value, str):
+                return False
+        for field in self.NUMERIC_FIELDS:
+            value = event.get(field, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+        return True
+
+    def get_metrics(self, elapsed_seconds: float) -> Dict[str, Any]:
+        """Return a dictionary of pipeline metrics for a run that took elapsed_seconds"""
+        return {
+            "events_received": self.events_received,
+            "events_applied": self.events_applied,
+            "events_rejected": self.events_rejected,
+            "batches": self.batches,
+            "average_batch_size": round(self.events_applied / self.batches, 1) if self.batches else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "producer_blocked_seconds": round(self.producer_blocked_seconds, 3),
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "events_per_second": round(self.events_received / elapsed_seconds) if elapsed_seconds else 0
+        }
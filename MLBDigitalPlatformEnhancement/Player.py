@@ -33,8 +33,12 @@ class Player:
         self.earned_run_average = 0.0
         self.strikeouts = 0
         self.walks = 0
+        self.earned_runs = 0.0
+        self.hits_allowed = 0
         self.whip = 0.0  # Walks plus hits per inning pitched
 
+        self.stats_table = None  # PlayerStatsTable mirroring these stats, if any
+
     def update_batting_stats(self, games: int, at_bats: int, hits: int, home_runs: int,
                             runs_batted_in: int, stolen_bases: int):
         """Update player's batting statistics"""
@@ -49,6 +53,9 @@ class Player:
         if self.at_bats > 0:
             self.batting_average = round(self.hits / self.at_bats, 3)
 
+        if self.stats_table:
+            self.stats_table.sync_from_player(self)
+
     def update_pitching_stats(self, innings: float, wins: int, losses: int, earned_runs: float,
                              strikeouts: int, walks: int, hits_allowed: int):
         """Update player's pitching statistics"""
@@ -57,14 +64,19 @@ class Player:
         self.losses += losses
         self.strikeouts += strikeouts
         self.walks += walks
+        self.earned_runs += earned_runs
+        self.hits_allowed += hits_allowed
 
-        # Recalculate ERA
+        # Recalculate ERA and WHIP from season totals
         if self.innings_pitched > 0:
             # ERA = (Earned Runs / Innings Pitched) * 9
-            self.earned_run_average = round((earned_runs / self.innings_pitched) * 9, 2)
+            self.earned_run_average = round((self.earned_runs / self.innings_pitched) * 9, 2)
 
             # WHIP = (Walks + Hits) / Innings Pitched
-            self.whip = round((walks + hits_allowed) / self.innings_pitched, 2)
+            self.whip = round((self.walks + self.hits_allowed) / self.innings_pitched, 2)
+
+        if self.stats_table:
+            self.stats_table.sync_from_player(self)
 
     def get_stats(self) -> Dict[str, Any]:
         """Return a dictionary of player statistics"""
@@ -0,0 +1,63 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from MLBDigitalPlatformEnhancement.Player import Player
+from MLBDigitalPlatformEnhancement.Position import Position
+
+
+class PlayerStatsSnapshot:
+    # Stats as PlayerStatsTable held them at one version. Reports read a snapshot
+    # while box scores keep landing in the table; nothing here is ever changed
+    BATTING_STATS = ("games_played", "at_bats", "hits", "home_runs", "runs_batted_in", "stolen_bases",
+                     "batting_average")
+    PITCHING_STATS = ("innings_pitched", "wins", "losses", "earned_run_average", "strikeouts", "walks", "whip")
+
+    def __init__(self, version: int, players: List[Player], team_ids: List[str], team_codes: np.ndarray,
+                 columns: Dict[str, np.ndarray], integer_columns: frozenset):
+        self.version = version
+        self.players = players  # row -> Player; only its name, team, position and number are read
+        self.team_ids = team_ids  # team code -> team_id
+        self.team_codes = team_codes.tolist()
+
+        # Plain Python values, ints for the counting stats, as Player.get_stats reports them
+        self.values: Dict[str, list] = {
+            name: [int(value) for value in column.tolist()] if name in integer_columns else column.tolist()
+            for name, column in columns.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def get_rows(self, team_id: Optional[str] = None) -> List[int]:
+        """Get the rows of every player, or of one team's players"""
+        if team_id is None:
+            return list(range(len(self.players)))
+        if team_id not in self.team_ids:
+            return []
+        team_code = self.team_ids.index(team_id)
+        return [row for row, code in enumerate(self.team_codes) if code == team_code]
+
+    def get_stats(self, row: int) -> Dict[str, Any]:
+        """Return one player's statistics in the same shape as Player.get_stats"""
+        player = self.players[row]
+        values = self.values
+        stats = {
+            "player_id": player.player_id,
+            "name": player.name,
+            "team_id": self.team_ids[self.team_codes[row]],
+            "position": player.position.value,
+            "jersey_number": player.jersey_number,
+            "batting_stats": {name: values[name][row] for name in self.BATTING_STATS}
+        }
+
+        if player.position == Position.PITCHER:
+            stats["pitching_stats"] = {name: values[name][row] for name in self.PITCHING_STATS}
+
+        return stats
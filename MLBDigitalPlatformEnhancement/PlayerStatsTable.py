@@ -0,0 +1,230 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from MLBDigitalPlatformEnhancement.Player import Player
+from MLBDigitalPlatformEnhancement.PlayerStatsSnapshot import PlayerStatsSnapshot
+
+
+class PlayerStatsTable:
+    # Counting stats, one column each, in the order box score lines list them
+    BATTING_COLUMNS = ("games_played", "at_bats", "hits", "home_runs", "runs_batted_in", "stolen_bases")
+    PITCHING_COLUMNS = ("innings_pitched", "wins", "losses", "earned_runs", "strikeouts", "walks", "hits_allowed")
+    RATE_COLUMNS = ("batting_average", "earned_run_average", "whip")
+    INTEGER_COLUMNS = frozenset(BATTING_COLUMNS + PITCHING_COLUMNS) - {"innings_pitched", "earned_runs"}
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.size = 0
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=np.float64)
+            for name in self.BATTING_COLUMNS + self.PITCHING_COLUMNS + self.RATE_COLUMNS
+        }
+        self.team_codes = np.zeros(capacity, dtype=np.int32)
+
+        self.rows: Dict[str, int] = {}  # player_id -> row
+        self.players: List[Player] = []  # row -> Player
+        self.team_ids: List[str] = []  # team code -> team_id
+        self.team_id_codes: Dict[str, int] = {}  # team_id -> team code
+        self.listeners = []  # called with (player_ids) after stats change
+        self.lock = threading.RLock()
+
+        # Every change bumps the version; snapshots are copied at most once per version
+        self.version = 0
+        self.snapshot: Optional[PlayerStatsSnapshot] = None
+
+    def grow(self, capacity: int) -> None:
+        """Grow every column to hold at least capacity players"""
+        new_capacity = max(capacity, self.capacity * 2)
+        for name, column in self.columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+        grown = np.zeros(new_capacity, dtype=self.team_codes.dtype)
+        grown[:self.size] = self.team_codes[:self.size]
+        self.team_codes = grown
+        self.capacity = new_capacity
+
+    def get_team_code(self, team_id: str) -> int:
+        """Get the code for a team, adding it if needed"""
+        code = self.team_id_codes.get(team_id)
+        if code is None:
+            code = len(self.team_ids)
+            self.team_ids.append(team_id)
+            self.team_id_codes[team_id] = code
+        return code
+
+    def add_player(self, player: Player) -> int:
+        """Add a player to the table and link the player to it"""
+        with self.lock:
+            if player.player_id in self.rows:
+                return self.rows[player.player_id]
+
+            if self.size == self.capacity:
+                self.grow(self.size + 1)
+            row = self.size
+            self.size += 1
+            self.rows[player.player_id] = row
+            self.players.append(player)
+            self.team_codes[row] = self.get_team_code(player.team_id)
+
+            player.stats_table = self
+            self.sync_from_player(player)
+        return row
+
+    def sync_from_player(self, player: Player) -> None:
+        """Copy one player's scalar stats into the table, after a single-player update"""
+        with self.lock:
+            row = self.rows[player.player_id]
+            for name in self.BATTING_COLUMNS + self.PITCHING_COLUMNS + self.RATE_COLUMNS:
+                self.columns[name][row] = getattr(player, name)
+            self.version += 1
+        self.notify([player.player_id])
+
+    def sync_to_players(self, rows: np.ndarray) -> None:
+        """Copy table stats back onto the Player objects of the given rows"""
+        integer_columns = self.INTEGER_COLUMNS
+        values = {name: self.columns[name][rows].tolist() for name in self.columns}
+        for position, row in enumerate(rows.tolist()):
+            player = self.players[row]
+            for name, column_values in values.items():
+                value = column_values[position]
+                setattr(player, name, int(value) if name in integer_columns else value)
+
+    def get_rows(self, player_ids: Sequence[str]) -> np.ndarray:
+        """Get the table rows for player IDs; unknown players are an error"""
+        return np.fromiter((self.rows[player_id] for player_id in player_ids), dtype=np.int64, count=len(player_ids))
+
+    def recompute_rates(self, rows: Optional[np.ndarray] = None) -> None:
+        """Recompute batting average, ERA and WHIP for the given rows (or every row) in one pass"""
+        if rows is None:
+            rows = np.arange(self.size)
+        columns = self.columns
+
+        at_bats = columns["at_bats"][rows]
+        innings = columns["innings_pitched"][rows]
+        batting = at_bats > 0
+        pitching = innings > 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            batting_average = np.round(columns["hits"][rows] / at_bats, 3)
+            earned_run_average = np.round(columns["earned_runs"][rows] / innings * 9, 2)
+            whip = np.round((columns["walks"][rows] + columns["hits_allowed"][rows]) / innings, 2)
+
+        # Players without at-bats or innings keep their previous rates, as Player does
+        columns["batting_average"][rows] = np.where(batting, batting_average, columns["batting_average"][rows])
+        columns["earned_run_average"][rows] = np.where(pitching, earned_run_average,
+                                                       columns["earned_run_average"][rows])
+        columns["whip"][rows] = np.where(pitching, whip, columns["whip"][rows])
+
+    def apply_box_scores(self, batting_lines: Iterable[Tuple] = (), pitching_lines: Iterable[Tuple] = ()) -> int:
+        """Apply a day's box scores in bulk.
+
+        batting_lines: (player_id, games, at_bats, hits, home_runs, runs_batted_in, stolen_bases)
+        pitching_lines: (player_id, innings, wins, losses, earned_runs, strikeouts, walks, hits_allowed)
+        Returns the number of players whose stats changed.
+        """
+        batting_lines = list(batting_lines)
+        pitching_lines = list(pitching_lines)
+        if not batting_lines and not pitching_lines:
+            return 0
+
+        with self.lock:
+            touched = []
+            for lines, column_names in ((batting_lines, self.BATTING_COLUMNS),
+                                        (pitching_lines, self.PITCHING_COLUMNS)):
+                if not lines:
+                    continue
+                rows = self.get_rows([line[0] for line in lines])
+                deltas = np.array([line[1:] for line in lines], dtype=np.float64)
+                for index, name in enumerate(column_names):
+                    # add.at accumulates correctly when a player appears on several lines
+                    np.add.at(self.columns[name], rows, deltas[:, index])
+                touched.append(rows)
+
+            rows = np.unique(np.concatenate(touched))
+            self.recompute_rates(rows)
+            self.sync_to_players(rows)
+            self.version += 1
+
+        self.notify([self.players[row].player_id for row in rows.tolist()])
+        return len(rows)
+
+    def get_snapshot(self) -> PlayerStatsSnapshot:
+        """Get a point-in-time copy of the table for long reads.
+
+        The lock is held only to copy the columns, so writers wait microseconds
+        rather than for a whole report. Readers share the copy until the next change.
+        """
+        with self.lock:
+            snapshot = self.snapshot
+            if snapshot and snapshot.version == self.version:
+                return snapshot
+            version = self.version
+            size = self.size
+            columns = {name: column[:size].copy() for name, column in self.columns.items()}
+            team_codes = self.team_codes[:size].copy()
+            players = self.players[:size]
+            team_ids = list(self.team_ids)
+
+        snapshot = PlayerStatsSnapshot(version, players, team_ids, team_codes, columns, self.INTEGER_COLUMNS)
+        with self.lock:
+            if self.snapshot is None or self.snapshot.version < version:
+                self.snapshot = snapshot
+        return snapshot
+
+    def notify(self, player_ids: List[str]) -> None:
+        """Tell listeners which players' stats changed"""
+        for listener in self.listeners:
+            listener(player_ids)
+
+    def aggregate(self, group_codes: np.ndarray, group_count: int) -> Dict[str, np.ndarray]:
+        """Sum every counting stat per group and derive the group's rates"""
+        size = self.size
+        totals = {
+            name: np.bincount(group_codes[:size], weights=self.columns[name][:size], minlength=group_count)
+            for name in self.BATTING_COLUMNS + self.PITCHING_COLUMNS
+        }
+        with np.errstate(divide="ignore", invalid="ignore"):
+            totals["batting_average"] = np.where(
+                totals["at_bats"] > 0, np.round(totals["hits"] / totals["at_bats"], 3), 0.0)
+            totals["earned_run_average"] = np.where(
+                totals["innings_pitched"] > 0,
+                np.round(totals["earned_runs"] / totals["innings_pitched"] * 9, 2), 0.0)
+            totals["whip"] = np.where(
+                totals["innings_pitched"] > 0,
+                np.round((totals["walks"] + totals["hits_allowed"]) / totals["innings_pitched"], 2), 0.0)
+        return totals
+
+    def to_records(self, names: List[str], totals: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+        """Turn per-group total arrays into {group name: {stat: value}}"""
+        columns = {stat: values.tolist() for stat, values in totals.items()}
+        return {name: {stat: values[code] for stat, values in columns.items()} for code, name in enumerate(names)}
+
+    def get_team_aggregates(self) -> Dict[str, Dict[str, float]]:
+        """Get batting and pitching totals and rates per team"""
+        with self.lock:
+            return self.to_records(self.team_ids, self.aggregate(self.team_codes, len(self.team_ids)))
+
+    def get_division_aggregates(self, team_divisions: Dict[str, str]) -> Dict[str, Dict[str, float]]:
+        """Get batting and pitching totals and rates per division, given team_id -> division"""
+        with self.lock:
+            divisions = sorted(set(team_divisions.values()))
+            division_codes = {division: code for code, division in enumerate(divisions)}
+            team_to_division = np.array(
+                [division_codes.get(team_divisions.get(team_id), len(divisions)) for team_id in self.team_ids],
+                dtype=np.int32)
+            group_codes = team_to_division[self.team_codes[:self.size]]
+            return self.to_records(divisions, self.aggregate(group_codes, len(divisions) + 1))
+
+    def get_league_aggregates(self) -> Dict[str, float]:
+        """Get batting and pitching totals and rates for the whole league"""
+        with self.lock:
+            totals = self.aggregate(np.zeros(self.size, dtype=np.int32), 1)
+            return self.to_records(["league"], totals)["league"]
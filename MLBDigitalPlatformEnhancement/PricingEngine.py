@@ -0,0 +1,241 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Deque, Tuple
+
+import numpy as np
+
+from MLBDigitalPlatformEnhancement.SeatRow import SeatRow
+from MLBDigitalPlatformEnhancement.TicketInventory import TicketInventory
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class PricingEngine:
+    AVAILABLE_CODE = list(TicketStatus).index(TicketStatus.AVAILABLE)
+
+    def __init__(self, reprice_matches: Callable[[], List[Dict[str, Any]]], interval_seconds: float = 900.0,
+                 horizon_days: float = 60.0, target_sell_through: float = 0.95, pace_weight: float = 1.5,
+                 section_weight: float = 0.5, min_multiplier: float = 0.7, max_multiplier: float = 2.5,
+                 tier_sensitivity: Optional[Dict[TicketType, float]] = None):
+        self.reprice_matches = reprice_matches  # re-prices every upcoming match, returns their summaries
+        self.interval_seconds = interval_seconds
+
+        # A match is on pace when its sell-through reaches target_sell_through
+        # by game time, ramping up linearly over the last horizon_days
+        self.horizon_days = horizon_days
+        self.target_sell_through = target_sell_through
+        self.pace_weight = pace_weight  # weight of sell-through ahead of (or behind) pace
+        self.section_weight = section_weight  # weight of a section selling faster than the match
+        self.min_multiplier = min_multiplier
+        self.max_multiplier = max_multiplier
+
+        # How strongly each tier follows demand: premium seats move most
+        tier_sensitivity = tier_sensitivity or {TicketType.GENERAL: 0.6, TicketType.RESERVED: 1.0,
+                                                TicketType.PREMIUM: 1.4}
+        self.tier_sensitivity = np.array([tier_sensitivity.get(ticket_type, 1.0) for ticket_type in TicketType])
+
+        # match_id -> seat layout as arrays, rebuilt when the match's tickets change
+        self.layouts: Dict[str, Dict[str, Any]] = {}
+
+        # Metrics
+        self.runs = 0
+        self.tickets_repriced_total = 0
+        self.last_run_seconds = 0.0
+        self.recent_matches: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self.metrics_lock = threading.Lock()
+
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def get_layout(self, inventory: TicketInventory, match_id: str) -> Optional[Dict[str, Any]]:
+        """Get a match's store rows grouped by seat row, with section and tier codes; caller holds store.lock"""
+        seat_map = inventory.seat_maps.get(match_id)
+        if seat_map is None:
+            return None
+        ticket_count = sum(inventory.match_counters[match_id].status_counts.values())
+        layout = self.layouts.get(match_id)
+        if layout and layout["seat_map"] is seat_map and layout["ticket_count"] == ticket_count:
+            return layout
+
+        store = inventory.store
+        store_rows: List[int] = []
+        row_starts: List[int] = []
+        seat_rows: List[SeatRow] = []
+        for seat_row in seat_map.rows.values():
+            row_starts.append(len(store_rows))
+            store_rows.extend(store_row for store_row in seat_row.store_rows if store_row >= 0)
+            seat_rows.append(seat_row)
+        if not store_rows:
+            return None
+
+        rows = np.array(store_rows, dtype=np.int64)
+        section_codes = np.frombuffer(store.section_codes, dtype=np.int32)[rows]
+        _, sections = np.unique(section_codes, return_inverse=True)
+        layout = {
+            "seat_map": seat_map,
+            "ticket_count": ticket_count,
+            "rows": rows,
+            "row_starts": np.array(row_starts, dtype=np.int64),
+            "seat_rows": seat_rows,
+            "sections": sections,
+            "section_count": int(sections.max()) + 1,
+            "tiers": np.frombuffer(store.type_codes, dtype=np.int8)[rows].astype(np.int64)
+        }
+        self.layouts[match_id] = layout
+        return layout
+
+    def get_multipliers(self, layout: Dict[str, Any], held: np.ndarray, days_to_game: float) -> np.ndarray:
+        """Price multiplier for every seat of a layout from sell-through, days to game, tier and section demand"""
+        sell_through = held.mean()
+        target = self.target_sell_through * min(max(1 - days_to_game / self.horizon_days, 0.0), 1.0)
+        pace = sell_through - target
+
+        # A section selling faster than the match as a whole is in demand
+        sections = layout["sections"]
+        section_sold = np.bincount(sections, weights=held, minlength=layout["section_count"])
+        section_size = np.bincount(sections, minlength=layout["section_count"])
+        section_demand = section_sold / section_size - sell_through
+
+        demand = self.pace_weight * pace + self.section_weight * section_demand[sections]
+        multipliers = 1 + self.tier_sensitivity[layout["tiers"]] * demand
+        return np.clip(multipliers, self.min_multiplier, self.max_multiplier)
+
+    def reprice_match(self, inventory: TicketInventory, match_id: str, days_to_game: float) -> Dict[str, Any]:
+        """Re-price a match's AVAILABLE tickets from their base prices in one vectorized pass.
+
+        Reserved and sold tickets keep the price their booking locked in. The
+        caller holds the match's seat locks so no ticket changes status midway.
+        """
+        start = time.perf_counter()
+        store = inventory.store
+        with store.lock:
+            layout = self.get_layout(inventory, match_id)
+            if layout is None:
+                return {"match_id": match_id, "tickets": 0, "repriced": 0}
+
+            rows = layout["rows"]
+            statuses = np.frombuffer(store.status_codes, dtype=np.int8)[rows]
+            available = statuses == self.AVAILABLE_CODE
+            multipliers = self.get_multipliers(layout, ~available, days_to_game)
+
+            # Prices are stored as float32 cents-rounded values, like Ticket.price sets them
+            prices = np.frombuffer(store.prices, dtype=np.float32)
+            base_prices = np.frombuffer(store.base_prices, dtype=np.float32)
+            available_rows = rows[available]
+            new_prices = np.round(base_prices[available_rows] * multipliers[available], 2).astype(np.float32)
+            changed = int(np.count_nonzero(prices[available_rows] != new_prices))
+            prices[available_rows] = new_prices
+            self.update_min_prices(layout, prices)
+            del prices, base_prices, statuses  # release the column buffers so the store can grow again
+
+        summary = {
+            "match_id": match_id,
+            "tickets": len(rows),
+            "available": len(available_rows),
+            "repriced": changed,
+            "sell_through": round(float(1 - available.mean()), 4),
+            "days_to_game": round(days_to_game, 2),
+            "multiplier_min": round(float(multipliers[available].min()), 3) if len(available_rows) else None,
+            "multiplier_max": round(float(multipliers[available].max()), 3) if len(available_rows) else None,
+            "milliseconds": round((time.perf_counter() - start) * 1000, 3)
+        }
+        with self.metrics_lock:
+            self.tickets_repriced_total += changed
+            self.recent_matches.append(summary)
+        return summary
+
+    @staticmethod
+    def update_min_prices(layout: Dict[str, Any], prices: np.ndarray) -> None:
+        """Reset the per-row price floors that price-capped seat searches rely on; caller holds store.lock"""
+        row_minimums = np.minimum.reduceat(prices[layout["rows"]], layout["row_starts"])
+        for seat_row, minimum in zip(layout["seat_rows"], row_minimums.tolist()):
+            seat_row.min_price = round(minimum, 2)
+
+    def get_prices(self, inventory: TicketInventory, match_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the ticket numbers and prices of a match's available tickets, for the log.
+
+        Ticket numbers, unlike store rows, are the same after recovery. The
+        caller holds the match's seat locks, as for reprice_match.
+        """
+        store = inventory.store
+        with store.lock:
+            layout = self.get_layout(inventory, match_id)
+            if layout is None:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+            rows = layout["rows"]
+            statuses = np.frombuffer(store.status_codes, dtype=np.int8)[rows]
+            rows = rows[statuses == self.AVAILABLE_CODE]
+            segments = np.array(store.segments, dtype=np.int64)
+            segment_index = np.searchsorted(segments[:, 0], rows, side="right") - 1
+            ticket_numbers = segments[segment_index, 1] + rows - segments[segment_index, 0]
+            prices = np.frombuffer(store.prices, dtype=np.float32)[rows]
+            del statuses
+        return ticket_numbers, prices
+
+    def set_prices(self, inventory: TicketInventory, match_id: str, ticket_numbers: np.ndarray,
+                   prices: np.ndarray) -> None:
+        """Put back the prices get_prices logged for a match's tickets, as recovery replays them"""
+        store = inventory.store
+        with store.lock:
+            segments = np.array(store.segments, dtype=np.int64)
+            number_starts = np.array(store.number_starts, dtype=np.int64)
+            segment_index = np.array(store.number_segments, dtype=np.int64)[
+                np.searchsorted(number_starts, ticket_numbers, side="right") - 1]
+            rows = segments[segment_index, 0] + ticket_numbers - segments[segment_index, 1]
+
+            store_prices = np.frombuffer(store.prices, dtype=np.float32)
+            store_prices[rows] = prices
+            layout = self.get_layout(inventory, match_id)
+            if layout is not None:
+                self.update_min_prices(layout, store_prices)
+            del store_prices
+
+    def run_once(self) -> List[Dict[str, Any]]:
+        """Re-price every upcoming match and record the run in the metrics"""
+        start = time.perf_counter()
+        summaries = self.reprice_matches()
+        with self.metrics_lock:
+            self.runs += 1
+            self.last_run_seconds = time.perf_counter() - start
+        return summaries
+
+    def run(self) -> None:
+        """Re-price every interval until stopped"""
+        while not self.stop_event.wait(self.interval_seconds):
+            self.run_once()
+
+    def start(self) -> bool:
+        """Start re-pricing in the background"""
+        if self.thread and self.thread.is_alive():
+            return False
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="dynamic-pricing", daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self) -> bool:
+        """Stop the background re-pricing"""
+        if not self.thread:
+            return False
+
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of pricing metrics"""
+        with self.metrics_lock:
+            return {
+                "runs": self.runs,
+                "tickets_repriced_total": self.tickets_repriced_total,
+                "last_run_seconds": round(self.last_run_seconds, 4),
+                "recent_matches": list(self.recent_matches)[-10:]
+            }
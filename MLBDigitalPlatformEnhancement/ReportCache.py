@@ -0,0 +1,70 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import os
+from typing import List, Dict, Any, Optional
+
+
+class ReportCache:
+    # Remembers, per output file, what the report was built from and a digest of what it holds,
+    # so a report whose inputs have not changed is skipped and an unchanged file is not rewritten
+    def __init__(self):
+        self.entries: Dict[str, Dict[str, Any]] = {}  # output_file -> {"inputs": ..., "digest": ...}
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.skipped = 0  # reports not run because their inputs were unchanged
+        self.generated = 0  # reports run because their inputs changed
+        self.unchanged = 0  # reports written whose content matched the file already there
+
+    def is_current(self, output_file: str, inputs: Any) -> bool:
+        """Check that a report was last built from these inputs and its file is still there"""
+        with self.lock:
+            entry = self.entries.get(output_file)
+            current = (entry is not None and "inputs" in entry and entry["inputs"] == inputs
+                       and os.path.exists(output_file))
+            if current:
+                self.skipped += 1
+            return current
+
+    def record_inputs(self, output_file: str, inputs: Any) -> None:
+        """Remember what a report was just built from"""
+        with self.lock:
+            self.entries.setdefault(output_file, {})["inputs"] = inputs
+            self.generated += 1
+
+    def get_digest(self, output_file: str) -> Optional[str]:
+        """Get the content digest of a report file, if it is known and the file is still there"""
+        with self.lock:
+            entry = self.entries.get(output_file)
+            if entry is None or not os.path.exists(output_file):
+                return None
+            return entry.get("digest")
+
+    def record_digest(self, output_file: str, digest: str, replaced: bool) -> None:
+        """Remember a report's content digest, counting it if its file did not need rewriting"""
+        with self.lock:
+            self.entries.setdefault(output_file, {})["digest"] = digest
+            if not replaced:
+                self.unchanged += 1
+
+    def invalidate(self, output_file: Optional[str] = None) -> None:
+        """Forget one report, or every report, so the next run rebuilds it"""
+        with self.lock:
+            if output_file is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(output_file, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of cache metrics"""
+        with self.lock:
+            return {
+                "reports_tracked": len(self.entries),
+                "skipped": self.skipped,
+                "generated": self.generated,
+                "unchanged": self.unchanged
+            }
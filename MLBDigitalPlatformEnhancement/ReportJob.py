@@ -0,0 +1,76 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Callable
+
+from MLBDigitalPlatformEnhancement.ReportJobStatus import ReportJobStatus
+
+
+class ReportJob:
+    def __init__(self, job_id: str, report_name: str, task: Callable[..., Any], *args, **kwargs):
+        self.job_id = job_id
+        self.report_name = report_name
+        self.task = task
+        self.args = args
+        self.kwargs = kwargs
+        self.status = ReportJobStatus.QUEUED
+        self.future: Optional[Future] = None
+        self.error = ""
+
+        # Timing
+        self.submitted_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def run(self) -> Any:
+        """Run the report; called on a pool worker"""
+        self.started_at = time.perf_counter()
+        self.status = ReportJobStatus.RUNNING
+        try:
+            result = self.task(*self.args, **self.kwargs)
+        except Exception as error:
+            self.status = ReportJobStatus.FAILED
+            self.error = str(error)
+            raise
+        finally:
+            self.finished_at = time.perf_counter()
+
+        self.status = ReportJobStatus.COMPLETED
+        return result
+
+    def cancel(self) -> bool:
+        """Cancel the job if it has not started yet"""
+        if not self.future or not self.future.cancel():
+            return False
+
+        self.status = ReportJobStatus.CANCELLED
+        self.finished_at = time.perf_counter()
+        return True
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the job and return the report's result"""
+        return self.future.result(timeout)
+
+    def is_done(self) -> bool:
+        """Check whether the job has finished, failed or been cancelled"""
+        return bool(self.future and self.future.done())
+
+    def get_job_details(self) -> Dict[str, Any]:
+        """Return a dictionary of job details, including queue and run times"""
+        queued_until = self.started_at if self.started_at is not None else self.finished_at
+        return {
+            "job_id": self.job_id,
+            "report_name": self.report_name,
+            "status": self.status.value,
+            "queue_seconds": round(queued_until - self.submitted_at, 4) if queued_until is not None else None,
+            "run_seconds": round(self.finished_at - self.started_at, 4)
+            if self.started_at is not None and self.finished_at is not None else None,
+            "error": self.error
+        }
+
+    def __str__(self) -> str:
+        return f"Report job {self.job_id}: {self.report_name} ({self.status.value})"
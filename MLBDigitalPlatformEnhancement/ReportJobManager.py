@@ -0,0 +1,81 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Callable, Deque
+
+from MLBDigitalPlatformEnhancement.IdAllocator import IdAllocator
+from MLBDigitalPlatformEnhancement.ReportJob import ReportJob
+
+
+class ReportJobManager:
+    def __init__(self, max_workers: int = 4, max_finished_jobs: int = 1000):
+        # Reports read the backend's in-memory state, so they run on threads of this process
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+        self.jobs: Dict[str, ReportJob] = {}  # job_id -> ReportJob
+        self.job_id_allocator = IdAllocator("R", 6)
+
+        # Finished jobs stay looked up by ID for a while, then the oldest are dropped
+        self.max_finished_jobs = max_finished_jobs
+        self.finished_jobs: Deque[str] = deque()  # job IDs in the order they finished
+        self.lock = threading.Lock()
+
+    def submit(self, report_name: str, task: Callable[..., Any], *args, **kwargs) -> ReportJob:
+        """Queue a report on the worker pool and return its job handle"""
+        job = ReportJob(self.job_id_allocator.next_id(), report_name, task, *args, **kwargs)
+        with self.lock:
+            self.jobs[job.job_id] = job
+        job.future = self.executor.submit(job.run)
+        job.future.add_done_callback(lambda future, job_id=job.job_id: self.job_finished(job_id))
+        return job
+
+    def job_finished(self, job_id: str) -> None:
+        """Note that a job finished, dropping the oldest finished jobs beyond max_finished_jobs"""
+        with self.lock:
+            if job_id not in self.jobs:
+                return
+            self.finished_jobs.append(job_id)
+            while len(self.finished_jobs) > self.max_finished_jobs:
+                self.jobs.pop(self.finished_jobs.popleft(), None)
+
+    def get_job(self, job_id: str) -> Optional[ReportJob]:
+        """Get a job by ID"""
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet"""
+        job = self.get_job(job_id)
+        if not job:
+            return False
+        return job.cancel()
+
+    def wait_for(self, jobs: List[ReportJob], timeout: Optional[float] = None) -> bool:
+        """Wait for jobs to finish; True if all of them ran without being cancelled or raising"""
+        done, not_done = wait([job.future for job in jobs], timeout)
+        if not_done:
+            return False
+        return all(not future.cancelled() and future.exception() is None for future in done)
+
+    def get_job_details(self) -> List[Dict[str, Any]]:
+        """Return the details of every job"""
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return [job.get_job_details() for job in jobs]
+
+    def clear_finished_jobs(self) -> int:
+        """Forget jobs that have finished; returns how many were removed"""
+        with self.lock:
+            finished = [job_id for job_id, job in self.jobs.items() if job.is_done()]
+            for job_id in finished:
+                del self.jobs[job_id]
+            self.finished_jobs = deque(job_id for job_id in self.finished_jobs if job_id in self.jobs)
+        return len(finished)
+
+    def shutdown(self, wait_for_jobs: bool = True) -> None:
+        """Stop the worker pool"""
+        self.executor.shutdown(wait=wait_for_jobs, cancel_futures=not wait_for_jobs)
@@ -0,0 +1,15 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional
+
+
+class ReportJobStatus(Enum):
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
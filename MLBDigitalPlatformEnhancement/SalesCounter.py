@@ -0,0 +1,69 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional
+
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+
+
+class SalesCounter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.status_counts: Dict[TicketStatus, int] = {status: 0 for status in TicketStatus}
+        self.revenue = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def add_ticket(self, status: TicketStatus, price: float) -> None:
+        """Count a newly added ticket"""
+        with self.lock:
+            self.status_counts[status] += 1
+            if status == TicketStatus.SOLD:
+                self.revenue += price
+
+    def add_tickets(self, status_counts: Dict[TicketStatus, int], revenue: float) -> None:
+        """Count a batch of newly added tickets"""
+        with self.lock:
+            for status, count in status_counts.items():
+                self.status_counts[status] += count
+            self.revenue += revenue
+
+    def record_transition(self, old_status: TicketStatus, new_status: TicketStatus, price: float) -> None:
+        """Move one ticket between status counts and adjust revenue"""
+        with self.lock:
+            self.status_counts[old_status] -= 1
+            self.status_counts[new_status] += 1
+            if old_status == TicketStatus.SOLD:
+                self.revenue -= price
+            if new_status == TicketStatus.SOLD:
+                self.revenue += price
+
+    def record_transitions(self, old_counts: Dict[TicketStatus, int], new_status: TicketStatus,
+                           revenue_change: float) -> None:
+        """Move a batch of tickets from their old status counts to new_status under one lock"""
+        with self.lock:
+            for old_status, count in old_counts.items():
+                self.status_counts[old_status] -= count
+                self.status_counts[new_status] += count
+            self.revenue += revenue_change
+
+    def get_totals(self) -> Dict[str, Any]:
+        """Return a consistent copy of the counters"""
+        with self.lock:
+            return {
+                "total_tickets": sum(self.status_counts.values()),
+                "available_tickets": self.status_counts[TicketStatus.AVAILABLE],
+                "reserved_tickets": self.status_counts[TicketStatus.RESERVED],
+                "sold_tickets": self.status_counts[TicketStatus.SOLD],
+                "revenue": round(self.revenue, 2)
+            }
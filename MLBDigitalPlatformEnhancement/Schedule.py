@@ -4,7 +4,8 @@ import uuid
 import time
 from enum import Enum
 import json
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left, insort
+from typing import List, Dict, Any, Optional, Tuple
 
 from MLBDigitalPlatformEnhancement.Match import Match
 from MLBDigitalPlatformEnhancement.MatchStatus import MatchStatus
@@ -14,14 +15,44 @@ class Schedule:
     def __init__(self):
         self.matches: Dict[str, Match] = {}  # match_id -> Match
 
+        # Secondary indexes, kept in step by add_match and update_match
+        self.matches_by_date: Dict[datetime.date, Dict[str, Match]] = {}  # date -> match_id -> Match
+        self.matches_by_team: Dict[str, Dict[str, Match]] = {}  # team_id -> match_id -> Match
+        self.matches_by_status: Dict[MatchStatus, Dict[str, Match]] = {status: {} for status in MatchStatus}
+        self.match_times: List[Tuple[datetime.datetime, str]] = []  # sorted (scheduled_time, match_id)
+        self.lock = threading.Lock()
+        self.listeners = []  # called with (match) after update_match changes it
+
+        # match_id -> the match's details as of its last change. Each change swaps in
+        # a new dict and never edits the old one, so readers can hold on to them
+        self.match_details: Dict[str, Dict[str, Any]] = {}
+        self.team_versions: Dict[str, int] = {}  # team_id -> bumped whenever one of its matches changes
+
     def add_match(self, match: Match) -> bool:
         """Add a match to the schedule"""
-        if match.match_id in self.matches:
-            return False
+        with self.lock:
+            if match.match_id in self.matches:
+                return False
 
-        self.matches[match.match_id] = match
+            self.matches[match.match_id] = match
+            self.matches_by_date.setdefault(match.scheduled_time.date(), {})[match.match_id] = match
+            self.matches_by_team.setdefault(match.home_team_id, {})[match.match_id] = match
+            self.matches_by_team.setdefault(match.away_team_id, {})[match.match_id] = match
+            self.matches_by_status[match.status][match.match_id] = match
+            insort(self.match_times, (match.scheduled_time, match.match_id))
+            self.match_details[match.match_id] = match.get_match_details()
+            self.mark_teams_changed(match)
         return True
 
+    def mark_teams_changed(self, match: Match) -> None:
+        """Bump the versions of both teams in a match; caller holds the lock"""
+        for team_id in (match.home_team_id, match.away_team_id):
+            self.team_versions[team_id] = self.team_versions.get(team_id, 0) + 1
+
+    def get_team_version(self, team_id: str) -> int:
+        """Get a team's schedule version, which changes whenever one of its matches does"""
+        return self.team_versions.get(team_id, 0)
+
     def get_match(self, match_id: str) -> Optional[Match]:
         """Get a match by ID"""
         return self.matches.get(match_id)
@@ -34,7 +65,10 @@ class Schedule:
 
         for key, value in kwargs.items():
             if key == "status" and isinstance(value, MatchStatus):
-                match.update_match_status(value)
+                with self.lock:
+                    self.matches_by_status[match.status].pop(match_id, None)
+                    match.update_match_status(value)
+                    self.matches_by_status[value][match_id] = match
             elif key == "score" and isinstance(value, tuple) and len(value) == 2:
                 home_score, away_score = value
                 match.update_score(home_score, away_score)
@@ -46,25 +80,34 @@ class Schedule:
             elif key == "weather" and isinstance(value, str):
                 match.update_weather(value)
 
+        with self.lock:
+            self.match_details[match_id] = match.get_match_details()
+            self.mark_teams_changed(match)
+
+        for listener in self.listeners:
+            listener(match)
         return True
 
     def get_matches_by_date(self, date: datetime.date) -> List[Match]:
         """Get all matches scheduled for a specific date"""
-        return [
-            match for match in self.matches.values()
-            if match.scheduled_time.date() == date
-        ]
+        return list(self.matches_by_date.get(date, {}).values())
 
     def get_matches_by_team(self, team_id: str) -> List[Match]:
         """Get all matches for a specific team"""
-        return [
-            match for match in self.matches.values()
-            if match.home_team_id == team_id or match.away_team_id == team_id
-        ]
+        return list(self.matches_by_team.get(team_id, {}).values())
+
+    def get_team_match_details(self, team_id: str) -> List[Dict[str, Any]]:
+        """Get a team's match details as of now; the dicts are never changed afterwards, so reads need no lock"""
+        with self.lock:
+            return [self.match_details[match_id] for match_id in self.matches_by_team.get(team_id, {})]
 
     def get_matches_by_status(self, status: MatchStatus) -> List[Match]:
         """Get all matches with a specific status"""
-        return [
-            match for match in self.matches.values()
-            if match.status == status
-        ]
+        return list(self.matches_by_status[status].values())
+
+    def get_matches_between(self, start: datetime.datetime, end: datetime.datetime) -> List[Match]:
+        """Get all matches scheduled from start up to (but not including) end, in time order"""
+        with self.lock:
+            first = bisect_left(self.match_times, (start,))
+            last = bisect_left(self.match_times, (end,))
+            return [self.matches[match_id] for _, match_id in self.match_times[first:last]]
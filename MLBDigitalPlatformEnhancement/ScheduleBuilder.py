@@ -0,0 +1,231 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from MLBDigitalPlatformEnhancement.Team import Team
+
+# (home_team_id, away_team_id, venue, scheduled_time)
+Game = Tuple[str, str, str, datetime.datetime]
+
+
+class ScheduleBuilder:
+    def __init__(self, game_duration_hours: float = 3.5, travel_hours: float = 6.0,
+                 max_consecutive_game_days: int = 20):
+        self.game_duration = datetime.timedelta(hours=game_duration_hours)
+        self.travel_time = datetime.timedelta(hours=travel_hours)  # between games at different venues
+        self.max_consecutive_game_days = max_consecutive_game_days  # a team needs a rest day after this many
+        self.venue_blackouts: Dict[str, List[Tuple[datetime.datetime, datetime.datetime]]] = {}  # venue -> [start, end)
+
+    def add_venue_blackout(self, venue: str, start: datetime.datetime, end: datetime.datetime) -> None:
+        """Mark a venue unavailable from start until end (concerts, repairs, ...)"""
+        self.venue_blackouts.setdefault(venue, []).append((start, end))
+
+    def get_merged_blackouts(self, venue: str) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """Get a venue's blackouts sorted by start, with overlapping ones merged"""
+        merged = []
+        for start, end in sorted(self.venue_blackouts.get(venue, ())):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def validate(self, games: List[Game], first_new: int = 0) -> List[Dict[str, Any]]:
+        """Find every constraint violation in a list of games in O(n log n).
+
+        Games before first_new are already scheduled; only conflicts involving
+        at least one later game are reported. Each conflict names its type and
+        the indexes of the games involved.
+        """
+        conflicts = []
+        games_by_team: Dict[str, List[int]] = {}
+        games_by_venue: Dict[str, List[int]] = {}
+        for index, (home_team_id, away_team_id, venue, scheduled_time) in enumerate(games):
+            if home_team_id == away_team_id:
+                conflicts.append({"type": "same_team", "games": [index], "team_id": home_team_id})
+                continue
+            games_by_team.setdefault(home_team_id, []).append(index)
+            games_by_team.setdefault(away_team_id, []).append(index)
+            games_by_venue.setdefault(venue, []).append(index)
+
+        # Sweep each team's and each venue's games in start order
+        for team_id, indexes in games_by_team.items():
+            indexes.sort(key=lambda index: games[index][3])
+            conflicts.extend(self.find_team_conflicts(games, team_id, indexes))
+        for venue, indexes in games_by_venue.items():
+            indexes.sort(key=lambda index: games[index][3])
+            conflicts.extend(self.find_venue_conflicts(games, venue, indexes))
+
+        return [conflict for conflict in conflicts if max(conflict["games"]) >= first_new]
+
+    def find_team_conflicts(self, games: List[Game], team_id: str, indexes: List[int]) -> List[Dict[str, Any]]:
+        """Find double bookings, too-short travel and missing rest days in one team's sorted games"""
+        conflicts = []
+        previous = None  # index of the game ending last so far
+        previous_end = None
+        streak_start = None  # first day of the current run of consecutive game days
+        last_day = None
+
+        for index in indexes:
+            venue, start = games[index][2], games[index][3]
+            if previous is not None:
+                if start < previous_end:
+                    conflicts.append({"type": "team_overlap", "games": [previous, index], "team_id": team_id})
+                elif venue != games[previous][2] and start < previous_end + self.travel_time:
+                    conflicts.append({"type": "travel", "games": [previous, index], "team_id": team_id})
+
+            end = start + self.game_duration
+            if previous is None or end > previous_end:
+                previous, previous_end = index, end
+
+            day = start.date()
+            if last_day is None or (day - last_day).days > 1:
+                streak_start = day
+            elif (day - last_day).days == 1 and (day - streak_start).days == self.max_consecutive_game_days:
+                conflicts.append({"type": "rest_days", "games": [index], "team_id": team_id,
+                                  "streak_start": streak_start.isoformat()})
+            last_day = day
+
+        return conflicts
+
+    def find_venue_conflicts(self, games: List[Game], venue: str, indexes: List[int]) -> List[Dict[str, Any]]:
+        """Find double bookings and blackout clashes in one venue's sorted games"""
+        conflicts = []
+        blackouts = self.get_merged_blackouts(venue)
+        blackout = 0
+        previous = None
+        previous_end = None
+
+        for index in indexes:
+            start = games[index][3]
+            end = start + self.game_duration
+            if previous is not None and start < previous_end:
+                conflicts.append({"type": "venue_overlap", "games": [previous, index], "venue": venue})
+            if previous is None or end > previous_end:
+                previous, previous_end = index, end
+
+            # Both lists are sorted, so the blackout pointer only moves forward
+            while blackout < len(blackouts) and blackouts[blackout][1] <= start:
+                blackout += 1
+            if blackout < len(blackouts) and blackouts[blackout][0] < end:
+                conflicts.append({"type": "venue_unavailable", "games": [index], "venue": venue,
+                                  "blackout_start": blackouts[blackout][0].isoformat()})
+
+        return conflicts
+
+    def is_venue_free(self, venue: str, start: datetime.datetime, end: datetime.datetime) -> bool:
+        """Check that no blackout of a venue overlaps [start, end)"""
+        return not any(blackout_start < end and start < blackout_end
+                       for blackout_start, blackout_end in self.venue_blackouts.get(venue, ()))
+
+    def generate_season(self, teams: List[Team], start_date: datetime.date, series_count: int = 54,
+                        series_length: int = 3, off_day_every: int = 6,
+                        first_pitch: datetime.time = datetime.time(19, 5)) -> List[Game]:
+        """Generate a season of series between every pair of teams.
+
+        Rounds pair the teams with the circle method, so each team meets every
+        other team once per len(teams) - 1 rounds. Each round is one series of
+        series_length games at the host's stadium, and every team gets an off
+        day after off_day_every series. With 30 teams, 54 rounds of 3 games
+        give the 2,430-game, 162-game season, 81 of them at home.
+        """
+        teams = sorted(teams, key=lambda team: team.team_id)
+        if len(teams) % 2:
+            raise ValueError("Season generation needs an even number of teams")
+
+        # Series as [host, guest, first start]; the team with fewer home series
+        # hosts, and a pair's next meeting moves to the other stadium
+        home_series = {team.team_id: 0 for team in teams}
+        last_hosts: Dict[frozenset, str] = {}
+        series_list: List[list] = []
+        day = start_date
+        rotation = teams[1:]
+        for series in range(series_count):
+            if series and series % off_day_every == 0:
+                day += datetime.timedelta(days=1)
+
+            lineup = [teams[0]] + rotation
+            first_start = datetime.datetime.combine(day, first_pitch)
+            for pair in range(len(lineup) // 2):
+                first, second = lineup[pair], lineup[-1 - pair]
+                if home_series[first.team_id] != home_series[second.team_id]:
+                    host_first = home_series[first.team_id] < home_series[second.team_id]
+                else:
+                    host_first = last_hosts.get(frozenset((first.team_id, second.team_id))) != first.team_id
+                host, guest = (first, second) if host_first else (second, first)
+                if not self.is_series_venue_free(host, first_start, series_length) \
+                        and self.is_series_venue_free(guest, first_start, series_length):
+                    host, guest = guest, host
+
+                home_series[host.team_id] += 1
+                last_hosts[frozenset((first.team_id, second.team_id))] = host.team_id
+                series_list.append([host, guest, first_start])
+
+            rotation = rotation[-1:] + rotation[:-1]
+            day += datetime.timedelta(days=series_length)
+
+        self.balance_home_series(series_list, home_series, series_count // 2, series_length)
+
+        games = []
+        for host, guest, first_start in series_list:
+            for game in range(series_length):
+                games.append((host.team_id, guest.team_id, host.stadium, first_start + datetime.timedelta(days=game)))
+        return games
+
+    def is_series_venue_free(self, host: Team, first_start: datetime.datetime, series_length: int) -> bool:
+        """Check that the host's stadium is free for a whole series"""
+        last_end = first_start + datetime.timedelta(days=series_length - 1) + self.game_duration
+        return self.is_venue_free(host.stadium, first_start, last_end)
+
+    def balance_home_series(self, series_list: List[list], home_series: Dict[str, int], target: int,
+                            series_length: int) -> None:
+        """Swap hosts until every team hosts target series, where blackouts allow.
+
+        A team with too many home series hands one to a guest; if that guest
+        has enough already, it hands one on in turn. The chain is found
+        breadth-first, and flipping it moves exactly one home series from the
+        first team to the last.
+        """
+        while True:
+            surplus = [team_id for team_id, count in home_series.items() if count > target]
+            if not surplus:
+                return
+
+            hosted: Dict[str, List[int]] = {}
+            for index, (host, guest, first_start) in enumerate(series_list):
+                hosted.setdefault(host.team_id, []).append(index)
+
+            moved = False
+            for start in surplus:
+                previous: Dict[str, Optional[int]] = {start: None}  # team -> series flipped to reach it
+                queue = [start]
+                end = None
+                for team_id in queue:
+                    if home_series[team_id] < target:
+                        end = team_id
+                        break
+                    for index in hosted.get(team_id, ()):
+                        host, guest, first_start = series_list[index]
+                        if guest.team_id not in previous and \
+                                self.is_series_venue_free(guest, first_start, series_length):
+                            previous[guest.team_id] = index
+                            queue.append(guest.team_id)
+                if end is None:
+                    continue
+
+                team_id = end
+                while previous[team_id] is not None:
+                    series = series_list[previous[team_id]]
+                    series[0], series[1] = series[1], series[0]
+                    team_id = series[1].team_id
+                home_series[start] -= 1
+                home_series[end] += 1
+                moved = True
+                break
+
+            if not moved:
+                return
@@ -0,0 +1,110 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional, Tuple
+
+from MLBDigitalPlatformEnhancement.SeatRow import SeatRow
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class SeatAvailabilityMap:
+    def __init__(self, store, match_id: str):
+        self.store = store
+        self.match_id = match_id
+        self.rows: Dict[int, SeatRow] = {}  # row key (see get_row_key) -> SeatRow
+        self.section_row_counts: Dict[int, int] = {}  # section code -> number of rows
+        self.ranked_rows: List[SeatRow] = []  # rows ordered best first
+        self.rows_ranked = True
+
+    def get_row_key(self, store_row: int) -> int:
+        """Pack the section and row codes of a stored ticket into one integer key"""
+        return (self.store.section_codes[store_row] << 32) | self.store.row_codes[store_row]
+
+    def get_seat_row(self, section: str, row: str) -> Optional[SeatRow]:
+        """Get the SeatRow of a section and row, if it has any seats yet"""
+        section_code = self.store.string_codes.get(section)
+        row_code = self.store.string_codes.get(row)
+        if section_code is None or row_code is None:
+            return None
+        return self.rows.get((section_code << 32) | row_code)
+
+    def add_ticket(self, store_row: int) -> None:
+        """Add a stored ticket's seat to its row"""
+        section_code = self.store.section_codes[store_row]
+        row_code = self.store.row_codes[store_row]
+        seat_row = self.rows.get(self.get_row_key(store_row))
+        if seat_row is None:
+            # Numbered rows rank by number, lettered rows by the order they were added
+            row_count = self.section_row_counts.get(section_code, 0) + 1
+            self.section_row_counts[section_code] = row_count
+            row = self.store.strings[row_code]
+            rank = int(row) if row.isdecimal() else row_count
+            seat_row = SeatRow(self.store, self.store.strings[section_code], row, rank, len(self.rows))
+            self.rows[self.get_row_key(store_row)] = seat_row
+            self.rows_ranked = False
+        seat_row.add_ticket(store_row)
+
+    def update_price(self, store_row: int) -> None:
+        """Lower the price floor of a seat's row if its new price is below it"""
+        seat_row = self.rows.get(self.get_row_key(store_row))
+        if seat_row:
+            seat_row.lower_min_price(self.store.get_price(store_row))
+
+    def move_ticket(self, store_row: int, old_status: TicketStatus, new_status: TicketStatus) -> None:
+        """Update a seat after its ticket changes status"""
+        seat_row = self.rows.get(self.get_row_key(store_row))
+        if seat_row:
+            seat_row.move_ticket(self.store.seat_positions[store_row], old_status, new_status)
+
+    def get_store_rows(self, status: TicketStatus, ticket_type: Optional[TicketType] = None) -> List[int]:
+        """Get the store rows of every seat with a status, optionally of one ticket type"""
+        store_rows = []
+        for seat_row in self.rows.values():
+            bits = seat_row.get_status_bits(status, ticket_type)
+            if bits:
+                store_rows.extend(seat_row.iter_store_rows(bits))
+        return store_rows
+
+    def count_tickets(self, status: TicketStatus, ticket_type: Optional[TicketType] = None) -> int:
+        """Count the seats with a status, optionally of one ticket type"""
+        return sum(seat_row.get_status_bits(status, ticket_type).bit_count() for seat_row in self.rows.values())
+
+    def get_ranked_rows(self) -> List[SeatRow]:
+        """Get the rows ordered from best to worst"""
+        if not self.rows_ranked:
+            self.ranked_rows = sorted(self.rows.values(), key=lambda seat_row: (seat_row.rank, seat_row.order))
+            self.rows_ranked = True
+        return self.ranked_rows
+
+    def find_best_seats(self, count: int, ticket_type: Optional[TicketType] = None,
+                        max_price: Optional[float] = None) -> List[int]:
+        """Find the store rows of the best-scoring run of count adjacent available seats in one row"""
+        if count <= 0:
+            return []
+
+        available_code = SeatRow.AVAILABLE_CODE
+        type_code = self.store.TYPE_CODES[ticket_type] if ticket_type else None
+        best = None
+        for seat_row in self.get_ranked_rows():
+            # Rows are ranked, so once a run is found only rows of the same rank can beat it
+            if best and seat_row.rank > int(best[0]):
+                break
+
+            # Cheap checks first: most rows of a busy match are skipped here
+            if max_price is not None and seat_row.min_price > max_price:
+                continue
+            free = seat_row.status_bits[available_code]
+            if type_code is not None:
+                free &= seat_row.type_bits[type_code]
+            if free.bit_count() < count:
+                continue
+
+            candidate = seat_row.find_best_run(count, ticket_type, max_price)
+            if candidate and (best is None or candidate[0] < best[0]):
+                best = candidate
+
+        return best[1] if best else []
@@ -0,0 +1,52 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class SeatMap:
+    def __init__(self, venue: str):
+        self.venue = venue
+        # (section, rows, seat labels, ticket type, price) per pricing block
+        self.blocks: List[Tuple[str, List[str], List[str], TicketType, float]] = []
+
+    def add_block(self, section: str, rows: List[str], first_seat: int, last_seat: int,
+                  ticket_type: TicketType, price: float) -> None:
+        """Add a block of seats: every row gets seats first_seat..last_seat at one type and price"""
+        # Seat labels are built once and shared by every row and every match using this map
+        seats = [str(seat) for seat in range(first_seat, last_seat + 1)]
+        self.blocks.append((section, list(rows), seats, ticket_type, price))
+
+    def iter_rows(self) -> Iterator[Tuple[str, str, List[str], TicketType, float]]:
+        """Yield (section, row, seat labels, ticket type, price) for every row of every block"""
+        for section, rows, seats, ticket_type, price in self.blocks:
+            for row in rows:
+                yield section, row, seats, ticket_type, price
+
+    def iter_seats(self) -> Iterator[Tuple[str, str, str, TicketType, float]]:
+        """Yield (section, row, seat, ticket type, price) for every seat in the venue"""
+        for section, rows, seats, ticket_type, price in self.blocks:
+            for row in rows:
+                for seat in seats:
+                    yield section, row, seat, ticket_type, price
+
+    def get_seat_count(self) -> int:
+        """Get the total number of seats in the venue"""
+        return sum(len(rows) * len(seats) for _, rows, seats, _, _ in self.blocks)
+
+    def get_seat_map_details(self) -> Dict[str, Any]:
+        """Return a dictionary of seat map details"""
+        return {
+            "venue": self.venue,
+            "block_count": len(self.blocks),
+            "seat_count": self.get_seat_count(),
+            "sections": sorted({block[0] for block in self.blocks})
+        }
+
+    def __str__(self) -> str:
+        return f"Seat map for {self.venue}: {self.get_seat_count()} seats"
@@ -0,0 +1,162 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from array import array
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class SeatRow:
+    # One SeatRow exists per row per match, so they carry no __dict__
+    __slots__ = ("store", "section", "row", "rank", "order", "first_position", "last_position",
+                 "store_rows", "status_bits", "type_bits", "min_price")
+
+    AVAILABLE_CODE = list(TicketStatus).index(TicketStatus.AVAILABLE)
+
+    def __init__(self, store, section: str, row: str, rank: int, order: int):
+        self.store = store
+        self.section = section
+        self.row = row
+        self.rank = rank  # lower ranks are closer to the field
+        self.order = order  # insertion order, breaks ties between sections
+
+        # Store row of the seat at each position, from first_position onwards (-1 for gaps)
+        self.first_position = None
+        self.last_position = None
+        self.store_rows = array('i')
+
+        # Bit n of status_bits[code] is set while the seat at position n has that status
+        self.status_bits: List[int] = [0] * len(TicketStatus)
+        self.type_bits: List[int] = [0] * len(TicketType)  # bits of the seats of each ticket type
+        self.min_price = None  # cheapest seat in the row, lets price-capped searches skip it
+
+    @staticmethod
+    def get_seat_key(seat: str):
+        """Get what identifies a seat within its row: the number of a numbered seat, else its label"""
+        return int(seat) if seat.isdecimal() else seat
+
+    def has_seat(self, seat_key) -> bool:
+        """Check whether the row already holds a seat, given its get_seat_key"""
+        if self.first_position is None:
+            return False
+        if isinstance(seat_key, int):
+            return self.get_store_row(seat_key) != -1
+        strings, seat_codes = self.store.strings, self.store.seat_codes
+        return any(strings[seat_codes[store_row]] == seat_key for store_row in self.store_rows if store_row >= 0)
+
+    def get_store_row(self, position: int) -> int:
+        """Get the store row of the seat at a position, or -1"""
+        offset = position - self.first_position
+        if offset < 0 or offset >= len(self.store_rows):
+            return -1
+        return self.store_rows[offset]
+
+    def add_ticket(self, store_row: int) -> None:
+        """Add the seat of a stored ticket to this row"""
+        seat = self.store.strings[self.store.seat_codes[store_row]]
+        numbered = seat.isdecimal()
+        position = int(seat) if numbered else len(self.store_rows) + 1
+        if self.first_position is None:
+            self.first_position = position
+            self.last_position = position
+
+        # A numbered seat's position is its number, so a second ticket for it is an error;
+        # lettered seats take the next free position
+        if numbered and self.get_store_row(position) != -1:
+            raise ValueError(f"Seat {seat} is already in row {self.row} of section {self.section}")
+        while self.get_store_row(position) != -1:
+            position += 1
+
+        # Grow the position array to cover the new seat
+        if position < self.first_position:
+            self.store_rows[0:0] = array('i', [-1]) * (self.first_position - position)
+            self.first_position = position
+        end = position - self.first_position + 1
+        if end > len(self.store_rows):
+            self.store_rows.extend(array('i', [-1]) * (end - len(self.store_rows)))
+        self.store_rows[position - self.first_position] = store_row
+        self.last_position = max(self.last_position, position)
+        self.store.seat_positions[store_row] = position
+
+        bit = 1 << position
+        self.type_bits[self.store.type_codes[store_row]] |= bit
+        self.status_bits[self.store.status_codes[store_row]] |= bit
+
+        self.lower_min_price(self.store.get_price(store_row))
+
+    def lower_min_price(self, price: float) -> None:
+        """Lower the row's price floor to price if it is cheaper; a stale, lower floor only costs a wasted scan"""
+        if self.min_price is None or price < self.min_price:
+            self.min_price = price
+
+    def move_ticket(self, position: int, old_status: TicketStatus, new_status: TicketStatus) -> None:
+        """Move a seat's bit from one status to another"""
+        bit = 1 << position
+        self.status_bits[self.store.STATUS_CODES[old_status]] &= ~bit
+        self.status_bits[self.store.STATUS_CODES[new_status]] |= bit
+
+    def get_status_bits(self, status: TicketStatus, ticket_type: Optional[TicketType] = None) -> int:
+        """Get the bits of seats with a status, optionally of one ticket type"""
+        bits = self.status_bits[self.store.STATUS_CODES[status]]
+        if ticket_type:
+            bits &= self.type_bits[self.store.TYPE_CODES[ticket_type]]
+        return bits
+
+    def iter_store_rows(self, bits: int) -> Iterator[int]:
+        """Yield the store rows of the seats whose bits are set, in seat order"""
+        first_position = self.first_position
+        while bits:
+            lowest = bits & -bits
+            yield self.store_rows[lowest.bit_length() - 1 - first_position]
+            bits ^= lowest
+
+    def get_free_bits(self, ticket_type: Optional[TicketType] = None) -> int:
+        """Get the bits of available seats, optionally of one ticket type"""
+        if ticket_type:
+            return self.status_bits[self.AVAILABLE_CODE] & self.type_bits[self.store.TYPE_CODES[ticket_type]]
+        return self.status_bits[self.AVAILABLE_CODE]
+
+    def find_best_run(self, count: int, ticket_type: Optional[TicketType] = None,
+                      max_price: Optional[float] = None) -> Optional[Tuple[float, List[int]]]:
+        """Find the most central run of count adjacent available seats; returns (score, store rows)"""
+        free = self.get_free_bits(ticket_type)
+        if free.bit_count() < count:
+            return None
+
+        # Bit n of starts is set when seats n .. n+count-1 are all free; the
+        # run length doubles each step, so this takes log2(count) shifts
+        starts = free
+        length = 1
+        while length < count:
+            step = min(length, count - length)
+            starts &= starts >> step
+            length += step
+        if not starts:
+            return None
+
+        get_price = self.store.get_price
+        row_center = (self.first_position + self.last_position) / 2
+        half_width = max(row_center - self.first_position, 1)
+        best = None
+        while starts:
+            lowest = starts & -starts
+            start = lowest.bit_length() - 1
+            starts ^= lowest
+
+            offset = start - self.first_position
+            run = self.store_rows[offset:offset + count].tolist()
+            if max_price is not None and any(get_price(store_row) > max_price for store_row in run):
+                continue
+
+            # Row rank dominates; distance from the middle of the row only breaks ties
+            distance = abs(start + (count - 1) / 2 - row_center) / half_width
+            score = self.rank + min(distance, 1) * 0.999
+            if best is None or score < best[0]:
+                best = (score, run)
+
+        return best
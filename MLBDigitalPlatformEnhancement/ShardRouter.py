@@ -0,0 +1,294 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import itertools
+import multiprocessing
+import zlib
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional
+
+from MLBDigitalPlatformEnhancement.Booking import Booking
+from MLBDigitalPlatformEnhancement.BookingIndex import BookingIndex
+from MLBDigitalPlatformEnhancement.IdAllocator import IdAllocator
+from MLBDigitalPlatformEnhancement.Match import Match
+from MLBDigitalPlatformEnhancement.SeatMap import SeatMap
+from MLBDigitalPlatformEnhancement.ShardWorker import ShardWorker
+from MLBDigitalPlatformEnhancement.Team import Team
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class ShardRouter:
+    def __init__(self, backend_class: type, shard_count: int = 2, storage_directory: Optional[str] = None,
+                 sync: bool = True, start_method: Optional[str] = None, **backend_options):
+        """Start shard_count worker processes, each owning the tickets and bookings of some matches.
+
+        backend_class is MLBBackend; each shard builds one with backend_options.
+        Teams are copied to every shard, and each match lives on the shard its
+        ID hashes to. Ticket and booking IDs carry their shard's number.
+        """
+        self.shard_count = shard_count
+        self.storage_directory = storage_directory
+        context = multiprocessing.get_context(start_method)
+
+        self.connections = []
+        self.processes = []
+        self.send_locks = [threading.Lock() for _ in range(shard_count)]
+        self.pending: List[Dict[int, Future]] = [{} for _ in range(shard_count)]  # request_id -> Future
+        self.pending_locks = [threading.Lock() for _ in range(shard_count)]
+        self.request_ids = itertools.count(1)
+        self.requests_sent = [0] * shard_count
+        self.receivers = []
+        for shard in range(shard_count):
+            router_end, worker_end = context.Pipe()
+            process = context.Process(target=ShardWorker.run, name=f"shard-{shard:02d}", daemon=True,
+                                      args=(worker_end, backend_class, shard, backend_options,
+                                            storage_directory, sync))
+            process.start()
+            worker_end.close()
+            self.connections.append(router_end)
+            self.processes.append(process)
+
+            # Replies come back in order on each pipe; a thread per shard hands them to the waiting callers
+            receiver = threading.Thread(target=self.receive, args=(shard,), name=f"shard-{shard:02d}-replies",
+                                        daemon=True)
+            receiver.start()
+            self.receivers.append(receiver)
+
+        # The router hands out team and match IDs so they are the same on every shard
+        self.team_id_allocator = IdAllocator("T", 4)
+        self.match_id_allocator = IdAllocator("M", 4)
+        if storage_directory:
+            for next_ids in self.call_all("get_next_ids"):
+                self.team_id_allocator.advance_past(next_ids["team"] - 1)
+                self.match_id_allocator.advance_past(next_ids["match"] - 1)
+        self.closed = False
+
+    # Dispatch
+    def submit(self, shard: int, method: str, *args, **kwargs) -> Future:
+        """Send a call to a shard; the Future resolves with its result"""
+        request_id = next(self.request_ids)
+        future = Future()
+        with self.pending_locks[shard]:
+            self.pending[shard][request_id] = future
+        with self.send_locks[shard]:
+            self.requests_sent[shard] += 1
+            self.connections[shard].send((request_id, method, args, kwargs))
+        return future
+
+    def call(self, shard: int, method: str, *args, **kwargs) -> Any:
+        """Call a backend method on one shard and wait for its result"""
+        return self.submit(shard, method, *args, **kwargs).result()
+
+    def call_all(self, method: str, *args, **kwargs) -> List[Any]:
+        """Scatter a call to every shard at once and gather the results in shard order"""
+        futures = [self.submit(shard, method, *args, **kwargs) for shard in range(self.shard_count)]
+        return [future.result() for future in futures]
+
+    def receive(self, shard: int) -> None:
+        """Resolve the futures of a shard's replies until its pipe closes"""
+        connection = self.connections[shard]
+        while True:
+            try:
+                request_id, ok, result = connection.recv()
+            except (EOFError, OSError):
+                break
+            with self.pending_locks[shard]:
+                future = self.pending[shard].pop(request_id)
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+
+        # The worker is gone: nobody will answer what is still pending
+        with self.pending_locks[shard]:
+            pending, self.pending[shard] = self.pending[shard], {}
+        for future in pending.values():
+            future.set_exception(ConnectionError(f"Shard {shard} stopped"))
+
+    def get_match_shard(self, match_id: str) -> int:
+        """Get the shard that owns a match; a stable hash, so every router process agrees"""
+        return zlib.crc32(match_id.encode()) % self.shard_count
+
+    def get_id_shard(self, value: str, prefix: str) -> Optional[int]:
+        """Get the shard that issued a ticket or booking ID, from the namespace after its prefix"""
+        if not value.startswith(prefix):
+            return None
+        namespace = value[len(prefix):].split("-", 1)[0]
+        if not namespace.isdecimal() or int(namespace) >= self.shard_count:
+            return None
+        return int(namespace)
+
+    # Teams and Matches
+    def add_team(self, name: str, city: str, stadium: str, division: str) -> Team:
+        """Add a team to every shard under one team ID"""
+        team_id = self.team_id_allocator.next_id()
+        return self.call_all("add_team", name, city, stadium, division, team_id=team_id)[0]
+
+    def add_match(self, home_team_id: str, away_team_id: str, venue: str,
+                  scheduled_time: datetime.datetime) -> Optional[Match]:
+        """Add a match to the shard its ID hashes to"""
+        match_id = self.match_id_allocator.next_id()
+        return self.call(self.get_match_shard(match_id), "add_match", home_team_id, away_team_id, venue,
+                         scheduled_time, match_id=match_id)
+
+    def get_match(self, match_id: str) -> Optional[Match]:
+        """Get a copy of a match from its shard"""
+        return self.call(self.get_match_shard(match_id), "get_match", match_id)
+
+    # Tickets
+    def add_tickets_for_match(self, match_id: str, section: str, row: str, seats: List[str],
+                              ticket_type: TicketType, price: float) -> List[Dict[str, Any]]:
+        """Add tickets for a match on its shard; returns their details"""
+        return self.call(self.get_match_shard(match_id), "add_tickets_for_match", match_id, section, row,
+                         seats, ticket_type, price)
+
+    def load_seat_map(self, match_id: str, seat_map: SeatMap) -> int:
+        """Load a venue's seat map for a match on its shard"""
+        return self.call(self.get_match_shard(match_id), "load_seat_map", match_id, seat_map)
+
+    def get_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """Get a ticket's details from the shard that issued it"""
+        shard = self.get_id_shard(ticket_id, "TK")
+        return None if shard is None else self.call(shard, "get_ticket", ticket_id)
+
+    def get_available_tickets(self, match_id: str,
+                              ticket_type: Optional[TicketType] = None) -> List[Dict[str, Any]]:
+        """Get the details of a match's available tickets"""
+        return self.call(self.get_match_shard(match_id), "get_available_tickets", match_id, ticket_type)
+
+    def find_best_seats(self, match_id: str, count: int, ticket_type: Optional[TicketType] = None,
+                        max_price: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Find the best adjacent available seats for a match"""
+        return self.call(self.get_match_shard(match_id), "find_best_seats", match_id, count, ticket_type,
+                         max_price)
+
+    # Bookings
+    def create_booking(self, customer_name: str, customer_email: str, customer_phone: str, match_id: str,
+                       ticket_ids: List[str], hold_ttl_seconds: Optional[float] = None) -> Optional[Booking]:
+        """Create a booking on the match's shard; returns a copy of it"""
+        return self.call(self.get_match_shard(match_id), "create_booking", customer_name, customer_email,
+                         customer_phone, match_id, ticket_ids, hold_ttl_seconds)
+
+    def get_booking(self, booking_id: str) -> Optional[Booking]:
+        """Get a copy of a booking from the shard that issued it"""
+        shard = self.get_id_shard(booking_id, "B")
+        return None if shard is None else self.call(shard, "get_booking", booking_id)
+
+    def confirm_booking(self, booking_id: str, payment_reference: str) -> bool:
+        """Confirm a booking on its shard"""
+        shard = self.get_id_shard(booking_id, "B")
+        return shard is not None and self.call(shard, "confirm_booking", booking_id, payment_reference)
+
+    def cancel_booking(self, booking_id: str) -> bool:
+        """Cancel a booking on its shard"""
+        shard = self.get_id_shard(booking_id, "B")
+        return shard is not None and self.call(shard, "cancel_booking", booking_id)
+
+    def refund_tickets(self, booking_id: str, ticket_ids: List[str]) -> int:
+        """Release some of a booking's tickets on its shard"""
+        shard = self.get_id_shard(booking_id, "B")
+        return 0 if shard is None else self.call(shard, "refund_tickets", booking_id, ticket_ids)
+
+    def start_hold_expiry(self, interval_seconds: float = 1.0) -> bool:
+        """Start hold expiry on every shard"""
+        return all(self.call_all("start_hold_expiry", interval_seconds))
+
+    # Scatter-gather reads
+    def find_bookings(self, field: str, value: str, active_only: bool = False, offset: int = 0,
+                      limit: int = 50, after: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of bookings by customer_email, customer_phone or match_id, oldest booking first"""
+        if field == "match_id":
+            return self.call(self.get_match_shard(value), "find_bookings", field, value, active_only, offset,
+                             limit, after)
+
+        # The cursor's booking time lets every shard, not just the one that issued it, find its place
+        after_time = None
+        if after is not None:
+            after_booking = self.get_booking(after)
+            if after_booking is None:
+                raise ValueError(f"Booking {after} does not exist")
+            after_time = after_booking.booking_time
+
+        # Every shard returns its first offset + limit matches (after the cursor, if any);
+        # the merged page is cut from those, by booking time as each shard orders them
+        skip = offset if after is None else 0
+        pages = self.call_all("find_bookings", field, value, active_only, 0, skip + limit, after, after_time)
+        bookings = sorted((booking for page in pages for booking in page["bookings"]),
+                          key=lambda booking: BookingIndex.get_order_key(booking.booking_time,
+                                                                         booking.booking_id))[skip:skip + limit]
+        total = sum(page["total"] for page in pages)
+        start = offset if after is None else sum(page["offset"] for page in pages)
+        end = start + len(bookings)
+        return {
+            "bookings": bookings,
+            "total": total,
+            "offset": start,
+            "limit": limit,
+            "next_offset": end if end < total else None,
+            "next_after": bookings[-1].booking_id if bookings and end < total else None
+        }
+
+    def get_sales_totals(self, match_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get ticket counts and revenue for one match, or summed across every shard"""
+        if match_id:
+            return self.call(self.get_match_shard(match_id), "get_sales_totals", match_id)
+
+        totals: Dict[str, Any] = {}
+        for shard_totals in self.call_all("get_sales_totals"):
+            for key, value in shard_totals.items():
+                totals[key] = totals.get(key, 0) + value
+        totals["revenue"] = round(totals.get("revenue", 0.0), 2)
+        return totals
+
+    def generate_ticket_sales_report(self, match_id: Optional[str] = None, output_file: str = None) -> bool:
+        """Generate a ticket sales report from every shard's counters"""
+        if match_id and not self.get_match(match_id):
+            return False
+
+        report = {
+            "report_type": "Ticket Sales",
+            "generated_at": datetime.datetime.now().isoformat(),
+            "match_id": match_id if match_id else "All Matches"
+        }
+        report.update(self.get_sales_totals(match_id))
+
+        with open(output_file, 'w') as file:
+            json.dump(report, file, indent=2)
+        return True
+
+    def get_shard_metrics(self) -> List[Dict[str, Any]]:
+        """Return per-shard process and request metrics"""
+        metrics = []
+        for shard in range(self.shard_count):
+            with self.pending_locks[shard]:
+                pending = len(self.pending[shard])
+            metrics.append({
+                "shard": shard,
+                "pid": self.processes[shard].pid,
+                "alive": self.processes[shard].is_alive(),
+                "requests_sent": self.requests_sent[shard],
+                "requests_pending": pending
+            })
+        return metrics
+
+    def close(self) -> None:
+        """Flush every shard's storage and stop the worker processes"""
+        if self.closed:
+            return
+        self.closed = True
+        futures = [self.submit(shard, None) for shard in range(self.shard_count)]
+        for future in futures:
+            future.result()
+        for shard in range(self.shard_count):
+            self.processes[shard].join()
+            self.receivers[shard].join()
+            self.connections[shard].close()
+
+    def __enter__(self) -> "ShardRouter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
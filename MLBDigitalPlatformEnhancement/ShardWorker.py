@@ -0,0 +1,64 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import os
+from multiprocessing.connection import Connection
+from typing import List, Dict, Any, Optional
+
+from MLBDigitalPlatformEnhancement.Ticket import Ticket
+
+
+class ShardWorker:
+    # A worker process owns one backend and serves calls from the router over a pipe, one at a time
+    def __init__(self, backend, connection: Connection):
+        self.backend = backend
+        self.connection = connection
+        self.requests_served = 0
+
+    @staticmethod
+    def run(connection: Connection, backend_class: type, shard_index: int, backend_options: Dict[str, Any],
+            storage_directory: Optional[str] = None, sync: bool = True) -> None:
+        """Process entry point: build this shard's backend, recover its storage, then serve until stopped"""
+        backend = backend_class(id_namespace=f"{shard_index:02d}-", **backend_options)
+        if storage_directory:
+            backend.open_storage(os.path.join(storage_directory, f"shard-{shard_index:02d}"), sync)
+        ShardWorker(backend, connection).serve()
+
+    def serve(self) -> None:
+        """Answer (request_id, method, args, kwargs) messages with (request_id, ok, result) until told to stop"""
+        while True:
+            try:
+                request_id, method, args, kwargs = self.connection.recv()
+            except EOFError:
+                break
+
+            # A request without a method asks the worker to flush its storage and exit
+            if method is None:
+                if self.backend.storage:
+                    self.backend.close_storage()
+                self.connection.send((request_id, True, self.requests_served))
+                break
+
+            try:
+                if method.startswith("_"):
+                    raise AttributeError(f"{method} cannot be called on a shard")
+                result = self.export(getattr(self.backend, method)(*args, **kwargs))
+                ok = True
+            except Exception as error:
+                result, ok = error, False
+            self.requests_served += 1
+            self.connection.send((request_id, ok, result))
+        self.connection.close()
+
+    def export(self, value: Any) -> Any:
+        """Turn results into plain data for the pipe; a Ticket view would drag its whole store along"""
+        if isinstance(value, Ticket):
+            return value.get_ticket_details()
+        if isinstance(value, list):
+            return [self.export(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.export(item) for key, item in value.items()}
+        return value
@@ -0,0 +1,47 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
+
+
+class SharedExclusiveLock:
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.shared_holders = 0
+        self.exclusive_held = False
+        self.exclusive_waiting = 0  # waiting exclusive holders block new shared ones, so they never starve
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock alongside other shared holders; not reentrant"""
+        with self.condition:
+            while self.exclusive_held or self.exclusive_waiting:
+                self.condition.wait()
+            self.shared_holders += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.shared_holders -= 1
+                if not self.shared_holders:
+                    self.condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock alone, once current shared holders have finished"""
+        with self.condition:
+            self.exclusive_waiting += 1
+            while self.exclusive_held or self.shared_holders:
+                self.condition.wait()
+            self.exclusive_waiting -= 1
+            self.exclusive_held = True
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.exclusive_held = False
+                self.condition.notify_all()
@@ -0,0 +1,157 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from bisect import bisect_left, insort
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from MLBDigitalPlatformEnhancement.Match import Match
+from MLBDigitalPlatformEnhancement.MatchStatus import MatchStatus
+from MLBDigitalPlatformEnhancement.Team import Team
+
+
+class Standings:
+    def __init__(self, teams: Dict[str, Team]):
+        self.teams = teams  # team_id -> Team, for names and divisions
+
+        # Counted results: match_id -> (scheduled_time, home_team_id, away_team_id, home runs, away runs)
+        self.results: Dict[str, Tuple[datetime.datetime, str, str, int, int]] = {}
+
+        # Per team totals, plus its decisions in schedule order for streaks and last 10
+        self.records: Dict[str, Dict[str, int]] = {}  # team_id -> wins, losses, runs_scored, runs_allowed
+        self.decisions: Dict[str, List[Tuple[datetime.datetime, str, bool]]] = {}  # (time, match_id, won)
+
+        self.cache: Dict[str, List[Dict[str, Any]]] = {}  # division -> standings rows, until its next result
+        self.lock = threading.Lock()
+
+    def get_record(self, team_id: str) -> Dict[str, int]:
+        """Get (or create) the running totals of a team"""
+        record = self.records.get(team_id)
+        if record is None:
+            record = {"wins": 0, "losses": 0, "runs_scored": 0, "runs_allowed": 0}
+            self.records[team_id] = record
+            self.decisions[team_id] = []
+        return record
+
+    def record_match(self, match: Match) -> bool:
+        """Count, correct or uncount a match's result after it changes; returns True if standings changed"""
+        result = None
+        if match.status == MatchStatus.COMPLETED:
+            result = (match.scheduled_time, match.home_team_id, match.away_team_id,
+                      match.home_team_score, match.away_team_score)
+
+        with self.lock:
+            previous = self.results.get(match.match_id)
+            if previous == result:
+                return False
+
+            if previous:
+                self.apply_result(match.match_id, previous, -1)
+                del self.results[match.match_id]
+            if result:
+                self.apply_result(match.match_id, result, 1)
+                self.results[match.match_id] = result
+        return True
+
+    def apply_result(self, match_id: str, result: Tuple[datetime.datetime, str, str, int, int], sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) one result from both teams' records; caller holds the lock"""
+        scheduled_time, home_team_id, away_team_id, home_score, away_score = result
+        for team_id, scored, allowed in ((home_team_id, home_score, away_score),
+                                         (away_team_id, away_score, home_score)):
+            record = self.get_record(team_id)
+            record["runs_scored"] += sign * scored
+            record["runs_allowed"] += sign * allowed
+
+            # A tied score has no decision
+            if scored != allowed:
+                won = scored > allowed
+                record["wins" if won else "losses"] += sign
+                decision = (scheduled_time, match_id, won)
+                if sign > 0:
+                    insort(self.decisions[team_id], decision)
+                else:
+                    decisions = self.decisions[team_id]
+                    del decisions[bisect_left(decisions, decision)]
+
+            team = self.teams.get(team_id)
+            self.cache.pop(team.division if team else None, None)
+
+    def invalidate_division(self, division: str) -> None:
+        """Drop a division's cached standings, e.g. when a team joins it"""
+        with self.lock:
+            self.cache.pop(division, None)
+
+    def rebuild(self, matches: Iterable[Match]) -> int:
+        """Recount standings from scratch, e.g. after loading a saved schedule; returns results counted"""
+        with self.lock:
+            self.results.clear()
+            self.records.clear()
+            self.decisions.clear()
+            self.cache.clear()
+        for match in matches:
+            self.record_match(match)
+        return len(self.results)
+
+    def get_streak(self, team_id: str) -> str:
+        """Get a team's current streak, like W3 or L1"""
+        decisions = self.decisions.get(team_id)
+        if not decisions:
+            return ""
+
+        won = decisions[-1][2]
+        length = 0
+        for decision in reversed(decisions):
+            if decision[2] != won:
+                break
+            length += 1
+        return f"{'W' if won else 'L'}{length}"
+
+    def build_division(self, division: str) -> List[Dict[str, Any]]:
+        """Build the standings rows of a division, best record first; caller holds the lock"""
+        rows = []
+        for team in self.teams.values():
+            if team.division != division:
+                continue
+
+            record = self.get_record(team.team_id)
+            wins, losses = record["wins"], record["losses"]
+            last_ten = self.decisions[team.team_id][-10:]
+            last_ten_wins = sum(1 for decision in last_ten if decision[2])
+            rows.append({
+                "team_id": team.team_id,
+                "name": team.name,
+                "wins": wins,
+                "losses": losses,
+                "winning_percentage": round(wins / (wins + losses), 3) if wins + losses else 0,
+                "games_behind": 0.0,
+                "streak": self.get_streak(team.team_id),
+                "last_10": f"{last_ten_wins}-{len(last_ten) - last_ten_wins}",
+                "runs_scored": record["runs_scored"],
+                "runs_allowed": record["runs_allowed"],
+                "run_differential": record["runs_scored"] - record["runs_allowed"]
+            })
+
+        rows.sort(key=lambda row: (-row["winning_percentage"], -row["wins"], -row["run_differential"],
+                                   row["team_id"]))
+        if rows:
+            leader = rows[0]
+            for rank, row in enumerate(rows, 1):
+                row["rank"] = rank
+                row["games_behind"] = ((leader["wins"] - row["wins"]) + (row["losses"] - leader["losses"])) / 2
+        return rows
+
+    def get_division_standings(self, division: str) -> List[Dict[str, Any]]:
+        """Get a division's standings, rebuilt only if a result came in since the last call"""
+        with self.lock:
+            rows = self.cache.get(division)
+            if rows is None:
+                rows = self.build_division(division)
+                self.cache[division] = rows
+            return [dict(row) for row in rows]
+
+    def get_standings(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the standings of every division"""
+        divisions = sorted({team.division for team in list(self.teams.values())})
+        return {division: self.get_division_standings(division) for division in divisions}
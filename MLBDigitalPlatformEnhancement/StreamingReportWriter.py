@@ -0,0 +1,119 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import gzip
+import hashlib
+import os
+from typing import List, Dict, Any, Optional, Iterable, TextIO
+
+
+class StreamingReportWriter:
+    FORMATS = ("json", "compact", "ndjson")
+    VOLATILE_FIELDS = ("generated_at",)  # header fields left out of the content digest
+
+    def __init__(self, output_file: str, output_format: str = "json", compress: Optional[bool] = None,
+                 previous_digest: Optional[str] = None):
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unknown report format: {output_format}")
+
+        self.output_file = output_file
+        self.output_format = output_format  # json: indented, compact: one line, ndjson: one record per line
+        self.compress = output_file.endswith(".gz") if compress is None else compress
+
+        # A report whose digest matches previous_digest leaves the existing file alone
+        self.previous_digest = previous_digest
+        self.digest: Optional[str] = None
+        self.replaced = False
+        self.hash = None
+
+    def open_output(self, path: str) -> TextIO:
+        """Open an output file, gzip-compressed if requested"""
+        if self.compress:
+            return gzip.open(path, 'wt', encoding='utf-8')
+        return open(path, 'w', encoding='utf-8')
+
+    def write_report(self, header: Dict[str, Any], records_key: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Write the header fields, then stream the records one at a time; returns the record count.
+
+        The report goes to a temporary file that replaces output_file once
+        complete, unless its content digest shows nothing changed.
+        """
+        stable_header = {key: value for key, value in header.items() if key not in self.VOLATILE_FIELDS}
+        self.hash = hashlib.sha256(json.dumps([self.output_format, stable_header], sort_keys=True).encode())
+
+        temporary_file = f"{self.output_file}.{uuid.uuid4().hex}.tmp"
+        try:
+            with self.open_output(temporary_file) as file:
+                if self.output_format == "ndjson":
+                    count = self.write_ndjson(file, header, records_key, records)
+                elif self.output_format == "compact":
+                    count = self.write_compact(file, header, records_key, records)
+                else:
+                    count = self.write_indented(file, header, records_key, records)
+        except BaseException:
+            os.remove(temporary_file)
+            raise
+
+        self.digest = self.hash.hexdigest()
+        if self.digest == self.previous_digest and os.path.exists(self.output_file):
+            os.remove(temporary_file)
+        else:
+            os.replace(temporary_file, self.output_file)
+            self.replaced = True
+        return count
+
+    def write(self, file: TextIO, text: str) -> None:
+        """Write part of the report body and add it to the content digest"""
+        file.write(text)
+        self.hash.update(text.encode())
+
+    def write_ndjson(self, file: TextIO, header: Dict[str, Any], records_key: str,
+                     records: Iterable[Dict[str, Any]]) -> int:
+        """First line is the header; every following line is one record"""
+        file.write(json.dumps(dict(header, records=records_key), separators=(',', ':')))
+        file.write("\n")
+
+        count = 0
+        for record in records:
+            self.write(file, json.dumps(record, separators=(',', ':')))
+            self.write(file, "\n")
+            count += 1
+        return count
+
+    def write_compact(self, file: TextIO, header: Dict[str, Any], records_key: str,
+                      records: Iterable[Dict[str, Any]]) -> int:
+        """One JSON document on a single line, as json.dump with compact separators would write it"""
+        file.write("{")
+        for key, value in header.items():
+            file.write(f"{json.dumps(key)}:{json.dumps(value, separators=(',', ':'))},")
+        self.write(file, f"{json.dumps(records_key)}:[")
+
+        count = 0
+        for record in records:
+            if count:
+                self.write(file, ",")
+            self.write(file, json.dumps(record, separators=(',', ':')))
+            count += 1
+
+        self.write(file, "]}")
+        return count
+
+    def write_indented(self, file: TextIO, header: Dict[str, Any], records_key: str,
+                       records: Iterable[Dict[str, Any]]) -> int:
+        """One JSON document, byte-for-byte what json.dump(report, indent=2) would write"""
+        file.write("{\n")
+        for key, value in header.items():
+            file.write(f"  {json.dumps(key)}: {json.dumps(value, indent=2).replace(chr(10), chr(10) + '  ')},\n")
+        self.write(file, f"  {json.dumps(records_key)}: [")
+
+        count = 0
+        for record in records:
+            self.write(file, ",\n    " if count else "\n    ")
+            self.write(file, json.dumps(record, indent=2).replace("\n", "\n    "))
+            count += 1
+
+        self.write(file, "\n  ]\n}" if count else "]\n}")
+        return count
@@ -0,0 +1,29 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Hashable, Iterable, Iterator
+
+
+class StripedLock:
+    def __init__(self, stripe_count: int = 256):
+        self.locks = [threading.Lock() for _ in range(stripe_count)]
+
+    def get_stripe(self, key: Hashable) -> int:
+        """Get the index of the lock guarding a key"""
+        return hash(key) % len(self.locks)
+
+    @contextmanager
+    def hold(self, keys: Iterable[Hashable]) -> Iterator[None]:
+        """Hold the locks for all keys; stripes are taken in index order so callers never deadlock"""
+        stripes = sorted({self.get_stripe(key) for key in keys})
+        for stripe in stripes:
+            self.locks[stripe].acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                self.locks[stripe].release()
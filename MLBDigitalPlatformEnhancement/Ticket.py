@@ -11,24 +11,75 @@ from MLBDigitalPlatformEnhancement.TicketType import TicketType
 
 
 class Ticket:
-    def __init__(self, ticket_id: str, match_id: str, section: str, row: str, seat: str,
-                ticket_type: TicketType, price: float):
-        self.ticket_id = ticket_id
-        self.match_id = match_id
-        self.section = section
-        self.row = row
-        self.seat = seat
-        self.ticket_type = ticket_type
-        self.price = price
-        self.status = TicketStatus.AVAILABLE
-        self.booking_id = None
+    # A lightweight view of one row of a TicketStore; all fields live in the store's columns
+    __slots__ = ("store", "row_index")
+
+    def __init__(self, store, row_index: int):
+        self.store = store
+        self.row_index = row_index
+
+    @property
+    def ticket_id(self) -> str:
+        return self.store.get_ticket_id(self.row_index)
+
+    @property
+    def match_id(self) -> str:
+        return self.store.strings[self.store.match_codes[self.row_index]]
+
+    @property
+    def section(self) -> str:
+        return self.store.strings[self.store.section_codes[self.row_index]]
+
+    @property
+    def row(self) -> str:
+        return self.store.strings[self.store.row_codes[self.row_index]]
+
+    @property
+    def seat(self) -> str:
+        return self.store.strings[self.store.seat_codes[self.row_index]]
+
+    @property
+    def seat_position(self) -> int:
+        return self.store.seat_positions[self.row_index]
+
+    @property
+    def ticket_type(self) -> TicketType:
+        return self.store.get_ticket_type(self.row_index)
+
+    @property
+    def price(self) -> float:
+        return self.store.get_price(self.row_index)
+
+    @price.setter
+    def price(self, price: float) -> None:
+        # A price set by hand is the new list price that dynamic pricing scales from
+        self.store.set_price(self.row_index, price)
+
+    @property
+    def status(self) -> TicketStatus:
+        return self.store.get_status(self.row_index)
+
+    @property
+    def booking_id(self) -> Optional[str]:
+        return self.store.booking_ids.get(self.row_index)
+
+    @booking_id.setter
+    def booking_id(self, booking_id: Optional[str]) -> None:
+        if booking_id is None:
+            self.store.booking_ids.pop(self.row_index, None)
+        else:
+            self.store.booking_ids[self.row_index] = booking_id
+
+    def set_status(self, status: TicketStatus) -> None:
+        """Change the ticket status; the store keeps the inventory index in step"""
+        self.store.set_status(self.row_index, status)
 
     def reserve_ticket(self, booking_id: str) -> bool:
         """Reserve this ticket"""
         if self.status != TicketStatus.AVAILABLE:
             return False
 
-        self.status = TicketStatus.RESERVED
+        self.set_status(TicketStatus.RESERVED)
         self.booking_id = booking_id
         return True
 
@@ -37,7 +88,7 @@ class Ticket:
         if self.status != TicketStatus.RESERVED:
             return False
 
-        self.status = TicketStatus.SOLD
+        self.set_status(TicketStatus.SOLD)
         return True
 
     def cancel_reservation(self) -> bool:
@@ -45,7 +96,7 @@ class Ticket:
         if self.status not in [TicketStatus.RESERVED, TicketStatus.SOLD]:
             return False
 
-        self.status = TicketStatus.AVAILABLE
+        self.set_status(TicketStatus.AVAILABLE)
         self.booking_id = None
         return True
 
@@ -63,5 +114,11 @@ class Ticket:
             "booking_id": self.booking_id
         }
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Ticket) and self.store is other.store and self.row_index == other.row_index
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.row_index))
+
     def __str__(self) -> str:
         return f"Ticket {self.ticket_id}: {self.section} {self.row}-{self.seat} ({self.ticket_type.value})"
@@ -0,0 +1,165 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from MLBDigitalPlatformEnhancement.SalesCounter import SalesCounter
+from MLBDigitalPlatformEnhancement.SeatAvailabilityMap import SeatAvailabilityMap
+from MLBDigitalPlatformEnhancement.SeatRow import SeatRow
+from MLBDigitalPlatformEnhancement.Ticket import Ticket
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketStore import TicketStore
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class TicketInventory:
+    def __init__(self, store: TicketStore):
+        self.store = store
+        store.inventory = self
+
+        # match_id -> SeatAvailabilityMap; its per-row status and type bitsets
+        # index every ticket of the match by status and type
+        self.seat_maps: Dict[str, SeatAvailabilityMap] = {}
+
+        # Sales counters, updated on every state transition
+        self.match_counters: Dict[str, SalesCounter] = {}  # match_id -> SalesCounter
+        self.total_counter = SalesCounter()
+
+    def get_seat_map(self, match_id: str) -> SeatAvailabilityMap:
+        """Get (or create) the seat map and counters for a match"""
+        seat_map = self.seat_maps.get(match_id)
+        if seat_map is None:
+            self.match_counters[match_id] = SalesCounter()
+            seat_map = SeatAvailabilityMap(self.store, match_id)
+            self.seat_maps[match_id] = seat_map
+        return seat_map
+
+    def add_tickets(self, store_rows: Iterable[int]) -> None:
+        """Index a batch of new tickets, updating the counters once per match"""
+        store = self.store
+        batch_counts: Dict[str, Dict[TicketStatus, int]] = {}
+        batch_revenue: Dict[str, float] = {}
+        for store_row in store_rows:
+            match_id = store.strings[store.match_codes[store_row]]
+            self.get_seat_map(match_id).add_ticket(store_row)
+
+            status_counts = batch_counts.get(match_id)
+            if status_counts is None:
+                status_counts = {status: 0 for status in TicketStatus}
+                batch_counts[match_id] = status_counts
+                batch_revenue[match_id] = 0.0
+            status = store.get_status(store_row)
+            status_counts[status] += 1
+            if status == TicketStatus.SOLD:
+                batch_revenue[match_id] += store.get_price(store_row)
+
+        for match_id, status_counts in batch_counts.items():
+            self.match_counters[match_id].add_tickets(status_counts, batch_revenue[match_id])
+            self.total_counter.add_tickets(status_counts, batch_revenue[match_id])
+
+    def update_price(self, store_row: int) -> None:
+        """Keep the price floor of a ticket's seat row after its price changes"""
+        seat_map = self.seat_maps.get(self.store.strings[self.store.match_codes[store_row]])
+        if seat_map:
+            seat_map.update_price(store_row)
+
+    def has_duplicate_seats(self, match_id: str, seat_rows: Iterable[Tuple[str, str, List[str]]]) -> bool:
+        """Check whether any seat of (section, row, seat labels) appears twice, or already has a ticket for the match"""
+        seen: Dict[Tuple[str, str], set] = {}  # (section, row) -> seat keys
+        for section, row, seats in seat_rows:
+            keys = seen.setdefault((section, row), set())
+            count = len(keys)
+            keys.update(SeatRow.get_seat_key(seat) for seat in seats)
+            if len(keys) != count + len(seats):
+                return True
+
+        seat_map = self.seat_maps.get(match_id)
+        if seat_map is None:
+            return False
+        for (section, row), keys in seen.items():
+            seat_row = seat_map.get_seat_row(section, row)
+            if seat_row and any(seat_row.has_seat(key) for key in keys):
+                return True
+        return False
+
+    def move_ticket(self, store_row: int, old_status: TicketStatus, new_status: TicketStatus) -> None:
+        """Move a ticket to the bitsets and counters matching its new status"""
+        match_id = self.store.strings[self.store.match_codes[store_row]]
+        self.get_seat_map(match_id).move_ticket(store_row, old_status, new_status)
+
+        price = self.store.get_price(store_row)
+        self.match_counters[match_id].record_transition(old_status, new_status, price)
+        self.total_counter.record_transition(old_status, new_status, price)
+
+    def move_tickets(self, store_rows: List[int], old_statuses: List[TicketStatus],
+                     new_status: TicketStatus) -> None:
+        """Move a batch of tickets to new_status, updating the counters once per match"""
+        store = self.store
+        batch_counts: Dict[int, Dict[TicketStatus, int]] = {}  # match code -> old status -> count
+        batch_revenue: Dict[int, float] = {}
+        seat_maps: Dict[int, SeatAvailabilityMap] = {}
+        for store_row, old_status in zip(store_rows, old_statuses):
+            match_code = store.match_codes[store_row]
+            seat_map = seat_maps.get(match_code)
+            if seat_map is None:
+                seat_map = self.get_seat_map(store.strings[match_code])
+                seat_maps[match_code] = seat_map
+                batch_counts[match_code] = {}
+                batch_revenue[match_code] = 0.0
+            seat_map.move_ticket(store_row, old_status, new_status)
+
+            status_counts = batch_counts[match_code]
+            status_counts[old_status] = status_counts.get(old_status, 0) + 1
+            if old_status == TicketStatus.SOLD:
+                batch_revenue[match_code] -= store.get_price(store_row)
+            if new_status == TicketStatus.SOLD:
+                batch_revenue[match_code] += store.get_price(store_row)
+
+        for match_code, status_counts in batch_counts.items():
+            match_id = store.strings[match_code]
+            self.match_counters[match_id].record_transitions(status_counts, new_status, batch_revenue[match_code])
+            self.total_counter.record_transitions(status_counts, new_status, batch_revenue[match_code])
+
+    def get_tickets(self, match_id: str, status: TicketStatus,
+                    ticket_type: Optional[TicketType] = None) -> List[Ticket]:
+        """Get the tickets of a match with a given status (and optionally type)"""
+        seat_map = self.seat_maps.get(match_id)
+        if not seat_map:
+            return []
+        return self.store.get_tickets(seat_map.get_store_rows(status, ticket_type))
+
+    def count_tickets(self, match_id: str, status: TicketStatus,
+                      ticket_type: Optional[TicketType] = None) -> int:
+        """Count the tickets of a match with a given status (and optionally type)"""
+        seat_map = self.seat_maps.get(match_id)
+        if not seat_map:
+            return 0
+
+        if ticket_type:
+            return seat_map.count_tickets(status, ticket_type)
+        return self.match_counters[match_id].status_counts[status]
+
+    def find_best_seats(self, match_id: str, count: int, ticket_type: Optional[TicketType] = None,
+                        max_price: Optional[float] = None) -> List[Ticket]:
+        """Find the best run of count adjacent available seats for a match"""
+        seat_map = self.seat_maps.get(match_id)
+        if not seat_map:
+            return []
+        return self.store.get_tickets(seat_map.find_best_seats(count, ticket_type, max_price))
+
+    def get_sales_totals(self, match_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get ticket counts and revenue for one match, or for all matches"""
+        if not match_id:
+            return self.total_counter.get_totals()
+
+        counter = self.match_counters.get(match_id)
+        if not counter:
+            return SalesCounter().get_totals()
+        return counter.get_totals()
+
+    def get_match_ids(self) -> List[str]:
+        """Get all match IDs that have tickets"""
+        return list(self.seat_maps.keys())
@@ -0,0 +1,227 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+
+from MLBDigitalPlatformEnhancement.Ticket import Ticket
+from MLBDigitalPlatformEnhancement.TicketStatus import TicketStatus
+from MLBDigitalPlatformEnhancement.TicketType import TicketType
+
+
+class TicketStore:
+    # Enum members are stored as small integer codes
+    STATUSES: List[TicketStatus] = list(TicketStatus)
+    STATUS_CODES: Dict[TicketStatus, int] = {status: code for code, status in enumerate(TicketStatus)}
+    TYPES: List[TicketType] = list(TicketType)
+    TYPE_CODES: Dict[TicketType, int] = {ticket_type: code for code, ticket_type in enumerate(TicketType)}
+
+    def __init__(self, id_prefix: str = "TK", id_width: int = 6):
+        self.id_prefix = id_prefix
+        self.id_width = id_width
+        self.lock = threading.Lock()  # guards appends; column updates are single item writes
+
+        # Match IDs, sections, rows and seat labels are interned once and stored as codes
+        self.strings: List[str] = []
+        self.string_codes: Dict[str, int] = {}
+
+        # One entry per ticket, indexed by row
+        self.match_codes = array('i')
+        self.section_codes = array('i')
+        self.row_codes = array('i')
+        self.seat_codes = array('i')
+        self.seat_positions = array('i')  # position of the seat within its row, set by SeatRow
+        self.type_codes = array('b')
+        self.status_codes = array('b')
+        self.prices = array('f')
+        self.base_prices = array('f')  # price as listed; dynamic pricing scales available tickets from it
+        self.booking_ids: Dict[int, str] = {}  # row -> booking_id, only for held tickets
+
+        # Ticket numbers are handed out in runs, so they are stored as
+        # (first_row, first_number, count) segments instead of per ticket
+        self.segments: List[Tuple[int, int, int]] = []  # in row order
+        self.segment_rows: List[int] = []  # first_row of each segment
+        self.number_starts: List[int] = []  # first_number of each segment, sorted
+        self.number_segments: List[int] = []  # segment index for each entry of number_starts
+
+        self.inventory = None  # TicketInventory notified of status changes, if any
+        self.listeners = []  # called with (row, price) after set_price changes a list price
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["lock"], state["listeners"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+        self.listeners = []
+
+    def intern(self, value: str) -> int:
+        """Get the code for a string, adding it if needed; caller holds the lock"""
+        code = self.string_codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self.string_codes[value] = code
+        return code
+
+    def add_segment(self, first_row: int, first_number: int, count: int) -> None:
+        """Record that rows first_row.. hold ticket numbers first_number.."""
+        if self.segments:
+            last_row, last_number, last_count = self.segments[-1]
+            if last_row + last_count == first_row and last_number + last_count == first_number:
+                self.segments[-1] = (last_row, last_number, last_count + count)
+                return
+
+        segment_index = len(self.segments)
+        self.segments.append((first_row, first_number, count))
+        self.segment_rows.append(first_row)
+
+        position = bisect_right(self.number_starts, first_number)
+        self.number_starts.insert(position, first_number)
+        self.number_segments.insert(position, segment_index)
+
+    def add_tickets(self, ticket_numbers: range, match_id: str, section: str, row: str,
+                    seats: List[str], ticket_type: TicketType, price: float) -> range:
+        """Append one ticket per seat of a row; returns the store rows used"""
+        count = len(seats)
+        with self.lock:
+            seat_codes = [self.intern(seat) for seat in seats]
+            first_row = len(self.status_codes)
+            self.match_codes.extend(array('i', [self.intern(match_id)]) * count)
+            self.section_codes.extend(array('i', [self.intern(section)]) * count)
+            self.row_codes.extend(array('i', [self.intern(row)]) * count)
+            self.seat_codes.extend(seat_codes)
+            self.seat_positions.extend(array('i', [-1]) * count)
+            self.type_codes.extend(array('b', [self.TYPE_CODES[ticket_type]]) * count)
+            self.status_codes.extend(array('b', [self.STATUS_CODES[TicketStatus.AVAILABLE]]) * count)
+            self.prices.extend(array('f', [price]) * count)
+            self.base_prices.extend(array('f', [price]) * count)
+            self.add_segment(first_row, ticket_numbers[0], count)
+        return range(first_row, first_row + count)
+
+    def format_ticket_id(self, number: int) -> str:
+        """Format a ticket number as a ticket ID"""
+        return f"{self.id_prefix}{number:0{self.id_width}d}"
+
+    def get_ticket_id(self, row: int) -> str:
+        """Get the ticket ID stored at a row"""
+        segment = self.segments[bisect_right(self.segment_rows, row) - 1]
+        return self.format_ticket_id(segment[1] + row - segment[0])
+
+    def get_row(self, ticket_id: str) -> Optional[int]:
+        """Get the row of a ticket ID, or None if it is not in the store"""
+        if not ticket_id.startswith(self.id_prefix):
+            return None
+        number = ticket_id[len(self.id_prefix):]
+        if not number.isdecimal():
+            return None
+        number = int(number)
+
+        position = bisect_right(self.number_starts, number) - 1
+        if position < 0:
+            return None
+        first_row, first_number, count = self.segments[self.number_segments[position]]
+        if number >= first_number + count:
+            return None
+        return first_row + number - first_number
+
+    def get_status(self, row: int) -> TicketStatus:
+        """Get the status of the ticket at a row"""
+        return self.STATUSES[self.status_codes[row]]
+
+    def set_price(self, row: int, price: float) -> None:
+        """Set the list price of the ticket at a row and tell the inventory and listeners"""
+        with self.lock:
+            self.prices[row] = price
+            self.base_prices[row] = price
+            if self.inventory:
+                self.inventory.update_price(row)
+
+        for listener in self.listeners:
+            listener(row, price)
+
+    def set_status(self, row: int, status: TicketStatus) -> None:
+        """Change the status of the ticket at a row and tell the inventory"""
+        old_status = self.STATUSES[self.status_codes[row]]
+        self.status_codes[row] = self.STATUS_CODES[status]
+        if self.inventory:
+            self.inventory.move_ticket(row, old_status, status)
+
+    def set_statuses(self, rows: List[int], status: TicketStatus) -> None:
+        """Change the status of a batch of rows and tell the inventory once"""
+        code = self.STATUS_CODES[status]
+        status_codes = self.status_codes
+        old_statuses = [self.STATUSES[status_codes[row]] for row in rows]
+        for row in rows:
+            status_codes[row] = code
+        if self.inventory:
+            self.inventory.move_tickets(rows, old_statuses, status)
+
+    def confirm_sales(self, rows: Iterable[int]) -> int:
+        """Mark the reserved tickets among rows as sold; returns how many were"""
+        reserved = self.STATUS_CODES[TicketStatus.RESERVED]
+        rows = [row for row in rows if self.status_codes[row] == reserved]
+        self.set_statuses(rows, TicketStatus.SOLD)
+        return len(rows)
+
+    def cancel_reservations(self, rows: Iterable[int]) -> int:
+        """Release the reserved or sold tickets among rows; returns how many were"""
+        held = (self.STATUS_CODES[TicketStatus.RESERVED], self.STATUS_CODES[TicketStatus.SOLD])
+        rows = [row for row in rows if self.status_codes[row] in held]
+        self.set_statuses(rows, TicketStatus.AVAILABLE)
+        for row in rows:
+            self.booking_ids.pop(row, None)
+        return len(rows)
+
+    def get_ticket_type(self, row: int) -> TicketType:
+        """Get the type of the ticket at a row"""
+        return self.TYPES[self.type_codes[row]]
+
+    def get_price(self, row: int) -> float:
+        """Get the price of the ticket at a row, rounded back to cents"""
+        return round(self.prices[row], 2)
+
+    # Mapping interface: ticket_id -> Ticket view
+    def get(self, ticket_id: str, default: Optional[Ticket] = None) -> Optional[Ticket]:
+        """Get a ticket view by ID"""
+        row = self.get_row(ticket_id)
+        return default if row is None else Ticket(self, row)
+
+    def get_ticket(self, row: int) -> Ticket:
+        """Get a ticket view for a row"""
+        return Ticket(self, row)
+
+    def get_tickets(self, rows: Iterable[int]) -> List[Ticket]:
+        """Get ticket views for several rows"""
+        return [Ticket(self, row) for row in rows]
+
+    def values(self) -> Iterator[Ticket]:
+        """Iterate over views of every ticket"""
+        for row in range(len(self.status_codes)):
+            yield Ticket(self, row)
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over every ticket ID"""
+        for row in range(len(self.status_codes)):
+            yield self.get_ticket_id(row)
+
+    def __getitem__(self, ticket_id: str) -> Ticket:
+        ticket = self.get(ticket_id)
+        if ticket is None:
+            raise KeyError(ticket_id)
+        return ticket
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return self.get_row(ticket_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return len(self.status_codes)
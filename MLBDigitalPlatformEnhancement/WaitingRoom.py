@@ -0,0 +1,225 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+from collections import deque
+from typing import List, Dict, Any, Optional, Deque, Tuple
+
+
+class WaitingRoom:
+    LATENCY_SAMPLES = 10000  # most recent waits and service times kept for percentiles
+
+    def __init__(self, admission_rate: float, burst: Optional[int] = None, max_queue_depth: int = 100000,
+                 max_active: Optional[int] = None, admission_window_seconds: float = 300.0):
+        if admission_rate <= 0:
+            raise ValueError(f"Admission rate must be positive: {admission_rate}")
+
+        self.admission_rate = admission_rate  # buyers admitted per second
+        self.burst = burst if burst is not None else max(1, int(admission_rate))  # most admitted at once
+        self.max_queue_depth = max_queue_depth  # joins beyond this are turned away
+        self.max_active = max_active  # admitted buyers allowed at once, if limited
+        self.admission_window = admission_window_seconds  # how long an admitted buyer may shop
+
+        # Each buyer gets a token and a sequence number in arrival order. The
+        # queue holds the waiting tokens; tokens that leave are dropped lazily
+        self.next_sequence = 1
+        self.admitted_through = 0  # highest sequence admitted so far
+        self.entries: Dict[str, List] = {}  # token -> [sequence, joined_at, admitted_at]
+        self.queue: Deque[str] = deque()
+        self.waiting = 0
+        self.active: Dict[str, float] = {}  # admitted token -> deadline
+        self.deadlines: Deque[Tuple[float, str]] = deque()  # (deadline, token) in admission order
+        self.unannounced: Deque[str] = deque(maxlen=max_queue_depth)  # admitted since the last admit() call
+
+        # Token bucket refilled at admission_rate
+        self.allowance = float(self.burst)
+        self.last_refill: Optional[float] = None
+        self.closed = False
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.joined = 0
+        self.shed = 0
+        self.admitted = 0
+        self.completed = 0
+        self.expired = 0
+        self.left = 0
+        self.max_depth_seen = 0
+        self.wait_times: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self.service_times: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+
+    def join(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Take a place in the queue; returns a position token, or a rejection with a retry hint"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            self.admit_due(now)
+            if self.closed or self.waiting >= self.max_queue_depth:
+                self.shed += 1
+                return {
+                    "status": "closed" if self.closed else "rejected",
+                    "retry_after_seconds": None if self.closed else round(self.waiting / self.admission_rate, 1)
+                }
+
+            token = uuid.uuid4().hex
+            sequence = self.next_sequence
+            self.next_sequence += 1
+            self.entries[token] = [sequence, now, None]
+            self.queue.append(token)
+            self.waiting += 1
+            self.joined += 1
+            self.max_depth_seen = max(self.max_depth_seen, self.waiting)
+
+            # A free slot admits the new buyer straight away
+            self.admit_due(now)
+            return self.get_entry_status(token, now)
+
+    def get_status(self, token: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Get a token's place in the queue, or whether it has been admitted"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            self.admit_due(now)
+            return self.get_entry_status(token, now)
+
+    def get_entry_status(self, token: str, now: float) -> Dict[str, Any]:
+        """Describe one token; caller holds the lock"""
+        entry = self.entries.get(token)
+        if entry is None:
+            return {"token": token, "status": "unknown"}
+
+        sequence, joined_at, admitted_at = entry
+        if admitted_at is not None:
+            return {"token": token, "status": "admitted",
+                    "admitted_until": self.active[token]}
+
+        position = sequence - self.admitted_through
+        return {"token": token, "status": "queued", "position": position,
+                "estimated_wait_seconds": round(position / self.admission_rate, 1)}
+
+    def admit(self, now: Optional[float] = None) -> List[str]:
+        """Admit every buyer the rate allows at a monotonic time.
+
+        Any call admits whoever is due, so this returns every token admitted
+        since the previous admit() call, e.g. to notify those buyers.
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            self.admit_due(now)
+            admitted = list(self.unannounced)
+            self.unannounced.clear()
+            return admitted
+
+    def admit_due(self, now: float) -> None:
+        """Expire overdue sessions, refill the bucket and admit from the queue head; caller holds the lock"""
+        while self.deadlines and self.deadlines[0][0] <= now:
+            deadline, token = self.deadlines.popleft()
+            if self.active.get(token) == deadline:
+                del self.active[token]
+                del self.entries[token]
+                self.expired += 1
+
+        if self.last_refill is not None:
+            self.allowance = min(float(self.burst),
+                                 self.allowance + (now - self.last_refill) * self.admission_rate)
+        self.last_refill = now
+
+        while self.queue and self.allowance >= 1:
+            if self.max_active is not None and len(self.active) >= self.max_active:
+                break
+            token = self.queue.popleft()
+            entry = self.entries.get(token)
+            if entry is None:
+                continue  # left while waiting
+
+            entry[2] = now
+            self.admitted_through = entry[0]
+            deadline = now + self.admission_window
+            self.active[token] = deadline
+            self.deadlines.append((deadline, token))
+            self.waiting -= 1
+            self.allowance -= 1
+            self.admitted += 1
+            self.wait_times.append(now - entry[1])
+            self.unannounced.append(token)
+
+    def is_admitted(self, token: str, now: Optional[float] = None) -> bool:
+        """Check that a token has been admitted and its window has not run out"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            deadline = self.active.get(token)
+            return deadline is not None and now < deadline
+
+    def complete(self, token: str, service_seconds: Optional[float] = None) -> bool:
+        """End an admitted buyer's session, freeing its slot, and record how long it was served"""
+        with self.lock:
+            if self.active.pop(token, None) is None:
+                return False
+            del self.entries[token]
+            self.completed += 1
+            if service_seconds is not None:
+                self.service_times.append(service_seconds)
+            return True
+
+    def record_service_time(self, service_seconds: float) -> None:
+        """Record how long one admitted request took"""
+        with self.lock:
+            self.service_times.append(service_seconds)
+
+    def leave(self, token: str) -> bool:
+        """Give up a place in the queue, or an admitted session"""
+        with self.lock:
+            entry = self.entries.pop(token, None)
+            if entry is None:
+                return False
+            if entry[2] is None:
+                self.waiting -= 1
+            else:
+                del self.active[token]
+            self.left += 1
+            return True
+
+    def close(self) -> int:
+        """Stop taking buyers, e.g. once the match sells out; returns how many were still queued"""
+        with self.lock:
+            self.closed = True
+            turned_away = self.waiting
+            for token in self.queue:
+                self.entries.pop(token, None)
+            self.queue.clear()
+            self.waiting = 0
+            self.shed += turned_away
+            return turned_away
+
+    @staticmethod
+    def get_percentiles(samples: List[float]) -> Dict[str, float]:
+        """Get the nearest-rank p50, p95 and p99 of some samples"""
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        samples = sorted(samples)
+        last = len(samples) - 1
+        return {name: samples[min(last, int(fraction * len(samples)))]
+                for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of queue metrics"""
+        with self.lock:
+            wait_times = list(self.wait_times)
+            service_times = list(self.service_times)
+            metrics = {
+                "queue_depth": self.waiting,
+                "max_queue_depth_seen": self.max_depth_seen,
+                "active_buyers": len(self.active),
+                "closed": self.closed,
+                "joined": self.joined,
+                "shed": self.shed,
+                "admitted": self.admitted,
+                "completed": self.completed,
+                "expired": self.expired,
+                "left": self.left
+            }
+        metrics["wait_seconds"] = {name: round(value, 3)
+                                   for name, value in self.get_percentiles(wait_times).items()}
+        metrics["service_ms"] = {name: round(value * 1000, 3)
+                                 for name, value in self.get_percentiles(service_times).items()}
+        return metrics
@@ -0,0 +1,204 @@
+import threading
+import datetime
+import uuid
+import time
+from enum import Enum
+import json
+import os
+import pickle
+import struct
+import zlib
+from typing import List, Dict, Any, Optional, BinaryIO, Iterator, Tuple
+
+
+class WriteAheadLog:
+    # Every record is a header followed by a pickled (operation, arguments) payload
+    HEADER = struct.Struct("<IIQ")  # payload length, CRC32 of the payload, LSN
+    SEGMENT_PREFIX = "wal-"
+    SEGMENT_SUFFIX = ".log"
+
+    def __init__(self, directory: str, sync: bool = True):
+        self.directory = directory
+        self.sync = sync  # fsync on commit; without it a commit only reaches the OS
+
+        self.file: Optional[BinaryIO] = None
+        self.segment_path: Optional[str] = None
+        self.last_lsn = 0  # last LSN handed out
+        self.durable_lsn = 0  # every record up to here is on disk
+
+        # Records appended but not yet written. The first committer writes the
+        # whole buffer and everyone whose record it covered returns with it
+        self.buffer: List[bytes] = []
+        self.flushing = False
+        self.condition = threading.Condition()
+
+        # A failed write may leave part of a flush on disk, so the log cannot
+        # simply retry it: once a flush fails, every later append and commit fails
+        self.failure: Optional[BaseException] = None
+
+        # Metrics
+        self.records_written = 0
+        self.bytes_written = 0
+        self.flushes = 0
+
+    def get_segment_path(self, first_lsn: int) -> str:
+        """Get the path of the segment whose first record is first_lsn"""
+        return os.path.join(self.directory, f"{self.SEGMENT_PREFIX}{first_lsn:020d}{self.SEGMENT_SUFFIX}")
+
+    def get_segments(self) -> List[Tuple[int, str]]:
+        """Get (first LSN, path) for every segment on disk, oldest first"""
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.SEGMENT_SUFFIX):
+                first_lsn = int(name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)])
+                segments.append((first_lsn, os.path.join(self.directory, name)))
+        return sorted(segments)
+
+    def replay(self, after_lsn: int = 0) -> Iterator[Tuple[int, str, tuple]]:
+        """Yield (lsn, operation, arguments) for every intact record after after_lsn.
+
+        Segments wholly before after_lsn are skipped without being read. A torn
+        or corrupt record ends the log: it and anything after it is cut off.
+        """
+        self.last_lsn = max(self.last_lsn, after_lsn)
+        segments = self.get_segments()
+        header_size = self.HEADER.size
+        for index, (first_lsn, path) in enumerate(segments):
+            if index + 1 < len(segments) and segments[index + 1][0] <= after_lsn + 1:
+                continue
+
+            valid_length = 0
+            with open(path, 'rb') as file:
+                data = file.read()
+            while valid_length + header_size <= len(data):
+                length, checksum, lsn = self.HEADER.unpack_from(data, valid_length)
+                start = valid_length + header_size
+                payload = data[start:start + length]
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                valid_length = start + length
+                self.last_lsn = max(self.last_lsn, lsn)
+                if lsn > after_lsn:
+                    operation, arguments = pickle.loads(payload)
+                    yield lsn, operation, arguments
+
+            if valid_length < len(data):
+                with open(path, 'r+b') as file:
+                    file.truncate(valid_length)
+                for _, later_path in segments[index + 1:]:
+                    os.remove(later_path)
+                break
+
+        self.durable_lsn = self.last_lsn
+
+    def open(self) -> None:
+        """Start a new segment for records after the last one replayed"""
+        with self.condition:
+            self.open_segment()
+
+    def open_segment(self) -> None:
+        """Close the current segment, if any, and start the next; caller holds the condition"""
+        if self.file:
+            self.file.close()
+        self.segment_path = self.get_segment_path(self.last_lsn + 1)
+        self.file = open(self.segment_path, 'ab')
+
+    def append(self, operation: str, arguments: tuple) -> int:
+        """Buffer a record and return its LSN; it is durable once commit(lsn) returns"""
+        payload = pickle.dumps((operation, arguments), protocol=pickle.HIGHEST_PROTOCOL)
+        with self.condition:
+            self.check_failure()
+            self.last_lsn += 1
+            lsn = self.last_lsn
+            self.buffer.append(self.HEADER.pack(len(payload), zlib.crc32(payload), lsn) + payload)
+        return lsn
+
+    def commit(self, lsn: int) -> None:
+        """Wait until the record at lsn, and everything before it, is on disk"""
+        with self.condition:
+            while self.durable_lsn < lsn:
+                self.check_failure()
+                if self.flushing:
+                    self.condition.wait()
+                    continue
+                self.flush_buffer()
+
+    def flush_buffer(self) -> None:
+        """Write out the buffered records; caller holds the condition, which is released during I/O"""
+        self.flushing = True
+        buffer, self.buffer = self.buffer, []
+        target_lsn = self.last_lsn
+        file = self.file
+        data = b"".join(buffer)
+
+        self.condition.release()
+        try:
+            file.write(data)
+            file.flush()
+            if self.sync:
+                os.fsync(file.fileno())
+        except BaseException as error:
+            self.condition.acquire()
+            self.failure = error
+            self.flushing = False
+            self.condition.notify_all()
+            self.check_failure()
+        else:
+            self.condition.acquire()
+            self.flushing = False
+            self.condition.notify_all()
+
+        self.durable_lsn = max(self.durable_lsn, target_lsn)
+        self.records_written += len(buffer)
+        self.bytes_written += len(data)
+        self.flushes += 1
+
+    def check_failure(self) -> None:
+        """Raise if an earlier flush failed; caller holds the condition"""
+        if self.failure is not None:
+            raise OSError("Write-ahead log write failed; the log no longer accepts records") from self.failure
+
+    def rotate(self) -> int:
+        """Flush the current segment and start a new one; returns the last LSN of the old segment"""
+        with self.condition:
+            self.check_failure()
+            while self.flushing:
+                self.condition.wait()
+            if self.buffer:
+                self.flush_buffer()
+            last_lsn = self.last_lsn
+            self.open_segment()
+            return last_lsn
+
+    def remove_segments_through(self, lsn: int) -> int:
+        """Delete segments that hold only records up to lsn; returns how many were deleted"""
+        segments = self.get_segments()
+        removed = 0
+        for index, (first_lsn, path) in enumerate(segments[:-1]):
+            if segments[index + 1][0] <= lsn + 1:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def close(self) -> None:
+        """Write out anything buffered and close the log"""
+        try:
+            self.commit(self.last_lsn)
+        finally:
+            with self.condition:
+                if self.file:
+                    self.file.close()
+                    self.file = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a dictionary of log metrics"""
+        with self.condition:
+            return {
+                "last_lsn": self.last_lsn,
+                "durable_lsn": self.durable_lsn,
+                "failed": self.failure is not None,
+                "records_written": self.records_written,
+                "bytes_written": self.bytes_written,
+                "flushes": self.flushes,
+                "records_per_flush": round(self.records_written / self.flushes, 1) if self.flushes else 0
+            }